@@ -44,7 +44,21 @@ if TYPE_CHECKING:
 
     t: type[FlextQualityTypes]
     from .hooks import FlextQualityBaseHook as FlextQualityBaseHook
+    from .hooks import FlextQualityHookCircuitBreaker as FlextQualityHookCircuitBreaker
+    from .hooks import FlextQualityHookConfig as FlextQualityHookConfig
+    from .hooks import FlextQualityHookDebouncer as FlextQualityHookDebouncer
+    from .hooks import FlextQualityHookDispatchIndex as FlextQualityHookDispatchIndex
     from .hooks import FlextQualityHookManager as FlextQualityHookManager
+    from .hooks import FlextQualityHookPayload as FlextQualityHookPayload
+    from .hooks import FlextQualityHookRecorder as FlextQualityHookRecorder
+    from .hooks import FlextQualityHookReplay as FlextQualityHookReplay
+    from .hooks import FlextQualityHookResultCache as FlextQualityHookResultCache
+    from .hooks import FlextQualityHookServer as FlextQualityHookServer
+    from .hooks import FlextQualityHookSnapshot as FlextQualityHookSnapshot
+    from .hooks import FlextQualityLatencyHistogram as FlextQualityLatencyHistogram
+    from .integrations import (
+        FlextQualityAvailabilityCache as FlextQualityAvailabilityCache,
+    )
     from .integrations import (
         FlextQualityClaudeContextClient as FlextQualityClaudeContextClient,
     )
@@ -53,12 +67,18 @@ if TYPE_CHECKING:
         FlextQualityCodeExecutionBridge as FlextQualityCodeExecutionBridge,
     )
     from .integrations import FlextQualityMcpClient as FlextQualityMcpClient
+    from .integrations import FlextQualityMcpSessionPool as FlextQualityMcpSessionPool
+    from .mcp import FlextQualityMcpResourceCache as FlextQualityMcpResourceCache
     from .mcp import FlextQualityMcpResources as FlextQualityMcpResources
     from .mcp import FlextQualityMcpServer as FlextQualityMcpServer
     from .mcp import FlextQualityMcpTools as FlextQualityMcpTools
+    from .rules import FlextQualityBaseline as FlextQualityBaseline
+    from .rules import FlextQualityResultWriters as FlextQualityResultWriters
     from .rules import FlextQualityRulesEngine as FlextQualityRulesEngine
     from .rules import FlextQualityRulesLoader as FlextQualityRulesLoader
+    from .rules import FlextQualityRunCheckpoint as FlextQualityRunCheckpoint
     from .rules import FlextQualityValidators as FlextQualityValidators
+    from .rules import FlextQualityViolationPages as FlextQualityViolationPages
     from .utilities import FlextQualityUtilities as FlextQualityUtilities
 
     u: type[FlextQualityUtilities]
@@ -75,19 +95,40 @@ _LAZY_MODULES: dict[str, tuple[str, ...]] = {
     ".protocols": ("FlextQualityProtocols", "p"),
     ".typings": ("FlextQualityTypes", "t"),
     ".utilities": ("FlextQualityUtilities", "u"),
-    ".hooks": ("FlextQualityBaseHook", "FlextQualityHookManager"),
+    ".hooks": (
+        "FlextQualityBaseHook",
+        "FlextQualityHookCircuitBreaker",
+        "FlextQualityHookConfig",
+        "FlextQualityHookDebouncer",
+        "FlextQualityHookDispatchIndex",
+        "FlextQualityHookManager",
+        "FlextQualityHookPayload",
+        "FlextQualityHookRecorder",
+        "FlextQualityHookReplay",
+        "FlextQualityHookResultCache",
+        "FlextQualityHookServer",
+        "FlextQualityHookSnapshot",
+        "FlextQualityLatencyHistogram",
+    ),
     ".integrations": (
+        "FlextQualityAvailabilityCache",
         "FlextQualityClaudeContextClient",
         "FlextQualityClaudeMemClient",
         "FlextQualityCodeExecutionBridge",
         "FlextQualityMcpClient",
+        "FlextQualityMcpSessionPool",
     ),
     ".rules": (
+        "FlextQualityBaseline",
+        "FlextQualityResultWriters",
         "FlextQualityRulesEngine",
         "FlextQualityRulesLoader",
+        "FlextQualityRunCheckpoint",
         "FlextQualityValidators",
+        "FlextQualityViolationPages",
     ),
     ".mcp": (
+        "FlextQualityMcpResourceCache",
         "FlextQualityMcpResources",
         "FlextQualityMcpServer",
         "FlextQualityMcpTools",
@@ -105,27 +146,45 @@ _LAZY_IMPORTS = build_lazy_import_map(
 
 _PUBLIC_EXPORTS: tuple[str, ...] = (
     "FlextQuality",
+    "FlextQualityAvailabilityCache",
     "FlextQualityBaseHook",
+    "FlextQualityBaseline",
     "FlextQualityCli",
     "FlextQualityClaudeContextClient",
     "FlextQualityClaudeMemClient",
     "FlextQualityCodeExecutionBridge",
     "FlextQualityConfig",
     "FlextQualityConstants",
+    "FlextQualityHookCircuitBreaker",
+    "FlextQualityHookConfig",
+    "FlextQualityHookDebouncer",
+    "FlextQualityHookDispatchIndex",
     "FlextQualityHookManager",
+    "FlextQualityHookPayload",
+    "FlextQualityHookRecorder",
+    "FlextQualityHookReplay",
+    "FlextQualityHookResultCache",
+    "FlextQualityHookServer",
+    "FlextQualityHookSnapshot",
+    "FlextQualityLatencyHistogram",
     "FlextQualityMcpClient",
+    "FlextQualityMcpResourceCache",
     "FlextQualityMcpResources",
     "FlextQualityMcpServer",
+    "FlextQualityMcpSessionPool",
     "FlextQualityMcpTools",
     "FlextQualityModels",
     "FlextQualityProtocols",
+    "FlextQualityResultWriters",
     "FlextQualityRulesEngine",
     "FlextQualityRulesLoader",
+    "FlextQualityRunCheckpoint",
     "FlextQualityServiceBase",
     "FlextQualitySettings",
     "FlextQualityTypes",
     "FlextQualityUtilities",
     "FlextQualityValidators",
+    "FlextQualityViolationPages",
     "__author__",
     "__author_email__",
     "__description__",
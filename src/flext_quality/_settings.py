@@ -1,8 +1,9 @@
 """Settings for flext-quality — namespaced under ``settings.Quality``.
 
-Layer-0: imports only stdlib + pydantic + ``FlextSettings``. Universal runtime
-fields come from ``FlextSettings`` by MRO. All project fields live in the
-``Quality`` namespace group with simple scalar types (env-settable).
+Layer-0: imports only stdlib + pydantic + ``FlextSettings`` and the project
+constants. Universal runtime fields come from ``FlextSettings`` by MRO. All
+project fields live in the ``Quality`` namespace group with simple scalar or
+``StrEnum`` types (env-settable).
 
 Copyright (c) 2025 FLEXT Team. All rights reserved.
 SPDX-License-Identifier: MIT
@@ -15,6 +16,7 @@ from typing import TYPE_CHECKING, Annotated
 from pydantic_settings import SettingsConfigDict
 
 from flext_core import FlextSettings, m, u
+from flext_quality import FlextQualityConstants as c
 
 
 class FlextQualitySettings(FlextSettings):
@@ -28,10 +30,54 @@ class FlextQualitySettings(FlextSettings):
         """Namespaced quality settings (hooks, rules, MCP, thresholds)."""
 
         hook_timeout_ms: Annotated[int, m.Field(default=5000, ge=100, le=60000)]
+        event_timeout_ms: Annotated[int, m.Field(default=10000, ge=100, le=120000)]
+        hook_breaker_threshold: Annotated[int, m.Field(default=3, ge=1)]
+        hook_breaker_window_seconds: Annotated[float, m.Field(default=60.0, gt=0)]
+        hook_breaker_cooldown_seconds: Annotated[float, m.Field(default=30.0, gt=0)]
+        hook_breaker_state_path: Annotated[str, m.Field(default="")]
+        hook_max_payload_bytes: Annotated[int, m.Field(default=16_777_216, ge=1024)]
+        hook_socket_path: Annotated[str, m.Field(default=".flext-quality/hooks.sock")]
+        hook_read_timeout_ms: Annotated[int, m.Field(default=5000, ge=100, le=60000)]
+        hook_server_mode: Annotated[
+            c.Quality.HookServerMode, m.Field(default=c.Quality.HookServerMode.THREADED)
+        ]
+        hook_record_path: Annotated[str, m.Field(default="")]
+        hook_config_path: Annotated[str, m.Field(default="")]
+        hook_debounce_ms: Annotated[
+            int,
+            m.Field(
+                default=0,
+                ge=0,
+                le=10000,
+                description=(
+                    "Per-file PostToolUse coalescing window. Only the resident"
+                    " hook server coalesces bursts; a one-shot stdin run has"
+                    " nothing to coalesce and just waits out the window."
+                ),
+            ),
+        ]
         rule_timeout_seconds: Annotated[int, m.Field(default=30, ge=1, le=3600)]
         cache_enabled: Annotated[bool, m.Field(default=True)]
+        hook_cache_size: Annotated[int, m.Field(default=1024, ge=1)]
+        hook_cache_ttl_seconds: Annotated[float, m.Field(default=30.0, gt=0)]
         mcp_server_port: Annotated[int, m.Field(default=3100, ge=1, le=65535)]
+        mcp_resource_poll_seconds: Annotated[float, m.Field(default=1.0, gt=0)]
+        mcp_status_ttl_seconds: Annotated[float, m.Field(default=30.0, ge=0)]
+        integration_probe_ttl_seconds: Annotated[float, m.Field(default=60.0, ge=0)]
+        integration_reprobe_seconds: Annotated[float, m.Field(default=30.0, ge=0)]
+        claude_mem_mcp_transport: Annotated[str, m.Field(default="")]
+        claude_context_mcp_transport: Annotated[str, m.Field(default="")]
         rules_dir: Annotated[str, m.Field(default="rules")]
+        baseline_path: Annotated[str, m.Field(default=".flext-quality-baseline")]
+        max_file_size_bytes: Annotated[int, m.Field(default=1_048_576, ge=1)]
+        max_line_bytes: Annotated[int, m.Field(default=4096, ge=1, le=8192)]
+        read_ahead_depth: Annotated[int, m.Field(default=0, ge=0, le=64)]
+        scan_workers: Annotated[int, m.Field(default=0, ge=0, le=64)]
+        scan_execution_mode: Annotated[
+            c.Quality.ExecutionMode, m.Field(default=c.Quality.ExecutionMode.AUTO)
+        ]
+        runs_dir: Annotated[str, m.Field(default=".flext-quality/runs")]
+        checkpoint_interval: Annotated[int, m.Field(default=100, ge=1)]
         max_function_length: Annotated[int, m.Field(default=50)]
         max_class_length: Annotated[int, m.Field(default=200)]
 
@@ -2,13 +2,19 @@
 
 from __future__ import annotations
 
-from collections.abc import Sequence
+import threading
+from collections.abc import Callable, MutableSequence, Sequence
 from pathlib import Path
 from typing import override
 
 from flext_quality import (
+    FlextQualityBaseline,
     FlextQualityHookManager,
+    FlextQualityHookPayload,
+    FlextQualityHookRecorder,
+    FlextQualityRulesEngine,
     FlextQualityRulesLoader,
+    FlextQualityViolationPages,
     c,
     m,
     p,
@@ -29,12 +35,35 @@ class FlextQuality(FlextQualityServiceBase[t.JsonMapping]):
     _rules_loader: FlextQualityRulesLoader = u.PrivateAttr(
         default_factory=FlextQualityRulesLoader
     )
+    _rules_engine: FlextQualityRulesEngine = u.PrivateAttr(
+        default_factory=FlextQualityRulesEngine
+    )
+    _rules_lock: threading.Lock = u.PrivateAttr(default_factory=threading.Lock)
+    _baseline_mtime_ns: int | None = u.PrivateAttr(default=None)
+    _violation_pages: FlextQualityViolationPages = u.PrivateAttr(
+        default_factory=FlextQualityViolationPages
+    )
 
     @override
     def execute(self) -> p.Result[t.JsonMapping]:
         """Execute the default quality runtime operation."""
         return self.fetch_status()
 
+    async def aexecute_hook(
+        self, event: str, input_data: t.JsonMapping
+    ) -> p.Result[t.JsonMapping]:
+        """Execute hooks for an event without blocking the running event loop.
+
+        Args:
+            event: Hook event name (e.g., "PreToolUse")
+            input_data: Hook input data
+
+        Returns:
+            r[t.JsonMapping]: Hook execution result or error
+
+        """
+        return await self._hooks.aexecute(event, input_data)
+
     def execute_hook(
         self, event: str, input_data: t.JsonMapping
     ) -> p.Result[t.JsonMapping]:
@@ -70,6 +99,10 @@ class FlextQuality(FlextQualityServiceBase[t.JsonMapping]):
         """Return hooks configuration as JSON string."""
         return r[str].ok(self._hooks.fetch_config_json())
 
+    def fetch_hook_generation(self) -> int:
+        """Return the generation of the active hook dispatch snapshot."""
+        return self._hooks.fetch_generation()
+
     def fetch_status(self) -> p.Result[t.JsonMapping]:
         """Return quality service status snapshot."""
         settings = FlextQualitySettings.fetch_global()
@@ -78,13 +111,50 @@ class FlextQuality(FlextQualityServiceBase[t.JsonMapping]):
             "version": c.Quality.MCP_SERVER_VERSION,
             "settings": {
                 "hook_timeout_ms": settings.Quality.hook_timeout_ms,
+                "event_timeout_ms": settings.Quality.event_timeout_ms,
                 "rule_timeout_seconds": settings.Quality.rule_timeout_seconds,
                 "cache_enabled": settings.Quality.cache_enabled,
                 "mcp_server_port": settings.Quality.mcp_server_port,
             },
             "hooks_registered": len(self._hooks.fetch_config()),
+            **self.fetch_hook_metrics().value,
+        })
+
+    def fetch_hook_metrics(self) -> p.Result[t.JsonMapping]:
+        """Return hook cache, outcome, latency and open circuit figures.
+
+        Latencies are reported in microseconds as p50/p95/p99 per hook class
+        name and per event.
+        """
+        return r[t.JsonMapping].ok({
+            "hook_cache": dict(self._hooks.fetch_cache_stats()),
+            "hook_stats": {
+                name: dict(counters)
+                for name, counters in self._hooks.fetch_hook_stats().items()
+            },
+            "hook_latency": u.normalize_to_json_value(self._hooks.fetch_latency()),
+            "hook_open_circuits": dict(self._hooks.fetch_open_circuits()),
         })
 
+    def fetch_rules(self) -> p.Result[Sequence[m.Quality.RuleDefinition]]:
+        """Return the rules of the shared engine, reloading them if edited.
+
+        Returns:
+            r[Sequence[m.Quality.RuleDefinition]]: Loaded rule definitions or error
+
+        """
+        with self._rules_lock:
+            loaded = self._rules_engine.ensure_loaded()
+            if loaded.failure:
+                return r[Sequence[m.Quality.RuleDefinition]].fail(loaded.error)
+            return r[Sequence[m.Quality.RuleDefinition]].ok(
+                self._rules_engine.get_rules()
+            )
+
+    def fetch_rules_path(self) -> Path:
+        """Return the rules file behind ``fetch_rules`` and ``validate_rules``."""
+        return self._rules_engine.rules_path
+
     def load_rules(self, path: Path) -> p.Result[Sequence[m.Quality.RuleDefinition]]:
         """Load rules from a YAML file.
 
@@ -122,17 +192,108 @@ class FlextQuality(FlextQualityServiceBase[t.JsonMapping]):
             r[t.JsonMapping]: Hook execution result or error
 
         """
-        stdin_result = u.Quality.read_stdin()
+        settings = FlextQualitySettings.fetch_global()
+        stdin_result = u.Quality.read_stdin_bytes(
+            settings.Quality.hook_max_payload_bytes
+        )
         if stdin_result.failure:
             return r[t.JsonMapping].fail(stdin_result.error or "Failed to read stdin")
-        parse_result = u.Quality.parse_hook_input(stdin_result.value)
+        return self.process_hook_payload(stdin_result.value)
+
+    def process_hook_payload(
+        self, raw: bytes | str, *, record: bool = True
+    ) -> p.Result[t.JsonMapping]:
+        """Process a raw JSON hook payload, as read from stdin or a socket.
+
+        Only the top-level keys and scalar values are decoded up front;
+        ``tool_input`` and other large fields are decoded when a matching hook
+        first reads them, and a malformed one fails the event. When
+        ``hook_record_path`` is set and ``record`` is true, the payload is
+        also appended, anonymised, to that corpus for later replay.
+
+        Returns:
+            r[t.JsonMapping]: Hook execution result or error
+
+        """
+        settings = FlextQualitySettings.fetch_global()
+        parse_result = FlextQualityHookPayload.parse(
+            raw, max_bytes=settings.Quality.hook_max_payload_bytes
+        )
         if parse_result.failure:
             return r[t.JsonMapping].fail(parse_result.error or "Failed to parse input")
         input_data = parse_result.value
+        if record and settings.Quality.hook_record_path:
+            FlextQualityHookRecorder(Path(settings.Quality.hook_record_path)).record(
+                input_data
+            )
         event = str(input_data.get("event", ""))
         if not event:
             return r[t.JsonMapping].ok({"continue": True})
-        return self.execute_hook(event, input_data)
+        return (
+            u
+            .try_(lambda: self.execute_hook(event, input_data), catch=ValueError)
+            .map_error(lambda e: f"Invalid hook payload: {e}")
+            .flat_map(lambda result: result)
+        )
+
+    def fetch_violations_page(
+        self, cursor: str, page_size: int | None = None
+    ) -> p.Result[t.JsonMapping]:
+        """Return the next page of a result paged by ``validate_rules``.
+
+        Returns:
+            r[t.JsonMapping]: Violations of the page and the next cursor, or error
+
+        """
+        return self._violation_pages.page(
+            cursor, page_size or c.Quality.VIOLATION_PAGE_SIZE
+        ).map(self._json_page)
+
+    def validate_rules(
+        self,
+        path: str,
+        context: t.JsonMapping | None = None,
+        *,
+        page_size: int | None = None,
+        on_violation: Callable[[t.JsonMapping], None] | None = None,
+    ) -> p.Result[t.JsonMapping]:
+        """Validate code under path with the shared, warm rules engine.
+
+        The compiled rules are reused across calls and reloaded only when the
+        rules file changes, so repeated validations skip parsing entirely.
+        The shared engine is locked only while it is refreshed; the scan
+        itself, and ``on_violation``, run on a snapshot of it.
+        Violations recorded in the configured ``baseline_path`` are left out.
+        The result starts with counts per rule and severity, then holds the
+        first ``page_size`` violations, at most ``VIOLATION_PAGE_SIZE_MAX``,
+        and a ``next_cursor`` for ``fetch_violations_page``. ``on_violation``
+        is called with each violation as soon as it is found.
+
+        Returns:
+            r[t.JsonMapping]: Summary, first page and scan statistics, or error
+
+        """
+        with self._rules_lock:
+            baseline = self._refresh_baseline()
+            if baseline.failure:
+                return r[t.JsonMapping].fail(baseline.error)
+            loaded = self._rules_engine.ensure_loaded()
+            if loaded.failure:
+                return r[t.JsonMapping].fail(loaded.error)
+            engine = self._rules_engine.snapshot()
+        stream = engine.stream(path, context)
+        if stream.failure:
+            return r[t.JsonMapping].fail(stream.error)
+        violations: MutableSequence[t.JsonMapping] = []
+        for violation in stream.value:
+            violations.append(violation)
+            if on_violation is not None:
+                on_violation(violation)
+        scan = dict(engine.fetch_scan_stats())
+        page = self._violation_pages.first_page(
+            violations, page_size or c.Quality.VIOLATION_PAGE_SIZE
+        )
+        return r[t.JsonMapping].ok({**self._json_page(page), "scan": scan})
 
     def validate_configuration(self) -> p.Result[bool]:
         """Validate the current configuration.
@@ -146,6 +307,30 @@ class FlextQuality(FlextQualityServiceBase[t.JsonMapping]):
         """
         return r[bool].ok(value=True)
 
+    def _refresh_baseline(self) -> p.Result[bool]:
+        """Apply the configured baseline to the shared engine when it changes.
+
+        Returns whether the baseline was (re)loaded.
+        """
+        path = Path(FlextQualitySettings.fetch_global().Quality.baseline_path)
+        try:
+            mtime_ns: int | None = path.stat().st_mtime_ns
+        except OSError:
+            mtime_ns = None
+        if mtime_ns == self._baseline_mtime_ns:
+            return r[bool].ok(value=False)
+        loaded = FlextQualityBaseline.load_if_present(path)
+        if loaded.failure:
+            return r[bool].fail(loaded.error)
+        self._rules_engine.set_baseline(loaded.value)
+        self._baseline_mtime_ns = mtime_ns
+        return r[bool].ok(value=True)
+
+    @staticmethod
+    def _json_page(page: t.JsonMapping) -> t.JsonMapping:
+        """Normalize the violations of a page to plain JSON values."""
+        return {**page, "violations": u.normalize_to_json_value(page["violations"])}
+
 
 quality: FlextQuality = FlextQuality.fetch_global()
 """Shared FlextQuality facade instance."""
@@ -11,7 +11,23 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Annotated, ClassVar, Self, override
 
 from flext_cli import cli
-from flext_quality import FlextQualityCodeExecutionBridge, m, p, quality, r, s, t, u
+from flext_quality import (
+    FlextQualityBaseline,
+    FlextQualityCodeExecutionBridge,
+    FlextQualityHookRecorder,
+    FlextQualityHookReplay,
+    FlextQualityHookServer,
+    FlextQualityResultWriters,
+    FlextQualityRulesEngine,
+    c,
+    m,
+    p,
+    quality,
+    r,
+    s,
+    t,
+    u,
+)
 
 if TYPE_CHECKING:
     from collections.abc import MutableSequence, Sequence
@@ -76,7 +92,147 @@ class FlextQualityCli(s):
             cmds.append(["python", "-m", "coverage", "report"])
             return r[t.SequenceOf[t.StrSequence]].ok(cmds)
 
-    COMMANDS: ClassVar[Sequence[type[m.BaseModel]]] = (Status, Check, Validate)
+    class Baseline(s):
+        """Record current rule violations under --target-path as the baseline."""
+
+        target_path: Annotated[
+            Path, u.Field(default_factory=Path.cwd, description="Target path")
+        ]
+        baseline_path: Annotated[
+            Path,
+            u.Field(
+                default=Path(c.Quality.PATHS_BASELINE_FILE),
+                description="Baseline file to write",
+            ),
+        ]
+        rules_path: Annotated[
+            Path | None, u.Field(default=None, description="Rules YAML file")
+        ]
+
+        @override
+        def execute(self) -> p.Result[int]:
+            """Write the baseline and return the number of fingerprints."""
+            engine = FlextQualityRulesEngine(self.rules_path)
+            return engine.record_baseline(str(self.target_path), self.baseline_path)
+
+    class Report(s):
+        """Stream rule violations under --target-path as NDJSON or SARIF."""
+
+        target_path: Annotated[
+            Path, u.Field(default_factory=Path.cwd, description="Target path")
+        ]
+        output_path: Annotated[Path, u.Field(description="Report file to write")]
+        output_format: Annotated[
+            c.Quality.OutputFormat,
+            u.Field(default=c.Quality.OutputFormat.SARIF, description="Format"),
+        ]
+        rules_path: Annotated[
+            Path | None, u.Field(default=None, description="Rules YAML file")
+        ]
+        baseline_path: Annotated[
+            Path | None,
+            u.Field(
+                default=Path(c.Quality.PATHS_BASELINE_FILE),
+                description="Baseline of violations to leave out, if it exists",
+            ),
+        ]
+
+        @override
+        def execute(self) -> p.Result[int]:
+            """Write the report and return the number of violations."""
+            engine = FlextQualityRulesEngine(self.rules_path)
+            if self.baseline_path is not None:
+                baseline = FlextQualityBaseline.load_if_present(self.baseline_path)
+                if baseline.failure:
+                    return r[int].fail(baseline.error)
+                engine.set_baseline(baseline.value)
+            stream = engine.stream(str(self.target_path))
+            if stream.failure:
+                return r[int].fail(stream.error)
+            try:
+                with self.output_path.open("wb") as handle:
+                    writer = (
+                        FlextQualityResultWriters.Sarif(handle, engine.scan_root)
+                        if self.output_format == c.Quality.OutputFormat.SARIF
+                        else FlextQualityResultWriters.Ndjson(handle)
+                    )
+                    return writer.write(stream.value)
+            except OSError as exc:
+                return r[int].fail(f"Cannot write report {self.output_path}: {exc}")
+
+    class Serve(s):
+        """Run the resident hook server on a Unix socket until interrupted.
+
+        Rules are loaded before serving, so fork mode children inherit them.
+        """
+
+        socket_path: Annotated[
+            Path | None,
+            u.Field(default=None, description="Socket path (default from settings)"),
+        ]
+        mode: Annotated[
+            c.Quality.HookServerMode | None,
+            u.Field(default=None, description="threaded or fork (default settings)"),
+        ]
+
+        @override
+        def execute(self) -> p.Result[bool]:
+            """Serve hook events with hooks and rules kept warm."""
+            server = FlextQualityHookServer(
+                quality.process_hook_payload,
+                self.socket_path,
+                mode=self.mode,
+                prewarm=quality.fetch_rules,
+            )
+            try:
+                return server.serve_forever()
+            except KeyboardInterrupt:
+                return r[bool].ok(value=True)
+
+    class Replay(s):
+        """Replay a recorded hook corpus and report throughput and latency."""
+
+        corpus_path: Annotated[Path, u.Field(description="Recorded NDJSON corpus")]
+        rounds: Annotated[
+            int, u.Field(default=1, ge=1, description="Warm and server passes")
+        ]
+        cold_samples: Annotated[
+            int, u.Field(default=5, ge=0, description="Events run in new processes")
+        ]
+        socket_path: Annotated[
+            Path | None,
+            u.Field(default=None, description="Hook server socket, if one runs"),
+        ]
+
+        @override
+        def execute(self) -> p.Result[t.JsonMapping]:
+            """Replay in cold, warm and, when a socket is given, server mode."""
+            corpus = FlextQualityHookRecorder.load(self.corpus_path)
+            if corpus.failure:
+                return r[t.JsonMapping].fail(corpus.error)
+            replay = FlextQualityHookReplay(corpus.value)
+            modes = {
+                "cold": replay.cold(self.cold_samples),
+                "warm": replay.warm(self.rounds),
+            }
+            if self.socket_path is not None:
+                modes["server"] = replay.server(self.socket_path, self.rounds)
+            report: t.MutableJsonMapping = {"events": len(corpus.value)}
+            for mode, result in modes.items():
+                if result.failure:
+                    return r[t.JsonMapping].fail(f"{mode} replay: {result.error}")
+                report[mode] = dict(result.value)
+            return r[t.JsonMapping].ok(report)
+
+    COMMANDS: ClassVar[Sequence[type[m.BaseModel]]] = (
+        Status,
+        Check,
+        Validate,
+        Baseline,
+        Report,
+        Serve,
+        Replay,
+    )
 
     @override
     def execute(self) -> p.Result[bool]:
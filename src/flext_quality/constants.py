@@ -45,6 +45,7 @@ class FlextQualityConstants(c, web_c):
             """Claude Code hook events."""
 
             PRE_TOOL_USE = "PreToolUse"
+            POST_TOOL_USE = "PostToolUse"
             STOP = "Stop"
 
         @unique
@@ -101,6 +102,48 @@ class FlextQualityConstants(c, web_c):
             STRING = "str"
             INTEGER = "int"
 
+        @unique
+        class FileType(StrEnum):
+            """File types a rule can be routed to."""
+
+            PY = "py"
+            PYI = "pyi"
+            MD = "md"
+            YAML = "yaml"
+            TOML = "toml"
+            SH = "sh"
+
+        @unique
+        class FileSkipReason(StrEnum):
+            """Reasons the rules engine skips a file before scanning it."""
+
+            BINARY = "skipped_binary"
+            OVERSIZED = "skipped_oversized"
+            MINIFIED = "skipped_minified"
+            UNDECODABLE = "skipped_undecodable"
+
+        @unique
+        class OutputFormat(StrEnum):
+            """Streaming output formats for rule violations."""
+
+            NDJSON = "ndjson"
+            SARIF = "sarif"
+
+        @unique
+        class ExecutionMode(StrEnum):
+            """How the rules engine parallelises file scanning."""
+
+            AUTO = "auto"
+            THREADS = "threads"
+            PROCESSES = "processes"
+
+        @unique
+        class HookServerMode(StrEnum):
+            """How the resident hook server isolates hook events."""
+
+            THREADED = "threaded"
+            FORK = "fork"
+
         # ===== Quality Thresholds =====
         THRESHOLD_MAX_BROKEN_LINKS_TO_SHOW: Final[int] = 10
         "Maximum broken links to show."
@@ -108,6 +151,81 @@ class FlextQualityConstants(c, web_c):
         "Minimum headings for table of contents."
 
         HOOK_TIMEOUT_MS: Final[int] = 5000
+        HOOK_DISPATCH_CACHE_SIZE: Final[int] = 256
+        "Tool names whose resolved hook list the dispatch index keeps."
+        HOOK_WILDCARD_CHARS: Final[str] = "*?["
+        "Characters that make a hook matcher a wildcard pattern."
+        HOOK_ABANDONED_RUNS_MAX: Final[int] = 8
+        "Timed-out hook runs left running before new runs are skipped instead."
+        HOOK_THREAD_PREFIX: Final[str] = "flext-quality-hook"
+        "Thread name prefix of daemon threads running synchronous hooks."
+        HOOK_SERVER_POLL_INTERVAL_SECONDS: Final[float] = 0.5
+        "How often the hook server loop checks for a shutdown request."
+        HOOK_SOCKET_MODE: Final[int] = 0o600
+        "Permissions of the hook server socket, restricting it to its owner."
+        HOOK_BREAKER_LOCK_SUFFIX: Final[str] = ".lock"
+        "Suffix of the file locked while the shared breaker state is updated."
+        HOOK_BREAKER_LOCK_MODE: Final[int] = 0o600
+        "Permissions of the breaker lock file when it is created."
+        HOOK_CACHE_DIGEST_SIZE: Final[int] = 16
+        "Digest size in bytes of pure hook result cache keys."
+        JSON_BACKSLASH: Final[int] = 0x5C
+        "Byte value of the JSON string escape character."
+        PAYLOAD_ESCAPED_QUOTE_SCANS: Final[int] = 64
+        "Escaped quotes skipped one by one before a payload string is regex-scanned."
+        LATENCY_SUB_BUCKET_BITS: Final[int] = 7
+        "Sub-buckets per power of two in latency histograms (below 1% error)."
+        LATENCY_PERCENTILES: Final[tuple[int, ...]] = (50, 95, 99)
+        "Percentiles reported for hook and event latency histograms."
+        US_PER_SECOND: Final[int] = 1_000_000
+        "Microseconds per second, the resolution of latency histograms."
+        HOOK_DEBOUNCED_EVENTS: Final[frozenset[str]] = frozenset({
+            HookEvent.POST_TOOL_USE
+        })
+        "Events coalesced per file when debouncing is on; they never gate a tool."
+        HOOK_DEBOUNCE_PATH_FIELDS: Final[tuple[str, ...]] = (
+            "file_path",
+            "notebook_path",
+        )
+        "``tool_input`` fields naming the file a debounced event is keyed on."
+        HOOK_CONFIG_TOML_SUFFIX: Final[str] = ".toml"
+        "Suffix of hook configuration files parsed as TOML instead of YAML."
+        HOOK_CONFIG_CLASS_SEPARATOR: Final[str] = ":"
+        "Separator between module and class name in a hook definition."
+        HOOK_RECORD_HASHED_FIELDS: Final[frozenset[str]] = frozenset({
+            "session_id",
+            "transcript_path",
+            "cwd",
+            "file_path",
+            "notebook_path",
+            "path",
+        })
+        "Payload fields replaced by a digest when recorded; file suffixes are kept."
+        HOOK_RECORD_KEPT_FIELDS: Final[frozenset[str]] = frozenset({
+            "event",
+            "hook_event_name",
+            "matcher",
+            "permission_mode",
+            "source",
+            "tool_name",
+            "trigger",
+            "type",
+        })
+        "Structural payload fields recorded verbatim; other text is masked."
+        HOOK_RECORD_PATH_ENV_VAR: Final[str] = "FLEXT_QUALITY_QUALITY__HOOK_RECORD_PATH"
+        "Environment variable overriding ``hook_record_path``."
+        HOOK_RECORD_MASK_CHAR: Final[str] = "x"
+        "Character replacing masked payload text."
+        HOOK_RECORD_DIGEST_SIZE: Final[int] = 8
+        "Digest size in bytes of anonymised payload identifiers."
+        HOOK_REPLAY_COLD_SCRIPT: Final[str] = (
+            "import sys\n"
+            "from flext_quality.hook_client import process_locally\n"
+            "sys.stdout.buffer.write(process_locally(sys.stdin.buffer.read()))\n"
+        )
+        "Program run by each cold-process replay: the hook client's local path."
+        HOOK_ERROR_MESSAGE_PREFIX: Final[str] = "Hook error: "
+        "Prefix of the system message a hook server answers a failed event with."
         MCP_TIMEOUT_MS: Final[int] = 30000
         INTEGRATION_TIMEOUT_MS: Final[int] = 10000
         RULE_TIMEOUT_SECONDS: Final[int] = c.DEFAULT_TIMEOUT_SECONDS
@@ -125,14 +243,106 @@ class FlextQualityConstants(c, web_c):
         "MCP server version."
         MCP_DEFAULT_PORT: Final[int] = 3100
         "MCP default port."
+        MCP_WATCHER_THREAD_NAME: Final[str] = "flext-quality-mcp-watcher"
+        "Name of the thread polling files behind cached MCP resources."
+        VIOLATION_PAGE_SIZE: Final[int] = 200
+        "Violations returned per page by the validate_rules MCP tool."
+        VIOLATION_PAGE_SIZE_MAX: Final[int] = 1000
+        "Largest page size a caller may ask for; larger requests are clamped."
+        VIOLATION_PAGES_MAX_HANDLES: Final[int] = 16
+        "Validation results kept server-side for paging, most recent first."
+        VIOLATION_PAGES_HANDLE_BYTES: Final[int] = 8
+        "Random bytes in a validation result handle."
+        VIOLATION_PAGES_CURSOR_SEPARATOR: Final[str] = ":"
+        "Separator between the result handle and the offset of a page cursor."
         CLAUDE_CONTEXT_SERVER_NAME: Final[str] = "claude-context"
         "MCP server name for claude-context integration."
         CLAUDE_MEM_SERVER_NAME: Final[str] = "claude-mem"
         "MCP server name for claude-mem integration."
+        MCP_CLI_EXECUTABLE: Final[str] = "mcp-cli"
+        "Executable used to talk to MCP servers."
+        MCP_SESSIONS_THREAD_NAME: Final[str] = "flext-quality-mcp-sessions"
+        "Name of the event loop thread holding pooled MCP sessions."
+        MCP_SCRIPT_SUFFIXES: Final[frozenset[str]] = frozenset({".py", ".js"})
+        "Server script suffixes an MCP client launches over stdio itself."
+        URL_SCHEME_SEPARATOR: Final[str] = "://"
+        "Separator marking an MCP transport given as a URL."
+        CODE_EXECUTION_RUNTIME_EXECUTABLES: ClassVar[t.StrMapping] = MappingProxyType({
+            "python": "python",
+            "typescript": "npx",
+            "ruff": "ruff",
+            "basedpyright": "basedpyright",
+        })
+        "Executable each code execution runtime needs on PATH."
+        INTEGRATION_REPROBE_THREAD_NAME: Final[str] = "flext-quality-reprobe"
+        "Name of the thread re-probing integration executables."
+
+        # ===== Rule Routing =====
+        FILE_TYPE_EXTENSIONS: ClassVar[t.MappingKV[str, tuple[str, ...]]] = (
+            MappingProxyType({
+                "py": (".py",),
+                "pyi": (".pyi",),
+                "md": (".md",),
+                "yaml": (".yaml", ".yml"),
+                "toml": (".toml",),
+                "sh": (".sh",),
+            })
+        )
+        "File extensions scanned for each rule file type."
+        DEFAULT_RULE_FILE_TYPES: Final[tuple[str, ...]] = ("py",)
+        "File types a rule applies to when it declares none."
+        TEXT_SNIFF_BYTES: Final[int] = 8192
+        "Leading bytes sniffed for NUL bytes, line length and encoding."
+        UTF8_MAX_SEQUENCE_BYTES: Final[int] = 4
+        "Longest UTF-8 sequence that a sniff window boundary can split."
+        READ_AHEAD_MAX_WORKERS: Final[int] = 8
+        "Upper bound on reader threads used for read-ahead prefetching."
+        READ_AHEAD_THREAD_PREFIX: Final[str] = "flext-quality-read"
+        "Thread name prefix of read-ahead reader threads."
+        SCAN_THREAD_PREFIX: Final[str] = "flext-quality-scan"
+        "Thread name prefix of parallel scan worker threads."
+        SCAN_WINDOW_PER_WORKER: Final[int] = 4
+        "Files in flight per scan worker, bounding memory of ordered results."
+
+        # ===== Run Checkpoints =====
+        CHECKPOINT_META_FILE: Final[str] = "run.json"
+        "Run metadata file inside a checkpoint directory."
+        CHECKPOINT_DONE_FILE: Final[str] = "files.done"
+        "Fully scanned files, one per line after the violations log size."
+        CHECKPOINT_DONE_SEPARATOR: Final[str] = "\t"
+        "Separates the violations log size from the path in a done entry."
+        CHECKPOINT_VIOLATIONS_FILE: Final[str] = "violations.ndjson"
+        "NDJSON stream of violations recorded so far."
+
+        # ===== Result Output =====
+        SARIF_VERSION: Final[str] = "2.1.0"
+        "SARIF specification version written by the SARIF writer."
+        SARIF_SCHEMA_URI: Final[str] = "https://json.schemastore.org/sarif-2.1.0.json"
+        "SARIF 2.1.0 JSON schema location."
+        SARIF_FINGERPRINT_KEY: Final[str] = "flextQuality/v2"
+        "partialFingerprints key carrying the baseline fingerprint."
+        SARIF_SRCROOT: Final[str] = "%SRCROOT%"
+        "uriBaseId that artifact paths relative to the scan root are based on."
+        SARIF_LEVELS: ClassVar[t.StrMapping] = MappingProxyType({
+            "error": "error",
+            "warning": "warning",
+            "info": "note",
+        })
+        "Violation severity to SARIF result level."
 
         # ===== Standard Paths =====
         PATHS_RULES_DIR: Final[str] = "rules"
         "Rules directory path."
+        PATHS_BASELINE_FILE: Final[str] = ".flext-quality-baseline"
+        "Default violation baseline file path."
+
+        # ===== Violation Baseline =====
+        BASELINE_DIGEST_SIZE: Final[int] = 8
+        "Digest size in bytes of a violation fingerprint."
+        BASELINE_HEADER: Final[str] = "# flext-quality baseline v2"
+        "Header line written at the top of baseline files."
+        BASELINE_ROOT_FIELD: Final[str] = " root="
+        "Header field naming the fingerprint root, relative to the baseline file."
         PATHS_DOCS_MAINTENANCE_REPORTS_DIR: Final[str] = "docs/maintenance/reports/"
         "Documentation maintenance reports directory path."
         PATHS_DOCS_MAINTENANCE_SETTINGS_DIR: Final[str] = "docs/maintenance/settings/"
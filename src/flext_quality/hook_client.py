@@ -0,0 +1,85 @@
+"""Stdlib-only client forwarding a hook event to the resident hook server.
+
+Configure hooks to run this file by path, e.g.
+``python /path/to/flext_quality/hook_client.py``. Running it by path does
+not import the ``flext_quality`` package, so an event costs one interpreter
+start plus a socket round trip. When no server is listening, the event is
+processed in-process through the full package instead; the directory of
+this file is taken off ``sys.path`` first, since its ``mcp``, ``hooks`` and
+``rules`` packages would otherwise shadow the modules of the same name.
+``python -m flext_quality.hook_client`` works too, at the cost of importing
+the package on every event.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+"""
+
+from __future__ import annotations
+
+import os
+import socket
+import sys
+from pathlib import Path
+
+# Mirrors FlextQualitySettings.Quality.hook_socket_path and its env variable;
+# importing the settings would defeat the purpose of this client.
+SOCKET_ENV_VAR = "FLEXT_QUALITY_QUALITY__HOOK_SOCKET_PATH"
+DEFAULT_SOCKET_PATH = ".flext-quality/hooks.sock"
+TIMEOUT_SECONDS = 30.0
+RECV_BYTES = 65536
+
+
+def forward(payload: bytes, socket_path: str) -> bytes | None:
+    """Send payload to the server; return None when no server is listening.
+
+    Errors after the connection is made yield an empty response rather than
+    ``None``, so the event is never processed twice.
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+        conn.settimeout(TIMEOUT_SECONDS)
+        try:
+            conn.connect(socket_path)
+        except OSError:
+            return None
+        chunks: list[bytes] = []
+        try:
+            conn.sendall(payload)
+            conn.shutdown(socket.SHUT_WR)
+            while chunk := conn.recv(RECV_BYTES):
+                chunks.append(chunk)
+        except OSError:
+            return b""
+    return b"".join(chunks)
+
+
+def process_locally(payload: bytes) -> bytes:
+    """Process the event in this process through the full package."""
+    here = Path(__file__).resolve().parent
+    sys.path[:] = [
+        entry for entry in sys.path if Path(entry or os.curdir).resolve() != here
+    ]
+    from flext_quality import quality, t
+
+    result = quality.process_hook_payload(payload)
+    if result.failure:
+        return b""
+    return t.json_mapping_adapter().dump_json(result.value) + b"\n"
+
+
+def main() -> int:
+    """Forward stdin to the hook server and print its answer."""
+    payload = sys.stdin.buffer.read()
+    socket_path = os.environ.get(SOCKET_ENV_VAR, DEFAULT_SOCKET_PATH)
+    response = forward(payload, socket_path)
+    if response is None:
+        response = process_locally(payload)
+    sys.stdout.buffer.write(response)
+    sys.stdout.buffer.flush()
+    return 0
+
+
+__all__: list[str] = ["forward", "main", "process_locally"]
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -9,11 +9,35 @@ from flext_core.lazy import build_lazy_import_map, install_lazy_exports
 
 if TYPE_CHECKING:
     from .base import FlextQualityBaseHook as FlextQualityBaseHook
+    from .breaker import (
+        FlextQualityHookCircuitBreaker as FlextQualityHookCircuitBreaker,
+    )
+    from .cache import FlextQualityHookResultCache as FlextQualityHookResultCache
+    from .config import FlextQualityHookConfig as FlextQualityHookConfig
+    from .debounce import FlextQualityHookDebouncer as FlextQualityHookDebouncer
+    from .dispatch import FlextQualityHookDispatchIndex as FlextQualityHookDispatchIndex
+    from .histogram import FlextQualityLatencyHistogram as FlextQualityLatencyHistogram
     from .manager import FlextQualityHookManager as FlextQualityHookManager
+    from .payload import FlextQualityHookPayload as FlextQualityHookPayload
+    from .recorder import FlextQualityHookRecorder as FlextQualityHookRecorder
+    from .replay import FlextQualityHookReplay as FlextQualityHookReplay
+    from .server import FlextQualityHookServer as FlextQualityHookServer
+    from .snapshot import FlextQualityHookSnapshot as FlextQualityHookSnapshot
 
 _LAZY_MODULES: dict[str, tuple[str, ...]] = {
     ".base": ("FlextQualityBaseHook",),
+    ".breaker": ("FlextQualityHookCircuitBreaker",),
+    ".cache": ("FlextQualityHookResultCache",),
+    ".config": ("FlextQualityHookConfig",),
+    ".debounce": ("FlextQualityHookDebouncer",),
+    ".dispatch": ("FlextQualityHookDispatchIndex",),
+    ".histogram": ("FlextQualityLatencyHistogram",),
     ".manager": ("FlextQualityHookManager",),
+    ".payload": ("FlextQualityHookPayload",),
+    ".recorder": ("FlextQualityHookRecorder",),
+    ".replay": ("FlextQualityHookReplay",),
+    ".server": ("FlextQualityHookServer",),
+    ".snapshot": ("FlextQualityHookSnapshot",),
 }
 
 
@@ -24,7 +48,21 @@ _LAZY_IMPORTS = build_lazy_import_map(
     _LAZY_MODULES, alias_groups=_LAZY_ALIAS_GROUPS, sort_keys=False
 )
 
-_PUBLIC_EXPORTS: tuple[str, ...] = ("FlextQualityBaseHook", "FlextQualityHookManager")
+_PUBLIC_EXPORTS: tuple[str, ...] = (
+    "FlextQualityBaseHook",
+    "FlextQualityHookCircuitBreaker",
+    "FlextQualityHookConfig",
+    "FlextQualityHookDebouncer",
+    "FlextQualityHookDispatchIndex",
+    "FlextQualityHookManager",
+    "FlextQualityHookPayload",
+    "FlextQualityHookRecorder",
+    "FlextQualityHookReplay",
+    "FlextQualityHookResultCache",
+    "FlextQualityHookServer",
+    "FlextQualityHookSnapshot",
+    "FlextQualityLatencyHistogram",
+)
 
 __all__: tuple[str, ...] = tuple(_PUBLIC_EXPORTS)
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import fnmatch
 from typing import TYPE_CHECKING, ClassVar
 
@@ -14,9 +15,37 @@ class FlextQualityBaseHook:
 
     event: ClassVar[c.Quality.HookEvent]
     matcher: ClassVar[t.StrSequence | None] = None
+    order: ClassVar[int] = 0
+    "Position among the event's hooks; equal orders keep registration order."
+    parallel_safe: ClassVar[bool] = False
+    "Whether the hook is side-effect-free and may run alongside other such hooks."
+    timeout_ms: ClassVar[int | None] = None
+    "Deadline of a single run; ``None`` uses the configured ``hook_timeout_ms``."
+    fail_closed: ClassVar[bool] = False
+    "Whether a timed-out or skipped run blocks the tool call instead of passing."
+    pure: ClassVar[bool] = False
+    "Whether the result depends only on the input, so it may be memoised."
+    cache_keys: ClassVar[t.StrSequence | None] = None
+    "``tool_input`` fields a pure hook depends on; ``None`` means all of them."
+
+    async def aexecute(self, input_data: t.JsonMapping) -> p.Result[t.JsonMapping]:
+        """Execute the hook logic without blocking the running event loop.
+
+        Hooks doing I/O override this with a native coroutine; the default
+        runs the synchronous ``execute`` in a worker thread. The hook manager
+        does not call the default: it runs such hooks on its own daemon
+        threads, so timed-out runs never hold the loop's executor.
+        """
+        return await asyncio.to_thread(self.execute, input_data)
 
     def execute(self, input_data: t.JsonMapping) -> p.Result[t.JsonMapping]:
-        """Execute the hook logic."""
+        """Execute the hook logic.
+
+        Hooks that only implement ``aexecute`` are run to completion on a
+        private event loop.
+        """
+        if type(self).aexecute is not FlextQualityBaseHook.aexecute:
+            return asyncio.run(self.aexecute(input_data))
         raise NotImplementedError
 
     def should_run(self, input_data: t.JsonMapping) -> bool:
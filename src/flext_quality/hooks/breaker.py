@@ -0,0 +1,197 @@
+"""Per-hook circuit breaker with an optional shared state file."""
+
+from __future__ import annotations
+
+import fcntl
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, final
+
+from flext_quality import c, t, u
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Generator, MutableMapping
+    from pathlib import Path
+
+
+@final
+class FlextQualityHookCircuitBreaker:
+    """Stop running hooks that keep failing, then probe them again later.
+
+    A hook whose runs fail or time out ``threshold`` times in a row, each
+    within ``window_seconds`` of the first, opens its circuit: it is skipped
+    for ``cooldown_seconds``. The first run after the cool-down is a probe;
+    success closes the circuit, failure opens it for another cool-down.
+
+    With a ``state_path`` the state is shared through a small JSON file,
+    so short-lived hook processes, and forked server children, see the
+    circuits opened by earlier ones. Times are wall-clock for that reason.
+    Every update reloads, changes and writes the file under an exclusive
+    ``flock`` of a sibling lock file, so one probe is let through across
+    all of those processes too.
+    """
+
+    def __init__(
+        self,
+        threshold: int,
+        window_seconds: float,
+        cooldown_seconds: float,
+        *,
+        state_path: Path | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Initialize the breaker, loading shared state when a path is given."""
+        self._threshold = threshold
+        self._window = window_seconds
+        self._cooldown = cooldown_seconds
+        self._state_path = state_path
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state: MutableMapping[str, t.MutableJsonMapping] = {}
+        self._state_mtime_ns: int | None = None
+        self._refresh()
+
+    def allow(self, name: str) -> bool:
+        """Check whether hook name may run now.
+
+        Once the cool-down is over, exactly one caller is let through as a
+        probe; the circuit stays open for everybody else until it settles.
+        """
+        with self._locked():
+            entry = self._state.get(name)
+            open_until = entry.get("open_until") if entry is not None else None
+            if entry is None or not isinstance(open_until, int | float):
+                return True
+            now = self._clock()
+            if now < open_until:
+                return False
+            entry["open_until"] = now + self._cooldown
+            entry["probing"] = True
+            self._persist()
+            return True
+
+    def open_circuits(self) -> t.MappingKV[str, float]:
+        """Return the seconds left before each open circuit is probed again."""
+        with self._lock:
+            self._refresh()
+            now = self._clock()
+            return {
+                name: round(open_until - now, 3)
+                for name, entry in self._state.items()
+                if isinstance(open_until := entry.get("open_until"), int | float)
+                and open_until > now
+            }
+
+    def record_failure(self, name: str) -> bool:
+        """Record a failed or timed-out run; return whether it opened the circuit."""
+        with self._locked():
+            now = self._clock()
+            entry = self._state.setdefault(name, {})
+            failures = [
+                stamp
+                for stamp in entry.get("failures") or []
+                if isinstance(stamp, int | float) and now - stamp <= self._window
+            ]
+            failures.append(now)
+            opened = bool(entry.get("probing")) or len(failures) >= self._threshold
+            if opened:
+                self._state[name] = {"open_until": now + self._cooldown}
+            else:
+                self._state[name] = {"failures": failures}
+            self._persist()
+            return opened
+
+    def record_success(self, name: str) -> None:
+        """Record a successful run, closing the circuit of hook name."""
+        with self._locked():
+            if name in self._state:
+                del self._state[name]
+                self._persist()
+
+    def _persist(self) -> None:
+        """Write the state file; a failed write only loses sharing."""
+        if self._state_path is None:
+            return
+        try:
+            self._state_path.parent.mkdir(parents=True, exist_ok=True)
+        except OSError:
+            return
+        written = u.Cli.atomic_write_text_file(
+            self._state_path,
+            t.json_mapping_adapter().dump_json(dict(self._state)).decode(),
+        )
+        if written.success:
+            self._state_mtime_ns = self._mtime_ns()
+
+    def _lock_file(self) -> int | None:
+        """Open and exclusively lock the file guarding the state file."""
+        if self._state_path is None:
+            return None
+        lock_path = self._state_path.with_name(
+            self._state_path.name + c.Quality.HOOK_BREAKER_LOCK_SUFFIX
+        )
+        try:
+            lock_path.parent.mkdir(parents=True, exist_ok=True)
+            descriptor = os.open(
+                lock_path, os.O_RDWR | os.O_CREAT, c.Quality.HOOK_BREAKER_LOCK_MODE
+            )
+        except OSError:
+            return None
+        try:
+            fcntl.flock(descriptor, fcntl.LOCK_EX)
+        except OSError:
+            os.close(descriptor)
+            return None
+        return descriptor
+
+    @contextmanager
+    def _locked(self) -> Generator[None]:
+        """Hold the breaker lock and the state file lock, reloading the state.
+
+        Without a usable lock file the state is only guarded in-process.
+        """
+        with self._lock:
+            descriptor = self._lock_file()
+            try:
+                self._refresh(force=descriptor is not None)
+                yield
+            finally:
+                if descriptor is not None:
+                    os.close(descriptor)
+
+    def _mtime_ns(self) -> int | None:
+        """Return the state file modification time, or None if it is missing."""
+        if self._state_path is None:
+            return None
+        try:
+            return self._state_path.stat().st_mtime_ns
+        except OSError:
+            return None
+
+    def _refresh(self, *, force: bool = False) -> None:
+        """Reload the state file if another process changed it.
+
+        The modification time can miss writes landing within one clock
+        tick, so updates holding the file lock ``force`` the reload.
+        """
+        mtime_ns = self._mtime_ns()
+        if self._state_path is None or (not force and mtime_ns == self._state_mtime_ns):
+            return
+        self._state_mtime_ns = mtime_ns
+        read = u.Cli.files_read_text(self._state_path)
+        if read.failure:
+            return
+        try:
+            loaded = t.json_mapping_adapter().validate_json(read.value)
+        except ValueError:
+            return
+        self._state = {
+            name: dict(entry)
+            for name, entry in loaded.items()
+            if isinstance(entry, dict)
+        }
+
+
+__all__: list[str] = ["FlextQualityHookCircuitBreaker"]
@@ -0,0 +1,109 @@
+"""TTL and size-bounded LRU cache for pure hook results."""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Mapping, Sequence
+from typing import TYPE_CHECKING, final
+
+from flext_quality import c, t
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from flext_quality import FlextQualityBaseHook, p
+
+
+@final
+class FlextQualityHookResultCache:
+    """Memoise results of pure hooks keyed by their normalised input.
+
+    Keys hash the hook, its event, the tool name and the ``tool_input``
+    fields the hook declares relevant, serialised with sorted keys so that
+    field order does not matter. Entries expire after ``ttl_seconds`` and the
+    least recently used entry is evicted beyond ``max_entries``. Safe to share
+    between threads of the resident hook server.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl_seconds: float,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize an empty cache."""
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[float, p.Result[t.JsonMapping]]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def __len__(self) -> int:
+        """Return the number of cached entries, expired or not."""
+        return len(self._entries)
+
+    @staticmethod
+    def key(hook: FlextQualityBaseHook, input_data: t.JsonMapping) -> str:
+        """Build the cache key of a hook invocation."""
+        tool_input = input_data.get("tool_input")
+        if hook.cache_keys is not None and isinstance(tool_input, Mapping):
+            tool_input = {field: tool_input.get(field) for field in hook.cache_keys}
+        material = t.json_mapping_adapter().dump_json({
+            "hook": type(hook).__qualname__,
+            "event": str(hook.event),
+            "tool_name": input_data.get("tool_name"),
+            "tool_input": FlextQualityHookResultCache._canonical(tool_input),
+        })
+        return hashlib.blake2b(
+            material, digest_size=c.Quality.HOOK_CACHE_DIGEST_SIZE
+        ).hexdigest()
+
+    def get(self, key: str) -> p.Result[t.JsonMapping] | None:
+        """Return a live cached result, counting the hit or miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > self._clock():
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry[1]
+            if entry is not None:
+                del self._entries[key]
+            self._misses += 1
+            return None
+
+    def put(self, key: str, result: p.Result[t.JsonMapping]) -> None:
+        """Store a result, evicting the least recently used beyond capacity."""
+        with self._lock:
+            self._entries[key] = (self._clock() + self._ttl_seconds, result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def stats(self) -> t.MappingKV[str, int]:
+        """Return hit, miss and size counters."""
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "size": len(self._entries),
+            }
+
+    @staticmethod
+    def _canonical(value: t.JsonValue) -> t.JsonValue:
+        """Return ``value`` with every nested mapping rebuilt in key order."""
+        if isinstance(value, Mapping):
+            return {
+                key: FlextQualityHookResultCache._canonical(value[key])
+                for key in sorted(value)
+            }
+        if isinstance(value, Sequence) and not isinstance(value, str):
+            return [FlextQualityHookResultCache._canonical(item) for item in value]
+        return value
@@ -0,0 +1,138 @@
+"""Declarative hook configuration loaded from YAML or TOML."""
+
+from __future__ import annotations
+
+import importlib
+from collections.abc import Mapping, MutableSequence
+from typing import TYPE_CHECKING, final
+
+from flext_quality import FlextQualityBaseHook, c, m, p, r, t, u
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@final
+class FlextQualityHookConfig:
+    """Hook definitions read from a configuration file.
+
+    The file holds a ``hooks`` list of ``m.Quality.HookDefinition`` entries,
+    as a YAML sequence or TOML ``[[hooks]]`` tables::
+
+        hooks:
+          - hook: my_project.hooks:BlockForcePush
+            matcher: [Bash]
+            order: 10
+            timeout_ms: 200
+            parallel_safe: true
+
+    Each entry is instantiated without arguments from a subclass of the
+    named hook class carrying the overridden attributes, so configured
+    hooks behave exactly like hooks registered in code. A malformed file,
+    or a hook whose constructor raises, fails ``load`` instead of raising.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Initialize over a YAML or TOML configuration file."""
+        self._path = path
+
+    @property
+    def path(self) -> Path:
+        """The configuration file."""
+        return self._path
+
+    def load(self) -> p.Result[t.SequenceOf[FlextQualityBaseHook]]:
+        """Parse the file and instantiate its enabled hooks."""
+        parsed = self._parse()
+        if parsed.failure:
+            return r[t.SequenceOf[FlextQualityBaseHook]].fail(parsed.error)
+        hooks: MutableSequence[FlextQualityBaseHook] = []
+        for index, entry in enumerate(parsed.value):
+            try:
+                definition = m.Quality.HookDefinition.model_validate(entry)
+            except ValueError as exc:
+                return r[t.SequenceOf[FlextQualityBaseHook]].fail(
+                    f"Hook {index}: {exc}"
+                )
+            if not definition.enabled:
+                continue
+            hook = self._instantiate(definition)
+            if hook.failure:
+                return r[t.SequenceOf[FlextQualityBaseHook]].fail(
+                    f"Hook {index}: {hook.error}"
+                )
+            hooks.append(hook.value)
+        return r[t.SequenceOf[FlextQualityBaseHook]].ok(hooks)
+
+    def mtime_ns(self) -> int | None:
+        """Return the modification time of the file, or None if it is missing."""
+        try:
+            return self._path.stat().st_mtime_ns
+        except OSError:
+            return None
+
+    @staticmethod
+    def _instantiate(
+        definition: m.Quality.HookDefinition,
+    ) -> p.Result[FlextQualityBaseHook]:
+        """Build the configured hook from its class and attribute overrides."""
+        module_name, _, class_name = definition.hook.rpartition(
+            c.Quality.HOOK_CONFIG_CLASS_SEPARATOR
+        )
+        try:
+            hook_class = getattr(importlib.import_module(module_name), class_name)
+        except (ImportError, AttributeError, ValueError) as exc:
+            return r[FlextQualityBaseHook].fail(
+                f"Cannot import {definition.hook!r}: {exc}"
+            )
+        if not (
+            isinstance(hook_class, type)
+            and issubclass(hook_class, FlextQualityBaseHook)
+        ):
+            return r[FlextQualityBaseHook].fail(
+                f"{definition.hook!r} is not a FlextQualityBaseHook subclass"
+            )
+        overrides = definition.model_dump(
+            exclude={"hook", "name", "enabled"}, exclude_none=True
+        )
+
+        def build() -> FlextQualityBaseHook:
+            configured = type(
+                definition.name or hook_class.__name__,
+                (hook_class,),
+                {"__module__": hook_class.__module__, **overrides},
+            )
+            return configured()
+
+        return u.try_(build, catch=Exception).map_error(
+            lambda e: f"Cannot instantiate {definition.hook!r}: {e}"
+        )
+
+    def _parse(self) -> p.Result[t.SequenceOf[t.JsonMapping]]:
+        """Read the ``hooks`` list from the YAML or TOML file."""
+        loaded = (
+            u.Cli.toml_load(self._path)
+            if self._path.suffix == c.Quality.HOOK_CONFIG_TOML_SUFFIX
+            else u.Cli.yaml_safe_load(self._path)
+        )
+        if loaded.failure:
+            return r[t.SequenceOf[t.JsonMapping]].fail(
+                f"Failed to parse {self._path}: {loaded.error}"
+            )
+        document = loaded.value
+        entries = document.get("hooks", []) if isinstance(document, Mapping) else None
+        if not isinstance(entries, list):
+            return r[t.SequenceOf[t.JsonMapping]].fail(
+                f"Invalid hook configuration {self._path}: expected a 'hooks' list"
+            )
+        return u.try_(
+            lambda: (
+                t.Quality.RELAXED_CONTAINER_MAPPING_SEQUENCE_ADAPTER.validate_python(
+                    entries
+                )
+            ),
+            catch=ValueError,
+        ).map_error(lambda e: f"Invalid hook configuration {self._path}: {e}")
+
+
+__all__: list[str] = ["FlextQualityHookConfig"]
@@ -0,0 +1,52 @@
+"""Trailing-edge debouncer coalescing bursts of hook events per key."""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import TYPE_CHECKING, final
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, MutableMapping
+
+
+@final
+class FlextQualityHookDebouncer:
+    """Let only the last of a burst of events for the same key through.
+
+    Each event waits for a quiet window. An event arriving for the same key
+    in the meantime supersedes it and restarts the window, so a burst of
+    edits to one file results in a single run for its final state.
+    """
+
+    def __init__(self, *, clock: Callable[[], float] = time.monotonic) -> None:
+        """Initialize with an optional monotonic clock."""
+        self._clock = clock
+        self._generations: MutableMapping[str, int] = {}
+        self._sequence = 0
+        self._changed = threading.Condition()
+
+    def __len__(self) -> int:
+        """Return the number of keys with an event waiting."""
+        return len(self._generations)
+
+    def wait(self, key: str, window_seconds: float) -> bool:
+        """Wait out the quiet window; return whether this event is the latest.
+
+        A superseded event returns ``False`` as soon as its successor arrives.
+        """
+        with self._changed:
+            self._sequence += 1
+            generation = self._generations[key] = self._sequence
+            self._changed.notify_all()
+            deadline = self._clock() + window_seconds
+            while self._generations.get(key) == generation:
+                remaining = deadline - self._clock()
+                if remaining <= 0:
+                    del self._generations[key]
+                    return True
+                self._changed.wait(remaining)
+            return False
+
+
+__all__: list[str] = ["FlextQualityHookDebouncer"]
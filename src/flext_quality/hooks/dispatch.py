@@ -0,0 +1,91 @@
+"""Precompiled tool-name dispatch index for hook execution."""
+
+from __future__ import annotations
+
+import fnmatch
+import re
+from functools import lru_cache
+from typing import TYPE_CHECKING, final
+
+from flext_quality import FlextQualityBaseHook, c
+
+if TYPE_CHECKING:
+    from collections.abc import MutableMapping, MutableSequence
+
+    from flext_quality import t
+
+
+@final
+class FlextQualityHookDispatchIndex:
+    """Index of the hooks registered for one event, keyed by tool name.
+
+    Matchers are compiled once: literal tool names go into exact buckets and
+    wildcard patterns into one combined regex that rejects most tool names
+    in a single search. The resolved hook list per tool name is kept in an
+    LRU, so dispatching a known tool is a single cache lookup. Hooks that
+    override ``should_run`` cannot be indexed and are still asked on every
+    call, in registration order with the rest.
+    """
+
+    def __init__(self, hooks: t.SequenceOf[FlextQualityBaseHook]) -> None:
+        """Compile the matchers of hooks, kept in registration order."""
+        self._hooks = tuple(hooks)
+        always: MutableSequence[int] = []
+        dynamic: MutableSequence[int] = []
+        exact: MutableMapping[str, MutableSequence[int]] = {}
+        wildcards: MutableSequence[tuple[int, re.Pattern[str]]] = []
+        for position, hook in enumerate(self._hooks):
+            if type(hook).should_run is not FlextQualityBaseHook.should_run:
+                dynamic.append(position)
+            elif hook.matcher is None:
+                always.append(position)
+            else:
+                for pattern in hook.matcher:
+                    if any(char in pattern for char in c.Quality.HOOK_WILDCARD_CHARS):
+                        wildcards.append((
+                            position,
+                            re.compile(fnmatch.translate(pattern)),
+                        ))
+                    else:
+                        exact.setdefault(pattern, []).append(position)
+        self._always = tuple(always)
+        self._dynamic = tuple(dynamic)
+        self._exact = {name: tuple(found) for name, found in exact.items()}
+        self._wildcards = tuple(wildcards)
+        self._any_wildcard = (
+            re.compile("|".join(f"(?:{regex.pattern})" for _, regex in wildcards))
+            if wildcards
+            else None
+        )
+        self._lookup = lru_cache(maxsize=c.Quality.HOOK_DISPATCH_CACHE_SIZE)(
+            self._resolve
+        )
+
+    def __len__(self) -> int:
+        """Return the number of indexed hooks."""
+        return len(self._hooks)
+
+    def match(self, input_data: t.JsonMapping) -> t.SequenceOf[FlextQualityBaseHook]:
+        """Return the hooks that should run for input, in registration order."""
+        tool_name = str(input_data.get("tool_name", ""))
+        hooks = self._lookup(tool_name)
+        if not self._dynamic:
+            return hooks
+        selected = {id(hook) for hook in hooks}
+        return tuple(
+            hook
+            for position, hook in enumerate(self._hooks)
+            if id(hook) in selected
+            or (position in self._dynamic and hook.should_run(input_data))
+        )
+
+    def _resolve(self, tool_name: str) -> tuple[FlextQualityBaseHook, ...]:
+        """Collect the statically matched hooks for a tool name."""
+        positions = {*self._always, *self._exact.get(tool_name, ())}
+        if self._any_wildcard is not None and self._any_wildcard.match(tool_name):
+            positions.update(
+                position
+                for position, regex in self._wildcards
+                if regex.match(tool_name)
+            )
+        return tuple(self._hooks[position] for position in sorted(positions))
@@ -0,0 +1,92 @@
+"""Log-linear latency histogram for hook telemetry."""
+
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING, final
+
+from flext_quality import c
+
+if TYPE_CHECKING:
+    from collections.abc import MutableMapping
+
+    from flext_quality import t
+
+
+@final
+class FlextQualityLatencyHistogram:
+    """HDR-style histogram of durations recorded in microseconds.
+
+    Values below ``2**bits`` are counted exactly; above that every power of
+    two is split into ``2**(bits - 1)`` equal sub-buckets, so a percentile is
+    reported within a relative error of ``2**(1 - bits)`` whatever the
+    magnitude. Recording is a constant-time counter increment and memory
+    grows with the number of distinct buckets hit, not with the sample count.
+    """
+
+    def __init__(self, bits: int = c.Quality.LATENCY_SUB_BUCKET_BITS) -> None:
+        """Initialize an empty histogram with ``2**bits`` linear sub-buckets."""
+        self._bits = bits
+        self._counts: MutableMapping[int, int] = {}
+        self._count = 0
+        self._total = 0
+        self._min = 0
+        self._max = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of recorded samples."""
+        return self._count
+
+    def percentile(self, percentile: float) -> int:
+        """Return the highest value equivalent to the given percentile."""
+        with self._lock:
+            if not self._count:
+                return 0
+            rank = max(1, -(-self._count * percentile // 100))
+            seen = 0
+            for index in sorted(self._counts):
+                seen += self._counts[index]
+                if seen >= rank:
+                    return min(self._highest_equivalent(index), self._max)
+            return self._max
+
+    def record(self, seconds: float) -> None:
+        """Record a duration given in seconds."""
+        value = max(0, round(seconds * c.Quality.US_PER_SECOND))
+        index = self._index(value)
+        with self._lock:
+            self._counts[index] = self._counts.get(index, 0) + 1
+            self._min = value if not self._count else min(self._min, value)
+            self._max = max(self._max, value)
+            self._count += 1
+            self._total += value
+
+    def summary(self) -> t.MappingKV[str, int]:
+        """Return count, extremes, mean and the reported percentiles in µs."""
+        summary: MutableMapping[str, int] = {
+            "count": self._count,
+            "min_us": self._min,
+            "max_us": self._max,
+            "mean_us": self._total // self._count if self._count else 0,
+        }
+        for percentile in c.Quality.LATENCY_PERCENTILES:
+            summary[f"p{percentile}_us"] = self.percentile(percentile)
+        return summary
+
+    def _highest_equivalent(self, index: int) -> int:
+        """Return the largest value counted in bucket index."""
+        half = 1 << (self._bits - 1)
+        if index < 2 * half:
+            return index
+        shift = (index >> (self._bits - 1)) - 1
+        mantissa = index - shift * half
+        return (mantissa << shift) + (1 << shift) - 1
+
+    def _index(self, value: int) -> int:
+        """Return the bucket counting value."""
+        shift = max(0, value.bit_length() - self._bits)
+        return shift * (1 << (self._bits - 1)) + (value >> shift)
+
+
+__all__: list[str] = ["FlextQualityLatencyHistogram"]
@@ -2,48 +2,197 @@
 
 from __future__ import annotations
 
-from collections.abc import MutableMapping, MutableSequence, Sequence
+import asyncio
+import threading
+import time
+from collections.abc import (
+    Mapping,
+    MutableMapping,
+    MutableSequence,
+    MutableSet,
+    Sequence,
+)
+from concurrent.futures import Future
+from pathlib import Path
 from typing import TYPE_CHECKING, final
 
-from flext_quality import FlextQualityBaseHook, c, p, r, t, u
+from flext_quality import (
+    FlextQualityBaseHook,
+    FlextQualityHookCircuitBreaker,
+    FlextQualityHookConfig,
+    FlextQualityHookDebouncer,
+    FlextQualityHookResultCache,
+    FlextQualityHookSnapshot,
+    FlextQualityLatencyHistogram,
+    FlextQualitySettings,
+    c,
+    p,
+    r,
+    t,
+    u,
+)
 
 if TYPE_CHECKING:
-    from pathlib import Path
+    from collections.abc import Iterator
 
 
 @final
 class FlextQualityHookManager:
     """Manages hook lifecycle and execution."""
 
-    def __init__(self, config_path: Path | None = None) -> None:
-        """Initialize hook manager with optional settings path."""
-        self._hooks: MutableMapping[
-            c.Quality.HookEvent, MutableSequence[FlextQualityBaseHook]
-        ] = {}
-        self._config_path = config_path
+    def __init__(
+        self,
+        config_path: Path | None = None,
+        *,
+        hook_timeout_ms: int | None = None,
+        event_timeout_ms: int | None = None,
+        cache: FlextQualityHookResultCache | None = None,
+        debounce_ms: int | None = None,
+        breaker: FlextQualityHookCircuitBreaker | None = None,
+    ) -> None:
+        """Initialize hook manager with optional config file and deadlines.
+
+        Hooks declared in ``config_path``, or in ``hook_config_path`` from
+        settings, are loaded next to the ones registered in code. Results of
+        pure hooks are memoised in ``cache``, or in a cache sized from
+        settings when ``cache_enabled`` is set. A non-zero ``debounce_ms``,
+        or ``hook_debounce_ms`` from settings, coalesces bursts of
+        PostToolUse events for the same file. Hooks that keep failing are
+        skipped by ``breaker``, or by a breaker configured from settings.
+        """
+        settings = FlextQualitySettings.fetch_global()
+        self._hook_timeout_ms = hook_timeout_ms or settings.Quality.hook_timeout_ms
+        self._event_timeout_ms = event_timeout_ms or settings.Quality.event_timeout_ms
+        self._debounce_ms = (
+            settings.Quality.hook_debounce_ms if debounce_ms is None else debounce_ms
+        )
+        self._debouncer = FlextQualityHookDebouncer()
+        if breaker is None:
+            state_path = settings.Quality.hook_breaker_state_path
+            breaker = FlextQualityHookCircuitBreaker(
+                settings.Quality.hook_breaker_threshold,
+                settings.Quality.hook_breaker_window_seconds,
+                settings.Quality.hook_breaker_cooldown_seconds,
+                state_path=Path(state_path) if state_path else None,
+            )
+        self._breaker = breaker
+        self._stats: MutableMapping[str, MutableMapping[str, int]] = {}
+        self._hook_latency: MutableMapping[str, FlextQualityLatencyHistogram] = {}
+        self._event_latency: MutableMapping[str, FlextQualityLatencyHistogram] = {}
+        self._stats_lock = threading.Lock()
+        if cache is None and settings.Quality.cache_enabled:
+            cache = FlextQualityHookResultCache(
+                settings.Quality.hook_cache_size,
+                settings.Quality.hook_cache_ttl_seconds,
+            )
+        self._cache = cache
+        self._abandoned: MutableSet[Future[p.Result[t.JsonMapping]]] = set()
+        if config_path is None and settings.Quality.hook_config_path:
+            config_path = Path(settings.Quality.hook_config_path)
+        self._config = (
+            FlextQualityHookConfig(config_path) if config_path is not None else None
+        )
+        self._config_mtime_ns: int | None = None
+        self._registered: MutableSequence[FlextQualityBaseHook] = []
+        self._configured: t.SequenceOf[FlextQualityBaseHook] = ()
+        self._snapshot = FlextQualityHookSnapshot(())
+        self._generation = 0
+        self._reload_lock = threading.Lock()
+        if self._config is not None:
+            self.reload()
 
     def execute(self, event: str, input_data: t.JsonMapping) -> p.Result[t.JsonMapping]:
-        """Execute all hooks for an event."""
-        try:
-            hook_event = c.Quality.HookEvent(event)
-        except ValueError:
-            return r[t.JsonMapping].fail(f"Unknown event: {event}")
-        hooks = self._hooks.get(hook_event, [])
-        for hook in hooks:
-            if not hook.should_run(input_data):
-                continue
-            result = hook.execute(input_data)
-            if result.failure:
-                return result
-            output = result.value
-            if not output.get("continue", True):
-                return result
-        return r[t.JsonMapping].ok({"continue": True})
+        """Execute all hooks for an event.
+
+        Consecutive parallel-safe hooks run concurrently; their results are
+        still inspected in registration order, so the first hook to fail or
+        return ``continue: false`` decides the outcome either way.
+
+        Every hook runs under its own deadline, capped by the deadline of the
+        whole event. A hook that misses it is degraded according to its
+        ``fail_closed`` policy. A hook that keeps failing or timing out has its
+        circuit opened and is skipped under the same policy, without being
+        started, until the cool-down ends and a probe run succeeds. A
+        timed-out hook cannot be interrupted; its daemon thread finishes in
+        the background without holding up process exit. While
+        ``HOOK_ABANDONED_RUNS_MAX`` such runs are still going, further hooks
+        are skipped under their policy instead of being started.
+
+        With debouncing on, a PostToolUse event for a file first waits for
+        a quiet window; if another event for that file arrives meanwhile,
+        this one returns ``continue: true`` without running its hooks and
+        only the latest event of the burst is validated.
+        """
+        dispatched = self._dispatch(event, input_data)
+        if dispatched.failure:
+            return r[t.JsonMapping].fail(dispatched.error)
+        debounce_key = self._debounce_key(event, dispatched.value, input_data)
+        if debounce_key is not None and not self._debouncer.wait(
+            debounce_key, self._debounce_ms / c.Quality.MS_TO_SECONDS_DIVISOR
+        ):
+            self._count(event, "coalesced")
+            return r[t.JsonMapping].ok({"continue": True})
+        started = time.perf_counter()
+        deadline = self._event_deadline()
+        result = r[t.JsonMapping].ok({"continue": True})
+        for batch in self._batches(dispatched.value):
+            stopped = self._run_batch(batch, input_data, deadline)
+            if stopped is not None:
+                result = stopped
+                break
+        self._histogram(self._event_latency, event).record(
+            time.perf_counter() - started
+        )
+        return result
+
+    async def aexecute(
+        self, event: str, input_data: t.JsonMapping
+    ) -> p.Result[t.JsonMapping]:
+        """Execute all hooks for an event on the running event loop.
+
+        Same ordering, batching, deadline and caching rules as ``execute``,
+        and awaiting the result never blocks the loop. Hooks overriding
+        ``aexecute`` run as tasks, and a timed-out task is cancelled; other
+        hooks run on daemon threads and count against
+        ``HOOK_ABANDONED_RUNS_MAX`` when they time out. An exception raised by
+        a hook becomes a failure result on both paths.
+        """
+        dispatched = self._dispatch(event, input_data)
+        if dispatched.failure:
+            return r[t.JsonMapping].fail(dispatched.error)
+        debounce_key = self._debounce_key(event, dispatched.value, input_data)
+        if debounce_key is not None and not await asyncio.to_thread(
+            self._debouncer.wait,
+            debounce_key,
+            self._debounce_ms / c.Quality.MS_TO_SECONDS_DIVISOR,
+        ):
+            self._count(event, "coalesced")
+            return r[t.JsonMapping].ok({"continue": True})
+        started = time.perf_counter()
+        deadline = self._event_deadline()
+        result = r[t.JsonMapping].ok({"continue": True})
+        for batch in self._batches(dispatched.value):
+            stopped = await self._arun_batch(batch, input_data, deadline)
+            if stopped is not None:
+                result = stopped
+                break
+        self._histogram(self._event_latency, event).record(
+            time.perf_counter() - started
+        )
+        return result
+
+    def fetch_cache_stats(self) -> t.MappingKV[str, int]:
+        """Return hit, miss and size counters of the pure hook result cache."""
+        return self._cache.stats() if self._cache is not None else {}
+
+    def fetch_open_circuits(self) -> t.MappingKV[str, float]:
+        """Return seconds until each hook with an open circuit is probed again."""
+        return self._breaker.open_circuits()
 
     def fetch_config(self) -> t.JsonMapping:
         """Get hooks configuration as dict."""
         config: t.JsonDict = {}
-        for event, hooks in self._hooks.items():
+        for event, hooks in self._current_snapshot().hooks.items():
             hook_entries: t.JsonValueList = []
             for hook in hooks:
                 matcher = hook.matcher
@@ -56,6 +205,36 @@ class FlextQualityHookManager:
             config[event.value] = hook_entries
         return config
 
+    def fetch_generation(self) -> int:
+        """Return a counter bumped every time a new dispatch snapshot is swapped in."""
+        return self._generation
+
+    def fetch_hook_stats(self) -> t.MappingKV[str, t.MappingKV[str, int]]:
+        """Return timeout, skip, block and failure counters per hook class name.
+
+        Debounced events superseded by a later one are counted as
+        ``coalesced`` under the event name.
+        """
+        with self._stats_lock:
+            return {name: dict(counters) for name, counters in self._stats.items()}
+
+    def fetch_latency(
+        self,
+    ) -> t.MappingKV[str, t.MappingKV[str, t.MappingKV[str, int]]]:
+        """Return latency summaries per hook class name and per event.
+
+        Hook latency is the run time of each started hook, including runs
+        that finished after their deadline; event latency is the time spent
+        answering the whole event.
+        """
+        with self._stats_lock:
+            hooks = dict(self._hook_latency)
+            events = dict(self._event_latency)
+        return {
+            "hooks": {name: hist.summary() for name, hist in hooks.items()},
+            "events": {name: hist.summary() for name, hist in events.items()},
+        }
+
     def fetch_config_json(self) -> str:
         """Get hooks configuration as JSON."""
         config_json: str = (
@@ -67,9 +246,378 @@ class FlextQualityHookManager:
         return config_json
 
     def register(self, hook: FlextQualityBaseHook) -> p.Result[bool]:
-        """Register a hook."""
-        event = hook.event
-        if event not in self._hooks:
-            self._hooks[event] = list[FlextQualityBaseHook]()
-        self._hooks[event].append(hook)
+        """Register a hook and swap in a recompiled dispatch snapshot."""
+        with self._reload_lock:
+            self._registered.append(hook)
+            self._swap_snapshot()
         return r[bool].ok(value=True)
+
+    def reload(self) -> p.Result[int]:
+        """Reload the hook configuration file and swap in a new snapshot.
+
+        Events already running keep the snapshot they started with. When the
+        file cannot be loaded the previous snapshot stays active. Returns the
+        number of configured hooks.
+        """
+        if self._config is None:
+            return r[int].fail("No hook configuration file")
+        with self._reload_lock:
+            return self._load_config(self._config)
+
+    def _abandon(self, run: Future[p.Result[t.JsonMapping]]) -> None:
+        """Track a timed-out run until its thread finishes."""
+        with self._stats_lock:
+            self._abandoned.add(run)
+        run.add_done_callback(self._forget)
+
+    def _batches(
+        self, hooks: t.SequenceOf[FlextQualityBaseHook]
+    ) -> Iterator[t.SequenceOf[FlextQualityBaseHook]]:
+        """Group runs of parallel-safe hooks; every other hook runs alone."""
+        batch: MutableSequence[FlextQualityBaseHook] = []
+        for hook in hooks:
+            if hook.parallel_safe:
+                batch.append(hook)
+                continue
+            if batch:
+                yield batch
+                batch = []
+            yield (hook,)
+        if batch:
+            yield batch
+
+    async def _arun_batch(
+        self,
+        batch: t.SequenceOf[FlextQualityBaseHook],
+        input_data: t.JsonMapping,
+        deadline: float,
+    ) -> p.Result[t.JsonMapping] | None:
+        """Run a batch concurrently and return the first stopping result in order.
+
+        Coroutine hooks run as tasks; synchronous hooks run on the daemon
+        threads of ``_start``, so a timed-out one is abandoned exactly as on
+        the synchronous path instead of holding a default executor worker.
+        """
+        started = time.monotonic()
+        runs: MutableSequence[
+            tuple[
+                FlextQualityBaseHook,
+                str | None,
+                asyncio.Future[p.Result[t.JsonMapping]] | p.Result[t.JsonMapping],
+            ]
+        ] = []
+        for hook in batch:
+            cache_key, immediate = self._prepare(hook, input_data)
+            run = self._astart(hook, input_data) if immediate is None else immediate
+            runs.append((hook, cache_key, run))
+        try:
+            for hook, cache_key, run in runs:
+                if isinstance(run, asyncio.Future):
+                    timeout = self._hook_deadline(hook, started, deadline)
+                    try:
+                        outcome = await asyncio.wait_for(
+                            run, max(0.0, timeout - time.monotonic())
+                        )
+                    except TimeoutError:
+                        outcome = None
+                    result = self._settle(hook, outcome, cache_key)
+                else:
+                    result = run
+                if self._stops(result):
+                    self._count(
+                        type(hook).__name__, "failed" if result.failure else "blocked"
+                    )
+                    return result
+        finally:
+            for _, _, run in runs:
+                if isinstance(run, asyncio.Future):
+                    run.cancel()
+        return None
+
+    def _astart(
+        self, hook: FlextQualityBaseHook, input_data: t.JsonMapping
+    ) -> asyncio.Future[p.Result[t.JsonMapping]]:
+        """Start a hook for the running loop: a task, or a tracked daemon thread.
+
+        Cancelling the returned future of a thread-run hook abandons it.
+        """
+        if type(hook).aexecute is not FlextQualityBaseHook.aexecute:
+            return asyncio.ensure_future(self._atimed(hook, input_data))
+        thread_run = self._start(hook, input_data)
+        run = asyncio.wrap_future(thread_run)
+        run.add_done_callback(
+            lambda done: self._abandon(thread_run) if done.cancelled() else None
+        )
+        return run
+
+    async def _atimed(
+        self, hook: FlextQualityBaseHook, input_data: t.JsonMapping
+    ) -> p.Result[t.JsonMapping]:
+        """Await a hook and record its run time, even when cancelled.
+
+        An exception raised by the hook becomes a failure result.
+        """
+        started = time.perf_counter()
+        try:
+            (outcome,) = await asyncio.gather(
+                hook.aexecute(input_data), return_exceptions=True
+            )
+        finally:
+            self._histogram(self._hook_latency, type(hook).__name__).record(
+                time.perf_counter() - started
+            )
+        if isinstance(outcome, Exception):
+            return r[t.JsonMapping].fail(
+                f"Hook {type(hook).__name__} raised: {outcome}"
+            )
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return outcome
+
+    def _current_snapshot(self) -> FlextQualityHookSnapshot:
+        """Return the active snapshot, reloading it if the config file changed.
+
+        Only one caller reloads; concurrent callers keep using the snapshot
+        that is active meanwhile instead of waiting for the reload.
+        """
+        config = self._config
+        if config is None or config.mtime_ns() == self._config_mtime_ns:
+            return self._snapshot
+        if self._reload_lock.acquire(blocking=False):
+            try:
+                self._load_config(config)
+            finally:
+                self._reload_lock.release()
+        return self._snapshot
+
+    def _count(self, name: str, counter: str) -> None:
+        """Increment a per-hook counter."""
+        with self._stats_lock:
+            counters = self._stats.setdefault(name, {})
+            counters[counter] = counters.get(counter, 0) + 1
+
+    def _debounce_key(
+        self,
+        event: str,
+        hooks: t.SequenceOf[FlextQualityBaseHook],
+        input_data: t.JsonMapping,
+    ) -> str | None:
+        """Return the key an event is debounced on, or None to run it now."""
+        if (
+            not self._debounce_ms
+            or not hooks
+            or event not in c.Quality.HOOK_DEBOUNCED_EVENTS
+        ):
+            return None
+        tool_input = input_data.get("tool_input")
+        if not isinstance(tool_input, Mapping):
+            return None
+        for field in c.Quality.HOOK_DEBOUNCE_PATH_FIELDS:
+            path = tool_input.get(field)
+            if isinstance(path, str) and path:
+                return f"{event}\0{path}"
+        return None
+
+    @staticmethod
+    def _degraded(hook: FlextQualityBaseHook, reason: str) -> p.Result[t.JsonMapping]:
+        """Build the outcome of a hook that did not answer in time."""
+        if hook.fail_closed:
+            return r[t.JsonMapping].ok({"continue": False, "blockedReason": reason})
+        return r[t.JsonMapping].ok({"continue": True, "systemMessage": reason})
+
+    def _dispatch(
+        self, event: str, input_data: t.JsonMapping
+    ) -> p.Result[t.SequenceOf[FlextQualityBaseHook]]:
+        """Validate the event and select its hooks for this input."""
+        try:
+            hook_event = c.Quality.HookEvent(event)
+        except ValueError:
+            return r[t.SequenceOf[FlextQualityBaseHook]].fail(f"Unknown event: {event}")
+        return r[t.SequenceOf[FlextQualityBaseHook]].ok(
+            self._current_snapshot().match(hook_event, input_data)
+        )
+
+    def _event_deadline(self) -> float:
+        """Return the monotonic deadline of an event starting now."""
+        return (
+            time.monotonic() + self._event_timeout_ms / c.Quality.MS_TO_SECONDS_DIVISOR
+        )
+
+    def _histogram(
+        self, table: MutableMapping[str, FlextQualityLatencyHistogram], name: str
+    ) -> FlextQualityLatencyHistogram:
+        """Return the histogram of name in table, creating it on first use."""
+        with self._stats_lock:
+            histogram = table.get(name)
+            if histogram is None:
+                histogram = table[name] = FlextQualityLatencyHistogram()
+            return histogram
+
+    def _forget(self, run: Future[p.Result[t.JsonMapping]]) -> None:
+        """Stop tracking a timed-out run once its thread has finished."""
+        with self._stats_lock:
+            self._abandoned.discard(run)
+
+    def _hook_deadline(
+        self, hook: FlextQualityBaseHook, started: float, deadline: float
+    ) -> float:
+        """Return the monotonic deadline of a hook started with its batch."""
+        timeout_ms = hook.timeout_ms or self._hook_timeout_ms
+        return min(started + timeout_ms / c.Quality.MS_TO_SECONDS_DIVISOR, deadline)
+
+    def _load_config(self, config: FlextQualityHookConfig) -> p.Result[int]:
+        """Load config and swap the snapshot; the reload lock must be held."""
+        self._config_mtime_ns = config.mtime_ns()
+        loaded = config.load()
+        if loaded.failure:
+            return r[int].fail(loaded.error)
+        self._configured = tuple(loaded.value)
+        self._swap_snapshot()
+        return r[int].ok(len(self._configured))
+
+    def _prepare(
+        self, hook: FlextQualityBaseHook, input_data: t.JsonMapping
+    ) -> tuple[str | None, p.Result[t.JsonMapping] | None]:
+        """Compute a hook's cache key and any result that avoids running it.
+
+        A cached result answers pure hooks; a hook whose circuit is open is
+        skipped and degraded without being started.
+        """
+        cache_key: str | None = None
+        if hook.pure and self._cache is not None:
+            cache_key = FlextQualityHookResultCache.key(hook, input_data)
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                return cache_key, cached
+        name = type(hook).__name__
+        with self._stats_lock:
+            abandoned = len(self._abandoned)
+        if abandoned >= c.Quality.HOOK_ABANDONED_RUNS_MAX:
+            self._count(name, "skipped")
+            return cache_key, self._degraded(
+                hook, f"Hook {name} skipped while {abandoned} timed-out hooks run"
+            )
+        if not self._breaker.allow(name):
+            self._count(name, "skipped")
+            return cache_key, self._degraded(
+                hook, f"Hook {name} skipped while its circuit is open"
+            )
+        return cache_key, None
+
+    def _run_batch(
+        self,
+        batch: t.SequenceOf[FlextQualityBaseHook],
+        input_data: t.JsonMapping,
+        deadline: float,
+    ) -> p.Result[t.JsonMapping] | None:
+        """Run a batch and return the first stopping result in batch order."""
+        started = time.monotonic()
+        runs: MutableSequence[
+            tuple[
+                FlextQualityBaseHook,
+                str | None,
+                Future[p.Result[t.JsonMapping]] | p.Result[t.JsonMapping],
+            ]
+        ] = []
+        for hook in batch:
+            cache_key, immediate = self._prepare(hook, input_data)
+            run = self._start(hook, input_data) if immediate is None else immediate
+            runs.append((hook, cache_key, run))
+        try:
+            for hook, cache_key, run in runs:
+                if isinstance(run, Future):
+                    timeout = self._hook_deadline(hook, started, deadline)
+                    try:
+                        outcome = run.result(max(0.0, timeout - time.monotonic()))
+                    except TimeoutError:
+                        self._abandon(run)
+                        outcome = None
+                    result = self._settle(hook, outcome, cache_key)
+                else:
+                    result = run
+                if self._stops(result):
+                    self._count(
+                        type(hook).__name__, "failed" if result.failure else "blocked"
+                    )
+                    return result
+        finally:
+            for _, _, run in runs:
+                if isinstance(run, Future):
+                    run.cancel()
+        return None
+
+    def _settle(
+        self,
+        hook: FlextQualityBaseHook,
+        outcome: p.Result[t.JsonMapping] | None,
+        cache_key: str | None,
+    ) -> p.Result[t.JsonMapping]:
+        """Account for a finished run; ``None`` means it missed its deadline.
+
+        Timeouts are counted and degraded. Timeouts and failed results count
+        against the hook's circuit; successful results close it and are
+        memoised under cache_key.
+        """
+        name = type(hook).__name__
+        if (outcome is None or outcome.failure) and self._breaker.record_failure(name):
+            self._count(name, "circuit_opened")
+        if outcome is None:
+            self._count(name, "timeouts")
+            timeout_ms = hook.timeout_ms or self._hook_timeout_ms
+            return self._degraded(hook, f"Hook {name} timed out after {timeout_ms} ms")
+        if outcome.success:
+            self._breaker.record_success(name)
+            if cache_key is not None and self._cache is not None:
+                self._cache.put(cache_key, outcome)
+        return outcome
+
+    def _start(
+        self, hook: FlextQualityBaseHook, input_data: t.JsonMapping
+    ) -> Future[p.Result[t.JsonMapping]]:
+        """Run a hook on a daemon thread, so a hung hook never blocks exit.
+
+        An exception raised by the hook becomes a failure result.
+        """
+        run: Future[p.Result[t.JsonMapping]] = Future()
+
+        def target() -> None:
+            if not run.set_running_or_notify_cancel():
+                return
+            run.set_result(
+                u
+                .try_(lambda: self._timed(hook, input_data), catch=Exception)
+                .map_error(lambda e: f"Hook {type(hook).__name__} raised: {e}")
+                .flat_map(lambda outcome: outcome)
+            )
+
+        threading.Thread(
+            target=target,
+            name=f"{c.Quality.HOOK_THREAD_PREFIX}-{type(hook).__name__}",
+            daemon=True,
+        ).start()
+        return run
+
+    def _swap_snapshot(self) -> None:
+        """Compile and swap in a new snapshot; the reload lock must be held."""
+        self._snapshot = FlextQualityHookSnapshot([
+            *self._registered,
+            *self._configured,
+        ])
+        self._generation += 1
+
+    def _timed(
+        self, hook: FlextQualityBaseHook, input_data: t.JsonMapping
+    ) -> p.Result[t.JsonMapping]:
+        """Run a hook and record its run time."""
+        started = time.perf_counter()
+        try:
+            return hook.execute(input_data)
+        finally:
+            self._histogram(self._hook_latency, type(hook).__name__).record(
+                time.perf_counter() - started
+            )
+
+    @staticmethod
+    def _stops(result: p.Result[t.JsonMapping]) -> bool:
+        """Check whether a hook result ends the chain."""
+        return result.failure or not result.value.get("continue", True)
@@ -0,0 +1,204 @@
+"""Lazily decoded hook payloads read from raw JSON bytes."""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterator, Mapping, MutableMapping
+from typing import ClassVar, final, override
+
+from flext_quality import c, p, r, t
+
+
+@final
+class FlextQualityHookPayload(Mapping[str, t.JsonValue]):
+    """Read-only mapping over a hook payload that decodes fields on access.
+
+    Construction locates the byte span of each top-level value and decodes
+    only the scalar ones, so a malformed ``event`` or ``tool_name`` fails
+    parsing. Nested containers are skipped with C-level byte searches
+    without being decoded: a field such as ``tool_input`` carrying megabytes
+    of file content is only parsed when a matching hook reads it. ``decode``
+    reports a malformed container as a failure; item access raises
+    ``ValueError`` for it.
+    """
+
+    _NON_SPACE: ClassVar[re.Pattern[bytes]] = re.compile(rb"\S")
+    _SCALAR_END: ClassVar[re.Pattern[bytes]] = re.compile(rb"[\s,:\]}]")
+    _NESTED: ClassVar[re.Pattern[bytes]] = re.compile(rb'[\[\]{}"]')
+    _STRING_TAIL: ClassVar[re.Pattern[bytes]] = re.compile(
+        rb'[^"\\]*+(?:\\.[^"\\]*+)*+"', re.DOTALL
+    )
+
+    def __init__(self, raw: bytes, spans: Mapping[str, tuple[int, int]]) -> None:
+        """Initialize over raw bytes and the value span of each key."""
+        self._raw = raw
+        self._spans = spans
+        self._decoded: MutableMapping[str, t.JsonValue] = {}
+
+    @override
+    def __getitem__(self, key: str) -> t.JsonValue:
+        """Decode and memoise a top-level value."""
+        if key in self._decoded:
+            return self._decoded[key]
+        start, end = self._spans[key]
+        try:
+            value = t.json_value_adapter().validate_json(self._raw[start:end])
+        except ValueError as exc:
+            msg = f"Invalid JSON in hook payload field {key!r}: {exc}"
+            raise ValueError(msg) from exc
+        self._decoded[key] = value
+        return value
+
+    @override
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over top-level keys without decoding values."""
+        return iter(self._spans)
+
+    @override
+    def __len__(self) -> int:
+        """Return the number of top-level keys."""
+        return len(self._spans)
+
+    @classmethod
+    def parse(
+        cls, raw: bytes | str, *, max_bytes: int | None = None
+    ) -> p.Result[FlextQualityHookPayload]:
+        """Index the top-level JSON object in raw, decoding only scalars."""
+        data = raw.encode(c.DEFAULT_ENCODING) if isinstance(raw, str) else raw
+        if max_bytes is not None and len(data) > max_bytes:
+            return r[FlextQualityHookPayload].fail(
+                f"Hook payload exceeds {max_bytes} bytes"
+            )
+        try:
+            spans = cls._index(data)
+        except ValueError as exc:
+            return r[FlextQualityHookPayload].fail(f"Invalid JSON: {exc}")
+        payload = cls(data, spans)
+        for key, (start, _) in spans.items():
+            if data[start : start + 1] in {b"{", b"["}:
+                continue
+            decoded = payload.decode(key)
+            if decoded.failure:
+                return r[FlextQualityHookPayload].fail(decoded.error)
+        return r[FlextQualityHookPayload].ok(payload)
+
+    def decode(self, key: str) -> p.Result[t.JsonValue]:
+        """Decode a top-level value, failing if it is missing or malformed."""
+        if key not in self._spans:
+            return r[t.JsonValue].fail(f"Hook payload has no field {key!r}")
+        try:
+            return r[t.JsonValue].ok(self[key])
+        except ValueError as exc:
+            return r[t.JsonValue].fail(str(exc))
+
+    def raw_size(self, key: str) -> int:
+        """Return the encoded size of a value without decoding it."""
+        start, end = self._spans[key]
+        return end - start
+
+    @classmethod
+    def _index(cls, data: bytes) -> Mapping[str, tuple[int, int]]:
+        """Map each top-level key to the byte span of its value.
+
+        Anything but whitespace after the closing brace is rejected.
+        """
+        spans: MutableMapping[str, tuple[int, int]] = {}
+        start, end = cls._token(data, 0)
+        if data[start:end] != b"{":
+            msg = "hook payload is not a JSON object"
+            raise ValueError(msg)
+        start, end = cls._token(data, end)
+        if data[start:end] == b"}":
+            return cls._ended(data, end, spans)
+        while True:
+            if data[start:end][:1] != b'"':
+                msg = f"expected a key at byte {start}"
+                raise ValueError(msg)
+            key = str(t.json_value_adapter().validate_json(data[start:end]))
+            start, end = cls._token(data, end)
+            if data[start:end] != b":":
+                msg = f"expected ':' at byte {start}"
+                raise ValueError(msg)
+            spans[key] = cls._skip_value(data, end)
+            start, end = cls._token(data, spans[key][1])
+            if data[start:end] == b"}":
+                return cls._ended(data, end, spans)
+            if data[start:end] != b",":
+                msg = f"expected ',' or '}}' at byte {start}"
+                raise ValueError(msg)
+            start, end = cls._token(data, end)
+
+    @classmethod
+    def _ended(
+        cls, data: bytes, pos: int, spans: Mapping[str, tuple[int, int]]
+    ) -> Mapping[str, tuple[int, int]]:
+        """Return spans if only whitespace follows the object ending at pos."""
+        trailing = cls._NON_SPACE.search(data, pos)
+        if trailing is not None:
+            msg = f"unexpected data after the object at byte {trailing.start()}"
+            raise ValueError(msg)
+        return spans
+
+    @classmethod
+    def _skip_value(cls, data: bytes, pos: int) -> tuple[int, int]:
+        """Return the span of the value starting after pos."""
+        start, end = cls._token(data, pos)
+        if data[start:end] not in {b"{", b"["}:
+            if data[start:end] in {b"}", b"]", b",", b":"}:
+                msg = f"expected a value at byte {start}"
+                raise ValueError(msg)
+            return start, end
+        depth = 1
+        while depth:
+            match = cls._NESTED.search(data, end)
+            if match is None:
+                msg = f"unterminated container at byte {start}"
+                raise ValueError(msg)
+            if match.group() == b'"':
+                end = cls._string_end(data, match.start())
+                continue
+            depth += 1 if match.group() in {b"{", b"["} else -1
+            end = match.end()
+        return start, end
+
+    @classmethod
+    def _string_end(cls, data: bytes, start: int) -> int:
+        """Return the position after the string opened at start.
+
+        Scans with ``bytes.find`` from quote to quote, so long strings cost
+        one C-level search per embedded quote rather than per character.
+        Strings dense with escaped quotes switch to a single regex scan.
+        """
+        pos = start + 1
+        for _ in range(c.Quality.PAYLOAD_ESCAPED_QUOTE_SCANS):
+            quote = data.find(b'"', pos)
+            if quote < 0:
+                msg = f"unterminated string at byte {start}"
+                raise ValueError(msg)
+            backslash = quote
+            while data[backslash - 1] == c.Quality.JSON_BACKSLASH:
+                backslash -= 1
+            if (quote - backslash) % 2 == 0:
+                return quote + 1
+            pos = quote + 1
+        tail = cls._STRING_TAIL.match(data, pos)
+        if tail is None:
+            msg = f"unterminated string at byte {start}"
+            raise ValueError(msg)
+        return tail.end()
+
+    @classmethod
+    def _token(cls, data: bytes, pos: int) -> tuple[int, int]:
+        """Return the span of the next token at or after pos."""
+        match = cls._NON_SPACE.search(data, pos)
+        if match is None:
+            msg = f"unexpected end of payload at byte {pos}"
+            raise ValueError(msg)
+        start = match.start()
+        head = data[start : start + 1]
+        if head == b'"':
+            return start, cls._string_end(data, start)
+        if head in {b"{", b"}", b"[", b"]", b",", b":"}:
+            return start, start + 1
+        scalar_end = cls._SCALAR_END.search(data, start)
+        return start, scalar_end.start() if scalar_end is not None else len(data)
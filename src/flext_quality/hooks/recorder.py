@@ -0,0 +1,87 @@
+"""Anonymising recorder of hook payloads into a replayable corpus."""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections.abc import Mapping, Sequence
+from pathlib import PurePath
+from typing import TYPE_CHECKING, ClassVar, final
+
+from flext_quality import c, p, r, t, u
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@final
+class FlextQualityHookRecorder:
+    """Append anonymised hook payloads to an NDJSON corpus file.
+
+    Identifiers and paths are replaced by short digests, so equal values
+    still compare equal and file suffixes still route rules. Only the
+    structural fields in ``HOOK_RECORD_KEPT_FIELDS``, such as the event and
+    tool name, are kept verbatim; every other string is masked character for
+    character, keeping payload sizes, and therefore parsing cost,
+    representative.
+    """
+
+    _lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(self, path: Path) -> None:
+        """Initialize the recorder over a corpus file."""
+        self._path = path
+
+    @property
+    def path(self) -> Path:
+        """The corpus file payloads are appended to."""
+        return self._path
+
+    @classmethod
+    def anonymise(cls, value: t.JsonValue, field: str = "") -> t.JsonValue:
+        """Return value with sensitive fields hashed or masked, recursively."""
+        if isinstance(value, Mapping):
+            return {key: cls.anonymise(item, key) for key, item in value.items()}
+        if isinstance(value, Sequence) and not isinstance(value, str):
+            return [cls.anonymise(item, field) for item in value]
+        if not isinstance(value, str) or field in c.Quality.HOOK_RECORD_KEPT_FIELDS:
+            return value
+        if field in c.Quality.HOOK_RECORD_HASHED_FIELDS:
+            digest = hashlib.blake2b(
+                value.encode(c.DEFAULT_ENCODING),
+                digest_size=c.Quality.HOOK_RECORD_DIGEST_SIZE,
+            ).hexdigest()
+            return digest + PurePath(value).suffix
+        return c.Quality.HOOK_RECORD_MASK_CHAR * len(value)
+
+    @staticmethod
+    def load(path: Path) -> p.Result[t.SequenceOf[bytes]]:
+        """Read the raw payloads of a corpus file, one per non-empty line."""
+        read = u.Cli.files_read_text(path)
+        if read.failure:
+            return r[t.SequenceOf[bytes]].fail(f"Cannot read corpus: {read.error}")
+        return r[t.SequenceOf[bytes]].ok([
+            line.encode(c.DEFAULT_ENCODING)
+            for line in read.value.splitlines()
+            if line.strip()
+        ])
+
+    def record(self, payload: t.JsonMapping) -> p.Result[bool]:
+        """Anonymise payload and append it to the corpus as one line."""
+        try:
+            line = t.json_mapping_adapter().dump_json({
+                key: self.anonymise(value, key) for key, value in payload.items()
+            })
+        except ValueError as exc:
+            return r[bool].fail(f"Failed to record hook payload: {exc}")
+        try:
+            with self._lock:
+                self._path.parent.mkdir(parents=True, exist_ok=True)
+                with self._path.open("ab") as handle:
+                    handle.write(line + b"\n")
+        except OSError as exc:
+            return r[bool].fail(f"Failed to record hook payload: {exc}")
+        return r[bool].ok(value=True)
+
+
+__all__: list[str] = ["FlextQualityHookRecorder"]
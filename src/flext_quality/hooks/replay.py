@@ -0,0 +1,145 @@
+"""Replay of a recorded hook corpus to measure hook throughput and latency."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+import time
+from typing import TYPE_CHECKING, final
+
+from flext_quality import FlextQualityLatencyHistogram, c, p, quality, r, t, u
+from flext_quality.hook_client import forward
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+
+@final
+class FlextQualityHookReplay:
+    """Feed recorded payloads through the hook pipeline and time each event.
+
+    Three modes mirror how hooks are deployed: a fresh interpreter per event
+    (``cold``), the package already imported in this process (``warm``) and
+    the resident hook server (``server``). Each mode times every payload,
+    including events that fail, such as events no hook handles, and reports
+    throughput, a latency summary in microseconds and the number of
+    ``failures``, so the modes measure the same work. Cold and warm replays
+    never append to the recorded corpus; a server records according to its
+    own settings.
+    """
+
+    def __init__(self, payloads: t.SequenceOf[bytes]) -> None:
+        """Initialize over raw payloads, e.g. from ``FlextQualityHookRecorder``."""
+        self._payloads = payloads
+
+    def cold(self, samples: int) -> p.Result[t.MappingKV[str, int | float]]:
+        """Replay the first samples payloads, each in a new interpreter.
+
+        Payloads are piped to the interpreter on stdin, as Claude Code does,
+        so their size is not limited by the argument length of a process,
+        and the response is written to stdout as the hook client does. An
+        empty response is a failed event.
+        """
+        with asyncio.Runner() as runner:
+            return self._measure(
+                lambda raw: runner.run(self._spawn(raw)), self._payloads[:samples]
+            )
+
+    def server(
+        self, socket_path: Path, rounds: int = 1
+    ) -> p.Result[t.MappingKV[str, int | float]]:
+        """Replay the corpus rounds times through a listening hook server.
+
+        An event the server answers with a hook error counts as a failure.
+        """
+
+        def run(raw: bytes) -> p.Result[bytes]:
+            response = forward(raw, str(socket_path))
+            if not response:
+                return r[bytes].fail(f"No hook server answered on {socket_path}")
+            return (
+                u
+                .try_(
+                    lambda: t.json_mapping_adapter().validate_json(response),
+                    catch=ValueError,
+                )
+                .map_error(lambda e: f"Invalid hook server answer: {e}")
+                .flat_map(FlextQualityHookReplay._answered)
+                .map(lambda _: response)
+            )
+
+        return self._measure(run, list(self._payloads) * rounds)
+
+    def warm(self, rounds: int = 1) -> p.Result[t.MappingKV[str, int | float]]:
+        """Replay the corpus rounds times through the in-process facade."""
+        return self._measure(
+            lambda raw: quality.process_hook_payload(raw, record=False),
+            list(self._payloads) * rounds,
+        )
+
+    @staticmethod
+    def _answered(output: t.JsonMapping) -> p.Result[t.JsonMapping]:
+        """Fail a hook server answer reporting a failed event."""
+        message = output.get("systemMessage")
+        if isinstance(message, str) and message.startswith(
+            c.Quality.HOOK_ERROR_MESSAGE_PREFIX
+        ):
+            return r[t.JsonMapping].fail(message)
+        return r[t.JsonMapping].ok(output)
+
+    @staticmethod
+    def _measure[T](
+        run: Callable[[bytes], p.Result[T]], payloads: t.SequenceOf[bytes]
+    ) -> p.Result[t.MappingKV[str, int | float]]:
+        """Run and time every payload, counting the failed ones."""
+        histogram = FlextQualityLatencyHistogram()
+        failures = 0
+        started = time.perf_counter()
+        for raw in payloads:
+            event_started = time.perf_counter()
+            result = run(raw)
+            histogram.record(time.perf_counter() - event_started)
+            failures += result.failure
+        elapsed = time.perf_counter() - started
+        return r[t.MappingKV[str, int | float]].ok({
+            **histogram.summary(),
+            "failures": failures,
+            "events_per_second": len(payloads) / elapsed if elapsed else 0.0,
+        })
+
+    @staticmethod
+    async def _spawn(raw: bytes) -> p.Result[bytes]:
+        """Run the cold replay program in a new interpreter fed raw on stdin."""
+        process = await asyncio.create_subprocess_exec(
+            sys.executable,
+            "-c",
+            c.Quality.HOOK_REPLAY_COLD_SCRIPT,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            env={**os.environ, c.Quality.HOOK_RECORD_PATH_ENV_VAR: ""},
+        )
+        try:
+            stdout, stderr = await asyncio.wait_for(
+                process.communicate(raw),
+                c.Quality.HOOK_TIMEOUT_MS / c.Quality.MS_TO_SECONDS_DIVISOR,
+            )
+        except TimeoutError:
+            process.kill()
+            await process.wait()
+            return r[bytes].fail(
+                f"Cold replay timed out after {c.Quality.HOOK_TIMEOUT_MS} ms"
+            )
+        if process.returncode:
+            return r[bytes].fail(
+                f"Cold replay exited with {process.returncode}: "
+                f"{stderr.decode(c.DEFAULT_ENCODING, errors='replace')}"
+            )
+        if not stdout:
+            return r[bytes].fail("Cold replay answered nothing")
+        return r[bytes].ok(stdout)
+
+
+__all__: list[str] = ["FlextQualityHookReplay"]
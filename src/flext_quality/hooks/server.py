@@ -0,0 +1,193 @@
+"""Resident hook server answering hook events over a Unix socket."""
+
+from __future__ import annotations
+
+import socket
+import socketserver
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, final, override
+
+from flext_quality import FlextQualitySettings, c, p, r, t
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+@final
+class FlextQualityHookServer:
+    """Serve hook events from a long-lived, fully imported process.
+
+    Each connection carries one raw hook payload, terminated by the client
+    shutting down its write side, and receives one JSON hook output. A
+    client that sends nothing for ``hook_read_timeout_ms`` is disconnected
+    unanswered, so it cannot pin a server thread or child. Hooks,
+    rules and caches stay warm between events, so a tool call only pays
+    for the socket round trip instead of a fresh interpreter and imports.
+
+    In ``FORK`` mode the server acts as a zygote: it never runs hooks itself
+    and forks a child per event instead, so each event starts from the same
+    pre-warmed copy-on-write heap and no state leaks between events. The
+    ``prewarm`` callable runs before the socket is bound so that loading,
+    e.g. of rules, happens once in the zygote rather than in every child.
+    Anything a child changes in memory is discarded with it, so in this mode
+    the hook circuit breaker (unless ``hook_breaker_state_path`` shares it
+    through a file), the pure hook result cache, the PostToolUse debouncer
+    and the latency histograms only ever see a single event.
+    """
+
+    class _Server(socketserver.ThreadingUnixStreamServer):
+        """Threading Unix stream server bound to its owning hook server."""
+
+        daemon_threads = True
+
+        def __init__(self, path: str, owner: FlextQualityHookServer) -> None:
+            """Bind to path and route requests to owner."""
+            self.owner = owner
+            super().__init__(path, FlextQualityHookServer._Handler)
+
+    class _ForkingServer(socketserver.ForkingMixIn, _Server):
+        """Server forking a short-lived child of the warm process per event."""
+
+    class _Handler(socketserver.StreamRequestHandler):
+        """Read one payload until EOF and write back the hook output."""
+
+        @override
+        def handle(self) -> None:
+            """Answer a single hook event."""
+            if not isinstance(self.server, FlextQualityHookServer._Server):
+                return
+            owner = self.server.owner
+            self.request.settimeout(owner.read_timeout_seconds)
+            try:
+                raw = self.rfile.read(owner.max_payload_bytes + 1)
+            except TimeoutError:
+                return
+            self.wfile.write(owner.respond(raw))
+
+    def __init__(
+        self,
+        processor: Callable[[bytes], p.Result[t.JsonMapping]],
+        socket_path: Path | None = None,
+        *,
+        mode: c.Quality.HookServerMode | None = None,
+        prewarm: Callable[[], object] | None = None,
+        read_timeout_ms: int | None = None,
+    ) -> None:
+        """Initialize the server around a raw-payload hook processor."""
+        settings = FlextQualitySettings.fetch_global()
+        self._processor = processor
+        self._prewarm = prewarm
+        self._max_payload_bytes = settings.Quality.hook_max_payload_bytes
+        self._read_timeout_seconds = (
+            read_timeout_ms or settings.Quality.hook_read_timeout_ms
+        ) / c.Quality.MS_TO_SECONDS_DIVISOR
+        self._socket_path = socket_path or Path(settings.Quality.hook_socket_path)
+        self._mode = mode or settings.Quality.hook_server_mode
+        self._server: FlextQualityHookServer._Server | None = None
+        self._ready = threading.Event()
+
+    @property
+    def max_payload_bytes(self) -> int:
+        """The largest payload accepted per event."""
+        return self._max_payload_bytes
+
+    @property
+    def read_timeout_seconds(self) -> float:
+        """How long a connection may stay silent before it is dropped."""
+        return self._read_timeout_seconds
+
+    @property
+    def socket_path(self) -> Path:
+        """The Unix socket the server listens on."""
+        return self._socket_path
+
+    def respond(self, raw: bytes) -> bytes:
+        """Process one raw payload into a newline-terminated JSON hook output.
+
+        Oversized payloads and processing errors fail open with a system
+        message, matching how a missing hook would behave.
+        """
+        if len(raw) > self._max_payload_bytes:
+            output: t.JsonMapping = {
+                "continue": True,
+                "systemMessage": "Hook payload too large for the hook server",
+            }
+        else:
+            result = self._processor(raw)
+            output = (
+                result.value
+                if result.success
+                else {
+                    "continue": True,
+                    "systemMessage": (
+                        f"{c.Quality.HOOK_ERROR_MESSAGE_PREFIX}{result.error}"
+                    ),
+                }
+            )
+        return t.json_mapping_adapter().dump_json(output) + b"\n"
+
+    def serve_forever(self) -> p.Result[bool]:
+        """Warm up, bind the socket and serve until ``shutdown`` is called.
+
+        A failed warm-up does not stop the server; whatever it could not
+        load is loaded again on first use.
+        """
+        if self._prewarm is not None:
+            self._prewarm()
+        bound = self._bind()
+        if bound.failure:
+            return r[bool].fail(bound.error)
+        server = bound.value
+        self._ready.set()
+        try:
+            server.serve_forever(
+                poll_interval=c.Quality.HOOK_SERVER_POLL_INTERVAL_SECONDS
+            )
+        finally:
+            server.server_close()
+            self._socket_path.unlink(missing_ok=True)
+            self._ready.clear()
+        return r[bool].ok(value=True)
+
+    def shutdown(self) -> None:
+        """Stop a running ``serve_forever`` loop."""
+        if self._server is not None:
+            self._server.shutdown()
+
+    def wait_ready(self, timeout: float | None = None) -> bool:
+        """Block until the socket accepts connections."""
+        return self._ready.wait(timeout)
+
+    def _bind(self) -> p.Result[FlextQualityHookServer._Server]:
+        """Bind the socket, replacing a stale one left by a dead server."""
+        if self._socket_path.exists():
+            if self._is_listening():
+                return r[FlextQualityHookServer._Server].fail(
+                    f"Hook server already running on {self._socket_path}"
+                )
+            self._socket_path.unlink()
+        try:
+            self._socket_path.parent.mkdir(parents=True, exist_ok=True)
+            server_cls = (
+                FlextQualityHookServer._ForkingServer
+                if self._mode is c.Quality.HookServerMode.FORK
+                else FlextQualityHookServer._Server
+            )
+            server = server_cls(str(self._socket_path), self)
+            self._socket_path.chmod(c.Quality.HOOK_SOCKET_MODE)
+        except OSError as exc:
+            return r[FlextQualityHookServer._Server].fail(
+                f"Cannot bind hook socket {self._socket_path}: {exc}"
+            )
+        self._server = server
+        return r[FlextQualityHookServer._Server].ok(server)
+
+    def _is_listening(self) -> bool:
+        """Check whether another server accepts connections on the socket."""
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+            try:
+                probe.connect(str(self._socket_path))
+            except OSError:
+                return False
+        return True
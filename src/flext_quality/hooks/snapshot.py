@@ -0,0 +1,59 @@
+"""Immutable compiled view of the hooks a manager dispatches to."""
+
+from __future__ import annotations
+
+from types import MappingProxyType
+from typing import TYPE_CHECKING, final
+
+from flext_quality import FlextQualityHookDispatchIndex
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping, MutableMapping, MutableSequence
+
+    from flext_quality import FlextQualityBaseHook, c, t
+
+
+@final
+class FlextQualityHookSnapshot:
+    """Hooks grouped per event, ordered and compiled into dispatch indexes.
+
+    A snapshot is never modified after construction. Managers replace it
+    as a whole when hooks are registered or the configuration changes, so
+    an event that started on one snapshot finishes on it undisturbed.
+    """
+
+    __slots__ = ("_hooks", "_indexes")
+
+    def __init__(self, hooks: Iterable[FlextQualityBaseHook]) -> None:
+        """Compile hooks, ordered by ``order`` and then by position."""
+        grouped: MutableMapping[
+            c.Quality.HookEvent, MutableSequence[FlextQualityBaseHook]
+        ] = {}
+        for hook in sorted(hooks, key=lambda hook: hook.order):
+            grouped.setdefault(hook.event, []).append(hook)
+        self._hooks: Mapping[
+            c.Quality.HookEvent, t.SequenceOf[FlextQualityBaseHook]
+        ] = MappingProxyType({
+            event: tuple(event_hooks) for event, event_hooks in grouped.items()
+        })
+        self._indexes: Mapping[c.Quality.HookEvent, FlextQualityHookDispatchIndex] = (
+            MappingProxyType({
+                event: FlextQualityHookDispatchIndex(event_hooks)
+                for event, event_hooks in self._hooks.items()
+            })
+        )
+
+    @property
+    def hooks(self) -> Mapping[c.Quality.HookEvent, t.SequenceOf[FlextQualityBaseHook]]:
+        """Hooks per event in dispatch order."""
+        return self._hooks
+
+    def match(
+        self, event: c.Quality.HookEvent, input_data: t.JsonMapping
+    ) -> t.SequenceOf[FlextQualityBaseHook]:
+        """Return the hooks of event that apply to input_data, in order."""
+        index = self._indexes.get(event)
+        return index.match(input_data) if index is not None else ()
+
+
+__all__: list[str] = ["FlextQualityHookSnapshot"]
@@ -8,6 +8,9 @@ from typing import TYPE_CHECKING
 from flext_core.lazy import build_lazy_import_map, install_lazy_exports
 
 if TYPE_CHECKING:
+    from .availability import (
+        FlextQualityAvailabilityCache as FlextQualityAvailabilityCache,
+    )
     from .claude_context import (
         FlextQualityClaudeContextClient as FlextQualityClaudeContextClient,
     )
@@ -16,12 +19,15 @@ if TYPE_CHECKING:
         FlextQualityCodeExecutionBridge as FlextQualityCodeExecutionBridge,
     )
     from .mcp_client import FlextQualityMcpClient as FlextQualityMcpClient
+    from .mcp_sessions import FlextQualityMcpSessionPool as FlextQualityMcpSessionPool
 
 _LAZY_MODULES: dict[str, tuple[str, ...]] = {
+    ".availability": ("FlextQualityAvailabilityCache",),
     ".claude_context": ("FlextQualityClaudeContextClient",),
     ".claude_mem": ("FlextQualityClaudeMemClient",),
     ".code_execution": ("FlextQualityCodeExecutionBridge",),
     ".mcp_client": ("FlextQualityMcpClient",),
+    ".mcp_sessions": ("FlextQualityMcpSessionPool",),
 }
 
 
@@ -33,10 +39,12 @@ _LAZY_IMPORTS = build_lazy_import_map(
 )
 
 _PUBLIC_EXPORTS: tuple[str, ...] = (
+    "FlextQualityAvailabilityCache",
     "FlextQualityClaudeContextClient",
     "FlextQualityClaudeMemClient",
     "FlextQualityCodeExecutionBridge",
     "FlextQualityMcpClient",
+    "FlextQualityMcpSessionPool",
 )
 
 __all__: tuple[str, ...] = tuple(_PUBLIC_EXPORTS)
@@ -0,0 +1,115 @@
+"""Shared TTL cache of integration executable availability.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+"""
+
+from __future__ import annotations
+
+import shutil
+import threading
+import time
+from typing import TYPE_CHECKING, ClassVar, final
+
+from flext_quality import FlextQualitySettings, c, t
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, MutableMapping
+
+
+@final
+class FlextQualityAvailabilityCache:
+    """Remember whether integration executables are on PATH.
+
+    ``shutil.which`` scans every PATH entry, so each lookup is cached for
+    ``ttl_seconds`` and shared by all integration clients through
+    ``fetch_global``. Long-running processes can call ``start_reprobe`` so
+    known executables are re-checked in the background and reads never
+    wait on a PATH scan.
+    """
+
+    _global: ClassVar[FlextQualityAvailabilityCache | None] = None
+    "Process-wide cache shared by the integration clients."
+    _global_lock: ClassVar[threading.Lock] = threading.Lock()
+    "Guards creation of the process-wide cache."
+
+    def __init__(
+        self,
+        ttl_seconds: float,
+        *,
+        which: Callable[[str], str | None] = shutil.which,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize an empty cache keeping each probe for ttl_seconds."""
+        self._ttl = ttl_seconds
+        self._which = which
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._probes: MutableMapping[str, tuple[bool, float]] = {}
+        self._stop = threading.Event()
+        self._reprobe: threading.Thread | None = None
+
+    @classmethod
+    def fetch_global(cls) -> FlextQualityAvailabilityCache:
+        """Return the process-wide cache, creating it from settings once."""
+        with cls._global_lock:
+            if cls._global is None:
+                settings = FlextQualitySettings.fetch_global()
+                cls._global = cls(settings.Quality.integration_probe_ttl_seconds)
+            return cls._global
+
+    def available(self, executable: str) -> bool:
+        """Return whether executable is on PATH, probing it when stale."""
+        with self._lock:
+            probe = self._probes.get(executable)
+        if probe is not None and self._clock() < probe[1]:
+            return probe[0]
+        return self._probe(executable)
+
+    def refresh(self, executable: str | None = None) -> t.MappingKV[str, bool]:
+        """Probe executable, or every known one, again right now."""
+        with self._lock:
+            executables = list(self._probes) if executable is None else [executable]
+        return {name: self._probe(name) for name in executables}
+
+    def snapshot(self) -> t.MappingKV[str, bool]:
+        """Return the last known availability of every probed executable."""
+        with self._lock:
+            return {name: probe[0] for name, probe in self._probes.items()}
+
+    def start_reprobe(self, interval_seconds: float) -> None:
+        """Re-probe known executables every interval_seconds in the background."""
+        with self._lock:
+            if self._reprobe is not None or interval_seconds <= 0:
+                return
+            self._stop.clear()
+            self._reprobe = threading.Thread(
+                target=self._run_reprobe,
+                args=(interval_seconds,),
+                name=c.Quality.INTEGRATION_REPROBE_THREAD_NAME,
+                daemon=True,
+            )
+            self._reprobe.start()
+
+    def stop_reprobe(self) -> None:
+        """Stop the background re-probe thread, if running."""
+        self._stop.set()
+        with self._lock:
+            reprobe, self._reprobe = self._reprobe, None
+        if reprobe is not None:
+            reprobe.join()
+
+    def _probe(self, executable: str) -> bool:
+        """Scan PATH for executable and cache the answer."""
+        found = self._which(executable) is not None
+        with self._lock:
+            self._probes[executable] = (found, self._clock() + self._ttl)
+        return found
+
+    def _run_reprobe(self, interval_seconds: float) -> None:
+        """Refresh every known executable until stopped."""
+        while not self._stop.wait(interval_seconds):
+            self.refresh()
+
+
+__all__: list[str] = ["FlextQualityAvailabilityCache"]
@@ -11,7 +11,7 @@ from __future__ import annotations
 
 from typing import final
 
-from flext_quality import FlextQualityMcpClient, c, m, p, t
+from flext_quality import FlextQualityMcpClient, FlextQualityMcpSessionPool, c, m, p, t
 
 
 @final
@@ -19,12 +19,18 @@ class FlextQualityClaudeContextClient:
     """Client for claude-context MCP server integration.
 
     Provides semantic code search via the claude-context server.
-    Uses mcp-cli for server communication.
+    Uses mcp-cli for server communication, or a persistent session when a
+    transport for the server is configured.
     """
 
-    def __init__(self, *, timeout_ms: int | None = None) -> None:
+    def __init__(
+        self,
+        *,
+        timeout_ms: int | None = None,
+        sessions: FlextQualityMcpSessionPool | None = None,
+    ) -> None:
         """Initialize the Claude Context client."""
-        self._mcp = FlextQualityMcpClient(timeout_ms=timeout_ms)
+        self._mcp = FlextQualityMcpClient(timeout_ms=timeout_ms, sessions=sessions)
 
     def build_index_call(
         self, path: str | None = None
@@ -67,6 +73,12 @@ class FlextQualityClaudeContextClient:
             self._mcp.build_call_command
         )
 
+    def search(
+        self, query: str, *, limit: int | None = None
+    ) -> p.Result[m.Quality.McpToolResult]:
+        """Run a code search over the pooled claude-context session."""
+        return self.build_search_call(query, limit=limit).flat_map(self._mcp.call_tool)
+
     def health_check(self) -> p.Result[t.JsonMapping]:
         """Check if claude-context is available."""
         return self._mcp.build_server_health_result(
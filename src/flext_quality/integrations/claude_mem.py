@@ -11,7 +11,7 @@ from __future__ import annotations
 
 from typing import final
 
-from flext_quality import FlextQualityMcpClient, c, m, p, t
+from flext_quality import FlextQualityMcpClient, FlextQualityMcpSessionPool, c, m, p, t
 
 
 @final
@@ -19,12 +19,18 @@ class FlextQualityClaudeMemClient:
     """Client for claude-mem MCP server integration.
 
     Provides cross-session memory search via the claude-mem server.
-    Uses mcp-cli for server communication.
+    Uses mcp-cli for server communication, or a persistent session when a
+    transport for the server is configured.
     """
 
-    def __init__(self, *, timeout_ms: int | None = None) -> None:
+    def __init__(
+        self,
+        *,
+        timeout_ms: int | None = None,
+        sessions: FlextQualityMcpSessionPool | None = None,
+    ) -> None:
         """Initialize the Claude Mem client."""
-        self._mcp = FlextQualityMcpClient(timeout_ms=timeout_ms)
+        self._mcp = FlextQualityMcpClient(timeout_ms=timeout_ms, sessions=sessions)
 
     def build_get_observations_call(
         self, ids: t.SequenceOf[int]
@@ -93,6 +99,12 @@ class FlextQualityClaudeMemClient:
             anchor, depth_before=before, depth_after=after
         ).flat_map(self._mcp.build_call_command)
 
+    def search(
+        self, query: str, *, limit: int | None = None
+    ) -> p.Result[m.Quality.McpToolResult]:
+        """Run a memory search over the pooled claude-mem session."""
+        return self.build_search_call(query, limit=limit).flat_map(self._mcp.call_tool)
+
     def health_check(self) -> p.Result[t.JsonMapping]:
         """Check if claude-mem is available."""
         return self._mcp.build_server_health_result(c.Quality.CLAUDE_MEM_SERVER_NAME)
@@ -12,7 +12,7 @@ from __future__ import annotations
 from pathlib import Path
 from typing import final
 
-from flext_quality import c, e, m, p, r, t
+from flext_quality import FlextQualityAvailabilityCache, c, e, m, p, r, t
 
 
 @final
@@ -25,11 +25,18 @@ class FlextQualityCodeExecutionBridge:
     """
 
     def __init__(
-        self, *, timeout_ms: int | None = None, working_dir: Path | None = None
+        self,
+        *,
+        timeout_ms: int | None = None,
+        working_dir: Path | None = None,
+        availability: FlextQualityAvailabilityCache | None = None,
     ) -> None:
         """Initialize the code execution bridge."""
         self._timeout_ms = timeout_ms or c.Quality.INTEGRATION_TIMEOUT_MS
         self._working_dir = working_dir or Path.cwd()
+        self._availability = (
+            availability or FlextQualityAvailabilityCache.fetch_global()
+        )
 
     def build_basedpyright_command(self, target_path: Path) -> p.Result[t.StrSequence]:
         """Build command for basedpyright type checker."""
@@ -89,8 +96,8 @@ class FlextQualityCodeExecutionBridge:
     def health_check(self) -> p.Result[t.JsonMapping]:
         """Check availability of execution runtimes.
 
-        Returns configuration status - actual runtime checks
-        should be done via shell wrapper execution.
+        Returns configuration status with whether each runtime executable
+        was on PATH when last probed; running it is left to shell wrappers.
         """
         return r[t.JsonMapping].ok({
             "status": c.Quality.IntegrationStatus.CONNECTED,
@@ -98,4 +105,10 @@ class FlextQualityCodeExecutionBridge:
             "working_dir": str(self._working_dir),
             "timeout_ms": self._timeout_ms,
             "supported_runtimes": ["python", "typescript", "ruff", "basedpyright"],
+            "runtimes_available": {
+                runtime: self._availability.available(executable)
+                for runtime, executable in (
+                    c.Quality.CODE_EXECUTION_RUNTIME_EXECUTABLES.items()
+                )
+            },
         })
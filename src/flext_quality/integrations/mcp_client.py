@@ -9,13 +9,14 @@ SPDX-License-Identifier: MIT
 
 from __future__ import annotations
 
-import shutil
 from collections.abc import Mapping, MutableSequence
 from typing import final
 
 from flext_core import e, r
 from flext_quality import (
+    FlextQualityAvailabilityCache,
     FlextQualityConstants as c,
+    FlextQualityMcpSessionPool,
     FlextQualityModels as m,
     FlextQualityProtocols as p,
     FlextQualityTypes as t,
@@ -28,18 +29,32 @@ class FlextQualityMcpClient:
 
     Uses mcp-cli for actual server communication.
     Provides unified error handling and result parsing.
+    Whether mcp-cli is installed is looked up in the shared
+    ``FlextQualityAvailabilityCache`` rather than on every call. Servers
+    with a transport in ``FlextQualityMcpSessionPool`` are called directly
+    over a persistent session by ``call_tool``.
     """
 
-    def __init__(self, *, timeout_ms: int | None = None) -> None:
+    def __init__(
+        self,
+        *,
+        timeout_ms: int | None = None,
+        availability: FlextQualityAvailabilityCache | None = None,
+        sessions: FlextQualityMcpSessionPool | None = None,
+    ) -> None:
         """Initialize the MCP client."""
         self._timeout_ms = timeout_ms or c.Quality.MCP_TIMEOUT_MS
+        self._availability = (
+            availability or FlextQualityAvailabilityCache.fetch_global()
+        )
+        self._sessions = sessions or FlextQualityMcpSessionPool.fetch_global()
 
     def build_call_command(
         self, call: m.Quality.McpToolCall
     ) -> p.Result[t.StrSequence]:
         """Build the mcp-cli command for a tool call."""
         if not self.is_mcp_cli_available():
-            return e.fail_not_found("executable", "mcp-cli")
+            return e.fail_not_found("executable", c.Quality.MCP_CLI_EXECUTABLE)
         tool_path = f"{call.server}/{call.tool}"
         params_json = t.json_mapping_adapter().dump_json(call.params).decode("utf-8")
         return r[t.StrSequence].ok(["mcp-cli", "call", tool_path, params_json])
@@ -47,10 +62,29 @@ class FlextQualityMcpClient:
     def build_info_command(self, server: str, tool: str) -> p.Result[t.StrSequence]:
         """Build the mcp-cli info command for a tool."""
         if not self.is_mcp_cli_available():
-            return e.fail_not_found("executable", "mcp-cli")
+            return e.fail_not_found("executable", c.Quality.MCP_CLI_EXECUTABLE)
         tool_path = f"{server}/{tool}"
         return r[t.StrSequence].ok(["mcp-cli", "info", tool_path])
 
+    async def acall_tool(
+        self, call: m.Quality.McpToolCall
+    ) -> p.Result[m.Quality.McpToolResult]:
+        """Call a tool over its pooled session from a running event loop."""
+        executed = await self._sessions.acall(call, timeout_ms=self._timeout_ms)
+        return executed.flat_map(self._parse_execution)
+
+    def call_tool(
+        self, call: m.Quality.McpToolCall
+    ) -> p.Result[m.Quality.McpToolResult]:
+        """Call a tool over the pooled session of its server.
+
+        Fails when no session transport is configured for the server; the
+        ``mcp-cli`` command from ``build_call_command`` still works then.
+        """
+        return self._sessions.call(call, timeout_ms=self._timeout_ms).flat_map(
+            self._parse_execution
+        )
+
     def build_tool_call(
         self, server: str, tool: str, params: t.JsonMapping | None = None
     ) -> p.Result[m.Quality.McpToolCall]:
@@ -98,8 +132,8 @@ class FlextQualityMcpClient:
         })
 
     def is_mcp_cli_available(self) -> bool:
-        """Check if mcp-cli is available in PATH."""
-        return shutil.which("mcp-cli") is not None
+        """Check if mcp-cli is available in PATH, as last probed."""
+        return self._availability.available(c.Quality.MCP_CLI_EXECUTABLE)
 
     def _build_object_result(
         self, parsed: t.JsonMapping
@@ -143,6 +177,12 @@ class FlextQualityMcpClient:
             )
         )
 
+    def _parse_execution(
+        self, executed: m.Quality.ExecutionResult
+    ) -> p.Result[m.Quality.McpToolResult]:
+        """Parse the output of a pooled call like ``mcp-cli`` output."""
+        return self.parse_result(executed.stdout, executed.exit_code)
+
     def _build_raw_result(self, output: str) -> p.Result[m.Quality.McpToolResult]:
         """Build an MCP tool result preserving raw output."""
         return r[m.Quality.McpToolResult].ok(
@@ -0,0 +1,310 @@
+"""Pool of persistent MCP client sessions shared by integration clients.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+"""
+
+from __future__ import annotations
+
+import asyncio
+import shlex
+import threading
+from contextlib import AsyncExitStack
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from pathlib import Path
+from typing import TYPE_CHECKING, ClassVar, final
+
+from fastmcp import Client, FastMCP
+from fastmcp.exceptions import ClientError, FastMCPError
+from mcp.shared.exceptions import McpError
+from mcp.types import TextContent
+
+from flext_quality import FlextQualitySettings, c, m, p, r, t
+
+if TYPE_CHECKING:
+    from collections.abc import Coroutine, Mapping, MutableMapping
+
+    from fastmcp.client.transports import ClientTransport
+
+    type McpTransport = ClientTransport | FastMCP | str
+
+
+@final
+class FlextQualityMcpSessionPool:
+    """Keep one open MCP session per server and share it between callers.
+
+    Sessions run on a private event loop thread, so synchronous callers can
+    use ``call`` and asynchronous ones ``acall``. Each server is connected
+    on first use and the handshake is paid once; concurrent calls to the
+    same server are multiplexed over its session by request id. A session
+    that fails is dropped and reconnected by the next call.
+
+    Transports are anything ``fastmcp.Client`` accepts: an HTTP URL, a
+    ``.py``/``.js`` server script, a ``FastMCP`` instance for in-process
+    servers, or a command line started over stdio.
+    """
+
+    _global: ClassVar[FlextQualityMcpSessionPool | None] = None
+    "Process-wide pool shared by the integration clients."
+    _global_lock: ClassVar[threading.Lock] = threading.Lock()
+    "Guards creation of the process-wide pool."
+
+    def __init__(
+        self,
+        transports: Mapping[str, McpTransport] | None = None,
+        *,
+        timeout_ms: int | None = None,
+    ) -> None:
+        """Initialize the pool with transports keyed by server name."""
+        self._transports: MutableMapping[str, McpTransport] = dict(transports or {})
+        self._timeout = (
+            timeout_ms or c.Quality.MCP_TIMEOUT_MS
+        ) / c.Quality.MS_TO_SECONDS_DIVISOR
+        self._lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._sessions: MutableMapping[str, Client] = {}
+        self._exits: MutableMapping[str, AsyncExitStack] = {}
+        self._connecting: MutableMapping[str, asyncio.Lock] = {}
+
+    def __len__(self) -> int:
+        """Return the number of open sessions."""
+        return len(self._sessions)
+
+    @classmethod
+    def fetch_global(cls) -> FlextQualityMcpSessionPool:
+        """Return the process-wide pool, configured from settings once."""
+        with cls._global_lock:
+            if cls._global is None:
+                settings = FlextQualitySettings.fetch_global()
+                configured = {
+                    c.Quality.CLAUDE_MEM_SERVER_NAME: (
+                        settings.Quality.claude_mem_mcp_transport
+                    ),
+                    c.Quality.CLAUDE_CONTEXT_SERVER_NAME: (
+                        settings.Quality.claude_context_mcp_transport
+                    ),
+                }
+                cls._global = cls({
+                    server: spec for server, spec in configured.items() if spec
+                })
+            return cls._global
+
+    async def acall(
+        self, call: m.Quality.McpToolCall, *, timeout_ms: int | None = None
+    ) -> p.Result[m.Quality.ExecutionResult]:
+        """Call a tool from any event loop without blocking it.
+
+        ``timeout_ms`` bounds this call instead of the pool timeout.
+        """
+        if not self.serves(call.server):
+            return self._not_configured(call.server)
+        timeout = self._seconds(timeout_ms)
+        future = asyncio.run_coroutine_threadsafe(
+            self._call(call, timeout), self._ensure_loop()
+        )
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+        except TimeoutError:
+            return r[m.Quality.ExecutionResult].fail(
+                f"MCP call {call.server}/{call.tool} timed out"
+            )
+
+    def call(
+        self, call: m.Quality.McpToolCall, *, timeout_ms: int | None = None
+    ) -> p.Result[m.Quality.ExecutionResult]:
+        """Call a tool over the pooled session of its server.
+
+        The tool output is returned as ``stdout`` with a non-zero exit code
+        when the tool reported an error, as ``mcp-cli`` would. ``timeout_ms``
+        bounds this call instead of the pool timeout. Blocking on the pool
+        loop from its own thread would never return, so such calls fail;
+        code running there uses ``acall``.
+        """
+        if not self.serves(call.server):
+            return self._not_configured(call.server)
+        if self._on_loop_thread():
+            return r[m.Quality.ExecutionResult].fail(
+                f"MCP call {call.server}/{call.tool} blocks the session loop; use acall"
+            )
+        timeout = self._seconds(timeout_ms)
+        future = asyncio.run_coroutine_threadsafe(
+            self._call(call, timeout), self._ensure_loop()
+        )
+        try:
+            return future.result(timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            return r[m.Quality.ExecutionResult].fail(
+                f"MCP call {call.server}/{call.tool} timed out"
+            )
+
+    def close(self) -> None:
+        """Close every session and stop the event loop thread."""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None or thread is None:
+            return
+        closing = asyncio.run_coroutine_threadsafe(self._close_sessions(), loop)
+        try:
+            closing.result(self._timeout)
+        except FutureTimeoutError:
+            closing.cancel()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(self._timeout)
+
+    def register(self, server: str, transport: McpTransport) -> p.Result[bool]:
+        """Route calls to server over transport, replacing any open session.
+
+        Fails on the pool loop thread, which cannot wait for the old session
+        to close.
+        """
+        if self._on_loop_thread():
+            return r[bool].fail(
+                f"Cannot register MCP server {server} from the session loop"
+            )
+        with self._lock:
+            self._transports[server] = transport
+            loop = self._loop
+        if loop is not None:
+            self._run(self._drop(server), loop)
+        return r[bool].ok(value=True)
+
+    def serves(self, server: str) -> bool:
+        """Return whether a transport is configured for server."""
+        with self._lock:
+            return server in self._transports
+
+    async def _call(
+        self, call: m.Quality.McpToolCall, seconds: float
+    ) -> p.Result[m.Quality.ExecutionResult]:
+        """Run the tool call on the pool loop, bounding it to seconds."""
+        try:
+            session = await self._session(call.server)
+            result = await session.call_tool(
+                call.tool, dict(call.params), timeout=seconds, raise_on_error=False
+            )
+        except (
+            ClientError,
+            FastMCPError,
+            McpError,
+            OSError,
+            RuntimeError,
+            ValueError,
+        ) as exc:
+            await self._drop(call.server)
+            return r[m.Quality.ExecutionResult].fail(
+                f"MCP call {call.server}/{call.tool} failed: {exc}"
+            )
+        output = "\n".join(
+            block.text for block in result.content if isinstance(block, TextContent)
+        )
+        return r[m.Quality.ExecutionResult].ok(
+            m.Quality.ExecutionResult(
+                success=not result.is_error,
+                exit_code=1 if result.is_error else 0,
+                stdout=output,
+            )
+        )
+
+    async def _close_sessions(self) -> None:
+        """Close every open session."""
+        for server in list(self._sessions):
+            await self._drop(server)
+
+    async def _drop(self, server: str) -> None:
+        """Close and forget the session of server, if open."""
+        self._sessions.pop(server, None)
+        exits = self._exits.pop(server, None)
+        if exits is not None:
+            try:
+                await exits.aclose()
+            except (ClientError, FastMCPError, McpError, OSError, RuntimeError):
+                return
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        """Start the event loop thread holding the sessions once."""
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=self._run_loop,
+                    args=(loop,),
+                    name=c.Quality.MCP_SESSIONS_THREAD_NAME,
+                    daemon=True,
+                )
+                self._thread.start()
+                self._loop = loop
+            return self._loop
+
+    @staticmethod
+    def _not_configured(server: str) -> p.Result[m.Quality.ExecutionResult]:
+        """Fail a call to a server without a configured transport."""
+        return r[m.Quality.ExecutionResult].fail(
+            f"No MCP session transport configured for {server}"
+        )
+
+    def _on_loop_thread(self) -> bool:
+        """Return whether the caller runs on the pool event loop thread."""
+        return self._thread is not None and threading.current_thread() is self._thread
+
+    def _run(
+        self, coroutine: Coroutine[None, None, None], loop: asyncio.AbstractEventLoop
+    ) -> None:
+        """Run coroutine on the pool loop and wait for it."""
+        future = asyncio.run_coroutine_threadsafe(coroutine, loop)
+        try:
+            future.result(self._timeout)
+        except FutureTimeoutError:
+            future.cancel()
+
+    @staticmethod
+    def _run_loop(loop: asyncio.AbstractEventLoop) -> None:
+        """Serve the pool event loop until it is stopped."""
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_forever()
+        finally:
+            loop.close()
+
+    def _seconds(self, timeout_ms: int | None) -> float:
+        """Return timeout_ms in seconds, or the pool timeout when unset."""
+        if timeout_ms is None:
+            return self._timeout
+        return timeout_ms / c.Quality.MS_TO_SECONDS_DIVISOR
+
+    async def _session(self, server: str) -> Client:
+        """Return the open session of server, connecting it once."""
+        connecting = self._connecting.setdefault(server, asyncio.Lock())
+        async with connecting:
+            session = self._sessions.get(server)
+            if session is None or not session.is_connected():
+                with self._lock:
+                    transport = self._transports[server]
+                await self._drop(server)
+                exits = AsyncExitStack()
+                session = await exits.enter_async_context(
+                    Client(self._transport(transport), timeout=self._timeout)
+                )
+                self._sessions[server] = session
+                self._exits[server] = exits
+            return session
+
+    @staticmethod
+    def _transport(
+        transport: McpTransport,
+    ) -> ClientTransport | FastMCP | str | t.JsonMapping:
+        """Turn a command line into a stdio server config for ``Client``."""
+        if (
+            not isinstance(transport, str)
+            or c.Quality.URL_SCHEME_SEPARATOR in transport
+        ):
+            return transport
+        command, *args = shlex.split(transport)
+        if not args and Path(command).suffix in c.Quality.MCP_SCRIPT_SUFFIXES:
+            return command
+        return {"mcpServers": {"default": {"command": command, "args": args}}}
+
+
+__all__: list[str] = ["FlextQualityMcpSessionPool"]
@@ -8,11 +8,13 @@ from typing import TYPE_CHECKING
 from flext_core.lazy import build_lazy_import_map, install_lazy_exports
 
 if TYPE_CHECKING:
+    from .cache import FlextQualityMcpResourceCache as FlextQualityMcpResourceCache
     from .resources import FlextQualityMcpResources as FlextQualityMcpResources
     from .server import FlextQualityMcpServer as FlextQualityMcpServer
     from .tools import FlextQualityMcpTools as FlextQualityMcpTools
 
 _LAZY_MODULES: dict[str, tuple[str, ...]] = {
+    ".cache": ("FlextQualityMcpResourceCache",),
     ".resources": ("FlextQualityMcpResources",),
     ".server": ("FlextQualityMcpServer",),
     ".tools": ("FlextQualityMcpTools",),
@@ -27,6 +29,7 @@ _LAZY_IMPORTS = build_lazy_import_map(
 )
 
 _PUBLIC_EXPORTS: tuple[str, ...] = (
+    "FlextQualityMcpResourceCache",
     "FlextQualityMcpResources",
     "FlextQualityMcpServer",
     "FlextQualityMcpTools",
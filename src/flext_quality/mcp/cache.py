@@ -0,0 +1,155 @@
+"""In-memory cache for MCP resources invalidated by a polling file watcher."""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import TYPE_CHECKING, final
+
+from flext_quality import c
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, MutableMapping, MutableSequence
+    from pathlib import Path
+
+
+@final
+class FlextQualityMcpResourceCache:
+    """Serve rendered MCP resources from memory until their inputs change.
+
+    Watched entries are dropped by a daemon thread that polls the stat
+    signature of their files every ``poll_seconds``; a directory counts as
+    changed when any of its direct entries is added, removed or modified.
+    Entries without watched paths expire after ``ttl_seconds`` instead.
+    An entry built for another ``version`` of its in-memory inputs is
+    rebuilt on read. A read of an unchanged resource never touches the
+    filesystem, and a build that raises caches nothing.
+    """
+
+    def __init__(
+        self, poll_seconds: float, *, clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        """Initialize an empty cache; the watcher starts with the first entry."""
+        self._poll_seconds = poll_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._values: MutableMapping[str, str] = {}
+        self._expires: MutableMapping[str, float] = {}
+        self._watched: MutableMapping[str, tuple[Path, ...]] = {}
+        self._signatures: MutableMapping[str, tuple[object, ...]] = {}
+        self._versions: MutableMapping[str, object] = {}
+        self._stop = threading.Event()
+        self._watcher: threading.Thread | None = None
+
+    def __len__(self) -> int:
+        """Return the number of cached resources."""
+        return len(self._values)
+
+    def close(self) -> None:
+        """Stop the watcher thread and drop every entry."""
+        self._stop.set()
+        if self._watcher is not None:
+            self._watcher.join(self._poll_seconds * 2)
+        self.invalidate()
+
+    def get(
+        self,
+        key: str,
+        build: Callable[[], str],
+        *,
+        watch: tuple[Path, ...] = (),
+        ttl_seconds: float | None = None,
+        version: object = None,
+    ) -> str:
+        """Return the cached resource key, building it on a miss.
+
+        Args:
+            key: Resource identifier, e.g. its URI
+            build: Renders the resource
+            watch: Files or directories whose changes invalidate the entry
+            ttl_seconds: Lifetime of an entry without watched paths
+            version: Identity of in-memory inputs; a change rebuilds the entry
+
+        """
+        with self._lock:
+            cached = self._values.get(key)
+            expires = self._expires.get(key)
+            if (
+                cached is not None
+                and (expires is None or self._clock() < expires)
+                and self._versions.get(key) == version
+            ):
+                return cached
+        signature = self._signature(watch)
+        value = build()
+        with self._lock:
+            self._values[key] = value
+            self._versions[key] = version
+            if watch:
+                self._watched[key] = watch
+                self._signatures[key] = signature
+                self._expires.pop(key, None)
+            elif ttl_seconds is not None:
+                self._expires[key] = self._clock() + ttl_seconds
+        if watch:
+            self._ensure_watcher()
+        return value
+
+    def invalidate(self, key: str | None = None) -> None:
+        """Drop one cached resource, or all of them."""
+        with self._lock:
+            keys = list(self._values) if key is None else [key]
+            for name in keys:
+                self._values.pop(name, None)
+                self._versions.pop(name, None)
+                self._expires.pop(name, None)
+                self._watched.pop(name, None)
+                self._signatures.pop(name, None)
+
+    def poll(self) -> None:
+        """Drop watched entries whose files changed since they were built."""
+        with self._lock:
+            watched = dict(self._watched)
+        for key, paths in watched.items():
+            signature = self._signature(paths)
+            with self._lock:
+                if self._watched.get(key) == paths and (
+                    self._signatures.get(key) != signature
+                ):
+                    self._values.pop(key, None)
+                    self._watched.pop(key, None)
+                    self._signatures.pop(key, None)
+
+    def _ensure_watcher(self) -> None:
+        """Start the polling thread once."""
+        with self._lock:
+            if self._watcher is not None or self._stop.is_set():
+                return
+            self._watcher = threading.Thread(
+                target=self._watch, name=c.Quality.MCP_WATCHER_THREAD_NAME, daemon=True
+            )
+            self._watcher.start()
+
+    @staticmethod
+    def _signature(paths: tuple[Path, ...]) -> tuple[object, ...]:
+        """Return the stat signature of paths and of directory entries."""
+        signature: MutableSequence[object] = []
+        for path in paths:
+            try:
+                signature.append((str(path), path.stat().st_mtime_ns))
+                if path.is_dir():
+                    signature.extend(
+                        (entry.name, entry.stat().st_mtime_ns)
+                        for entry in sorted(path.iterdir())
+                    )
+            except OSError:
+                signature.append((str(path), None))
+        return tuple(signature)
+
+    def _watch(self) -> None:
+        """Poll watched paths until the cache is closed."""
+        while not self._stop.wait(self._poll_seconds):
+            self.poll()
+
+
+__all__: list[str] = ["FlextQualityMcpResourceCache"]
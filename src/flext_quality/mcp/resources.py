@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
+from pathlib import Path
+
+from fastmcp.exceptions import ResourceError
+
 from flext_quality import (
     FlextQualityClaudeContextClient,
     FlextQualityClaudeMemClient,
-    FlextQualityHookManager,
-    FlextQualityRulesEngine,
+    FlextQualitySettings,
     c,
+    quality,
     t,
     u,
 )
@@ -17,42 +21,71 @@ _mcp = FlextQualityMcpServer.get_server()
 
 
 class FlextQualityMcpResources:
-    """MCP resources namespace for flext-quality."""
+    """MCP resources namespace for flext-quality.
+
+    Settings and status resources are rendered once and served from memory;
+    see ``FlextQualityMcpResourceCache`` for when they are rebuilt.
+    """
 
     @_mcp.resource("settings://hooks")
     @staticmethod
     def get_hooks_config() -> str:
-        """Get current hooks configuration."""
-        manager = FlextQualityHookManager()
-        settings = manager.fetch_config()
-        config_json: str = (
+        """Get current hooks configuration, rebuilt when hooks or their file change."""
+        config_path = FlextQualitySettings.fetch_global().Quality.hook_config_path
+        return FlextQualityMcpServer.get_resource_cache().get(
+            "settings://hooks",
+            FlextQualityMcpResources._render_hooks,
+            watch=(Path(config_path),) if config_path else (),
+            version=quality.fetch_hook_generation(),
+        )
+
+    @_mcp.resource("metrics://hooks")
+    @staticmethod
+    def get_hook_metrics() -> str:
+        """Get hook latency percentiles and outcome counters."""
+        metrics = quality.fetch_hook_metrics()
+        metrics_json: str = (
             t
             .json_mapping_adapter()
-            .dump_json(settings, indent=c.Quality.JSON_INDENT)
+            .dump_json(metrics.value, indent=c.Quality.JSON_INDENT)
             .decode("utf-8")
         )
-        return config_json
+        return metrics_json
 
     @_mcp.resource("settings://rules")
     @staticmethod
     def get_rules_config() -> str:
-        """Get current rules configuration."""
-        engine = FlextQualityRulesEngine()
-        rules = engine.get_rules()
-        rules_json: str = (
-            t
-            .json_mapping_sequence_adapter()
-            .dump_json(
-                [rule.model_dump() for rule in rules], indent=c.Quality.JSON_INDENT
-            )
-            .decode("utf-8")
+        """Get current rules configuration, rebuilt when a rules file changes."""
+        rules_dir = FlextQualitySettings.fetch_global().Quality.rules_dir
+        return FlextQualityMcpServer.get_resource_cache().get(
+            "settings://rules",
+            FlextQualityMcpResources._render_rules,
+            watch=(quality.fetch_rules_path(), Path(rules_dir)),
         )
-        return rules_json
 
     @_mcp.resource("status://integrations")
     @staticmethod
     def get_integrations_status() -> str:
-        """Get status of all integrations."""
+        """Get status of all integrations, cached for a short time."""
+        ttl_seconds = FlextQualitySettings.fetch_global().Quality.mcp_status_ttl_seconds
+        return FlextQualityMcpServer.get_resource_cache().get(
+            "status://integrations",
+            FlextQualityMcpResources._render_integrations_status,
+            ttl_seconds=ttl_seconds,
+        )
+
+    @staticmethod
+    def _render_hooks() -> str:
+        """Render the hooks configuration, failing the read if it cannot be."""
+        config = quality.fetch_hook_config_json()
+        if config.failure:
+            msg = f"Cannot render hooks configuration: {config.error}"
+            raise ResourceError(msg)
+        return config.value
+
+    @staticmethod
+    def _render_integrations_status() -> str:
+        """Probe every integration and render their health as JSON."""
         mem_client = FlextQualityClaudeMemClient()
         mem_health = mem_client.health_check()
         mem_status = (
@@ -76,5 +109,20 @@ class FlextQualityMcpResources:
         )
         return status_json
 
+    @staticmethod
+    def _render_rules() -> str:
+        """Render the loaded rules as JSON."""
+        loaded = quality.fetch_rules()
+        rules = loaded.value if loaded.success else []
+        rules_json: str = (
+            t
+            .json_mapping_sequence_adapter()
+            .dump_json(
+                [rule.model_dump() for rule in rules], indent=c.Quality.JSON_INDENT
+            )
+            .decode("utf-8")
+        )
+        return rules_json
+
 
 __all__: list[str] = ["FlextQualityMcpResources"]
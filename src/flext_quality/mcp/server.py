@@ -2,16 +2,72 @@
 
 from __future__ import annotations
 
+import asyncio
+import threading
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, ClassVar
+
 from fastmcp import FastMCP
 
-from flext_quality import c
+from flext_quality import (
+    FlextQualityAvailabilityCache,
+    FlextQualityMcpResourceCache,
+    FlextQualitySettings,
+    c,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator
+
+
+@asynccontextmanager
+async def _lifespan(_server: FastMCP) -> AsyncGenerator[None]:
+    """Re-probe integrations while the server runs and release caches after."""
+    availability = FlextQualityAvailabilityCache.fetch_global()
+    availability.start_reprobe(
+        FlextQualitySettings.fetch_global().Quality.integration_reprobe_seconds
+    )
+    try:
+        yield
+    finally:
+        await asyncio.to_thread(availability.stop_reprobe)
+        await asyncio.to_thread(FlextQualityMcpServer.close_resource_cache)
 
-_mcp = FastMCP(name=c.Quality.MCP_SERVER_NAME, version=c.Quality.MCP_SERVER_VERSION)
+
+_mcp = FastMCP(
+    name=c.Quality.MCP_SERVER_NAME,
+    version=c.Quality.MCP_SERVER_VERSION,
+    lifespan=_lifespan,
+)
 
 
 class FlextQualityMcpServer:
     """MCP server namespace for flext-quality."""
 
+    _resource_cache: ClassVar[FlextQualityMcpResourceCache | None] = None
+    "Cache of rendered resources, created on the first resource read."
+    _resource_cache_lock: ClassVar[threading.Lock] = threading.Lock()
+    "Guards creation and release of the resource cache."
+
+    @classmethod
+    def close_resource_cache(cls) -> None:
+        """Stop the resource cache watcher; the next read starts a new cache."""
+        with cls._resource_cache_lock:
+            cache, cls._resource_cache = cls._resource_cache, None
+        if cache is not None:
+            cache.close()
+
+    @classmethod
+    def get_resource_cache(cls) -> FlextQualityMcpResourceCache:
+        """Get the resource cache, created from settings on first use."""
+        with cls._resource_cache_lock:
+            if cls._resource_cache is None:
+                settings = FlextQualitySettings.fetch_global()
+                cls._resource_cache = FlextQualityMcpResourceCache(
+                    settings.Quality.mcp_resource_poll_seconds
+                )
+            return cls._resource_cache
+
     @staticmethod
     def get_server() -> FastMCP:
         """Get the MCP server instance."""
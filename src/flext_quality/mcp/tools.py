@@ -2,14 +2,17 @@
 
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Mapping
 
+from fastmcp import Context
+
 from flext_quality import (
     FlextQualityClaudeContextClient,
     FlextQualityClaudeMemClient,
-    FlextQualityHookManager,
-    FlextQualityRulesEngine,
     c,
+    p,
+    quality,
     t,
     u,
 )
@@ -69,10 +72,9 @@ class FlextQualityMcpTools:
 
     @_mcp.tool()
     @staticmethod
-    def execute_hook(event: str, input_data: t.JsonMapping) -> t.JsonMapping:
-        """Execute a hook manually."""
-        manager = FlextQualityHookManager()
-        result = manager.execute(event=event, input_data=input_data)
+    async def execute_hook(event: str, input_data: t.JsonMapping) -> t.JsonMapping:
+        """Execute a hook manually without blocking the server event loop."""
+        result = await quality.aexecute_hook(event, input_data)
         if result.failure:
             error_msg = result.error if result.error is not None else "Unknown error"
             output: t.JsonMapping = {"error": error_msg}
@@ -81,15 +83,65 @@ class FlextQualityMcpTools:
 
     @_mcp.tool()
     @staticmethod
-    def validate_rules(
-        path: str, *, context: t.JsonMapping | None = None
+    async def validate_rules(
+        path: str,
+        *,
+        context: t.JsonMapping | None = None,
+        page_size: int | None = None,
+        cursor: str | None = None,
+        stream: bool = False,
+        ctx: Context | None = None,
     ) -> t.JsonMapping:
-        """Validate code against YAML rules."""
-        engine = FlextQualityRulesEngine()
-        result = engine.validate(path=path, context=context)
+        """Validate code against YAML rules, one page of violations at a time.
+
+        The first call returns counts per rule and severity, the first page
+        and a ``next_cursor``; pass it back as ``cursor`` for the next page.
+        With ``stream`` set, each violation is also sent as a progress
+        notification as soon as it is found.
+        """
+        if cursor is not None:
+            page = quality.fetch_violations_page(cursor, page_size)
+            return page.value if page.success else {"error": page.error}
+        if not stream or ctx is None:
+            result = await asyncio.to_thread(
+                quality.validate_rules, path, context, page_size=page_size
+            )
+        else:
+            result = await FlextQualityMcpTools._stream_rules(
+                ctx, path, context, page_size
+            )
         if result.failure:
             return {"error": result.error}
-        return {"violations": u.normalize_to_json_value(result.value)}
+        return result.value
+
+    @staticmethod
+    async def _stream_rules(
+        ctx: Context, path: str, context: t.JsonMapping | None, page_size: int | None
+    ) -> p.Result[t.JsonMapping]:
+        """Validate on a worker thread, reporting violations as they are found."""
+        loop = asyncio.get_running_loop()
+        found: asyncio.Queue[t.JsonMapping | None] = asyncio.Queue()
+
+        def emit(violation: t.JsonMapping) -> None:
+            loop.call_soon_threadsafe(found.put_nowait, violation)
+
+        scan = asyncio.ensure_future(
+            asyncio.to_thread(
+                quality.validate_rules,
+                path,
+                context,
+                page_size=page_size,
+                on_violation=emit,
+            )
+        )
+        scan.add_done_callback(lambda _: found.put_nowait(None))
+        reported = 0
+        while (violation := await found.get()) is not None:
+            reported += 1
+            await ctx.report_progress(
+                reported, message=t.json_mapping_adapter().dump_json(violation).decode()
+            )
+        return await scan
 
 
 __all__: list[str] = ["FlextQualityMcpTools"]
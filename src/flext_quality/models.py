@@ -94,6 +94,31 @@ class FlextQualityModels(_InfraModels, _WebModels):
             pattern: str | None = None
             action: str
             enabled: bool = True
+            file_types: t.SequenceOf[c.Quality.FileType] = _InfraUtilities.Field(
+                default_factory=lambda: [
+                    c.Quality.FileType(value)
+                    for value in c.Quality.DEFAULT_RULE_FILE_TYPES
+                ]
+            )
+
+        class HookDefinition(_InfraModels.BaseModel):
+            """A hook declared in a YAML or TOML hook configuration file.
+
+            ``hook`` names a hook class as ``module:ClassName``; every other
+            field left unset keeps the value declared on that class.
+            """
+
+            hook: str
+            name: str | None = None
+            event: c.Quality.HookEvent | None = None
+            matcher: t.StrSequence | None = None
+            order: int = 0
+            timeout_ms: int | None = _InfraUtilities.Field(default=None, ge=1)
+            parallel_safe: bool | None = None
+            fail_closed: bool | None = None
+            pure: bool | None = None
+            cache_keys: t.StrSequence | None = None
+            enabled: bool = True
 
         class Issue(_InfraModels.BaseModel):
             """Canonical issue model for documentation tooling."""
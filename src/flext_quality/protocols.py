@@ -88,6 +88,18 @@ class FlextQualityProtocols(p, web_p):
 
             event: str
             matcher: t.StrSequence | None
+            order: int
+            parallel_safe: bool
+            timeout_ms: int | None
+            fail_closed: bool
+            pure: bool
+            cache_keys: t.StrSequence | None
+
+            async def aexecute(
+                self, input_data: t.JsonMapping
+            ) -> p.Result[t.JsonMapping]:
+                """Execute the hook logic without blocking the event loop."""
+                ...
 
             def execute(self, input_data: t.JsonMapping) -> p.Result[t.JsonMapping]:
                 """Execute the hook logic."""
@@ -8,14 +8,22 @@ from typing import TYPE_CHECKING
 from flext_core.lazy import build_lazy_import_map, install_lazy_exports
 
 if TYPE_CHECKING:
+    from .baseline import FlextQualityBaseline as FlextQualityBaseline
+    from .checkpoint import FlextQualityRunCheckpoint as FlextQualityRunCheckpoint
     from .engine import FlextQualityRulesEngine as FlextQualityRulesEngine
     from .loader import FlextQualityRulesLoader as FlextQualityRulesLoader
+    from .pages import FlextQualityViolationPages as FlextQualityViolationPages
     from .validators import FlextQualityValidators as FlextQualityValidators
+    from .writers import FlextQualityResultWriters as FlextQualityResultWriters
 
 _LAZY_MODULES: dict[str, tuple[str, ...]] = {
+    ".baseline": ("FlextQualityBaseline",),
+    ".checkpoint": ("FlextQualityRunCheckpoint",),
     ".engine": ("FlextQualityRulesEngine",),
     ".loader": ("FlextQualityRulesLoader",),
+    ".pages": ("FlextQualityViolationPages",),
     ".validators": ("FlextQualityValidators",),
+    ".writers": ("FlextQualityResultWriters",),
 }
 
 
@@ -27,9 +35,13 @@ _LAZY_IMPORTS = build_lazy_import_map(
 )
 
 _PUBLIC_EXPORTS: tuple[str, ...] = (
+    "FlextQualityBaseline",
+    "FlextQualityResultWriters",
     "FlextQualityRulesEngine",
     "FlextQualityRulesLoader",
+    "FlextQualityRunCheckpoint",
     "FlextQualityValidators",
+    "FlextQualityViolationPages",
 )
 
 __all__: tuple[str, ...] = tuple(_PUBLIC_EXPORTS)
@@ -0,0 +1,127 @@
+"""Violation baseline for adopting rules on legacy trees.
+
+A baseline records the violations present at a point in time as stable
+fingerprints so later runs only report violations introduced afterwards.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, final
+
+from flext_quality import c, p, r, u
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+
+@final
+class FlextQualityBaseline:
+    """Set of known violation fingerprints persisted as a sorted text file.
+
+    Fingerprints hash the rule name, the file path relative to the baseline
+    ``root``, the whitespace-normalised line content and its occurrence among
+    identical lines, so they survive line shifts, reformatting of unrelated
+    code and moving the checkout. The root defaults to the directory of the
+    baseline file and is kept in its header relative to that directory, so
+    scanning a subdirectory or a single file matches a baseline recorded on
+    the whole tree. Membership checks are plain set lookups performed while
+    scanning.
+    """
+
+    def __init__(
+        self, fingerprints: Iterable[str] = (), *, root: Path | None = None
+    ) -> None:
+        """Initialize the baseline with known fingerprints anchored at root."""
+        self._fingerprints: set[str] = set(fingerprints)
+        self._root = root.resolve() if root is not None else None
+
+    def __contains__(self, fingerprint: object) -> bool:
+        """Check whether a fingerprint is part of the baseline."""
+        return fingerprint in self._fingerprints
+
+    def __len__(self) -> int:
+        """Return the number of recorded fingerprints."""
+        return len(self._fingerprints)
+
+    @property
+    def root(self) -> Path | None:
+        """The directory fingerprint paths are relative to, if anchored."""
+        return self._root
+
+    @staticmethod
+    def fingerprint(rule: str, file: str, line: str, occurrence: int = 0) -> str:
+        """Build the stable fingerprint of a violation.
+
+        ``file`` should be relative to the baseline root so baselines match across
+        checkouts; ``occurrence`` numbers identical lines of one file, so a new
+        copy of an already recorded line is still reported.
+        """
+        digest = hashlib.blake2b(
+            f"{rule}\0{file}\0{FlextQualityBaseline.normalize(line)}\0{occurrence}".encode(
+                c.DEFAULT_ENCODING
+            ),
+            digest_size=c.Quality.BASELINE_DIGEST_SIZE,
+        )
+        return digest.hexdigest()
+
+    @staticmethod
+    def normalize(line: str) -> str:
+        """Collapse whitespace so reformatting keeps a fingerprint stable."""
+        return " ".join(line.split())
+
+    @classmethod
+    def load(cls, path: Path) -> p.Result[FlextQualityBaseline]:
+        """Load a baseline file written by ``write``."""
+        if not path.exists():
+            return r[FlextQualityBaseline].fail(f"Baseline file not found: {path}")
+        read = u.Cli.files_read_text(path)
+        if read.failure:
+            return r[FlextQualityBaseline].fail(
+                f"Failed to read baseline: {read.error}"
+            )
+        lines = read.value.splitlines()
+        prefix = c.Quality.BASELINE_HEADER + c.Quality.BASELINE_ROOT_FIELD
+        if not lines or not lines[0].startswith(prefix):
+            return r[FlextQualityBaseline].fail(
+                f"Baseline {path} uses an outdated format; record it again"
+            )
+        fingerprints = (
+            line.strip() for line in lines if line.strip() and not line.startswith("#")
+        )
+        root = path.parent / lines[0].removeprefix(prefix)
+        return r[FlextQualityBaseline].ok(cls(fingerprints, root=root))
+
+    @classmethod
+    def load_if_present(cls, path: Path) -> p.Result[FlextQualityBaseline | None]:
+        """Load the baseline at path, or None when no baseline was recorded."""
+        if not path.exists():
+            return r[FlextQualityBaseline | None].ok(None)
+        loaded = cls.load(path)
+        if loaded.failure:
+            return r[FlextQualityBaseline | None].fail(loaded.error)
+        return r[FlextQualityBaseline | None].ok(loaded.value)
+
+    def add(self, fingerprint: str) -> None:
+        """Record a fingerprint."""
+        self._fingerprints.add(fingerprint)
+
+    def write(self, path: Path) -> p.Result[int]:
+        """Persist fingerprints sorted, one per line, for stable diffs.
+
+        The root is written relative to the directory of path; a baseline
+        without a root is anchored at that directory.
+        """
+        directory = path.parent.resolve()
+        root = Path(os.path.relpath(self._root or directory, directory)).as_posix()
+        header = f"{c.Quality.BASELINE_HEADER}{c.Quality.BASELINE_ROOT_FIELD}{root}"
+        lines = [header, *sorted(self._fingerprints)]
+        write = u.Cli.atomic_write_text_file(path, "\n".join(lines) + "\n")
+        if write.failure:
+            return r[int].fail(write.error or f"cannot write {path}")
+        return r[int].ok(len(self._fingerprints))
@@ -0,0 +1,196 @@
+"""Checkpoint store for resumable rules validation runs.
+
+A run directory holds the run metadata, the files already scanned and the
+violations they produced, so an interrupted run can continue where it
+stopped instead of rescanning the whole tree.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, final
+
+from flext_quality import FlextQualityResultWriters, c, p, r, t, u
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, MutableSequence
+    from pathlib import Path
+
+
+@final
+class FlextQualityRunCheckpoint:
+    """Append-only progress log of one validation run.
+
+    Violations are appended before the files that produced them are marked
+    done, and each done entry records the size of the violations log once
+    its violations were written. On resume the log is truncated to the size
+    recorded by the last done entry, dropping violations of an interrupted
+    flush, so files rescanned afterwards report each violation exactly once.
+    """
+
+    def __init__(self, run_dir: Path, *, interval: int, done: set[str]) -> None:
+        """Initialize over an existing run directory."""
+        self._run_dir = run_dir
+        self._interval = max(1, interval)
+        self._done = done
+        self._pending_files: MutableSequence[str] = []
+        self._pending_violations: MutableSequence[t.JsonMapping] = []
+
+    @property
+    def run_id(self) -> str:
+        """The identifier of this run."""
+        return self._run_dir.name
+
+    @classmethod
+    def create(
+        cls, runs_dir: Path, run_id: str, target: str, *, interval: int
+    ) -> p.Result[FlextQualityRunCheckpoint]:
+        """Start a new checkpointed run for target."""
+        run_dir = runs_dir / run_id
+        if run_dir.exists():
+            return r[FlextQualityRunCheckpoint].fail(f"Run already exists: {run_id}")
+        try:
+            run_dir.mkdir(parents=True)
+        except OSError as exc:
+            return r[FlextQualityRunCheckpoint].fail(f"Cannot create run: {exc}")
+        meta = t.json_mapping_adapter().dump_json({"target": target}).decode()
+        write = u.Cli.atomic_write_text_file(
+            run_dir / c.Quality.CHECKPOINT_META_FILE, meta
+        )
+        if write.failure:
+            return r[FlextQualityRunCheckpoint].fail(write.error or "cannot write")
+        return r[FlextQualityRunCheckpoint].ok(
+            cls(run_dir, interval=interval, done=set())
+        )
+
+    @classmethod
+    def resume(
+        cls, runs_dir: Path, run_id: str, target: str, *, interval: int
+    ) -> p.Result[FlextQualityRunCheckpoint]:
+        """Reopen an interrupted run for the same target."""
+        run_dir = runs_dir / run_id
+        meta_read = u.Cli.files_read_text(run_dir / c.Quality.CHECKPOINT_META_FILE)
+        if meta_read.failure:
+            return r[FlextQualityRunCheckpoint].fail(f"Run not found: {run_id}")
+        try:
+            meta = t.json_mapping_adapter().validate_json(meta_read.value)
+        except ValueError as exc:
+            return r[FlextQualityRunCheckpoint].fail(f"Corrupt run metadata: {exc}")
+        if meta.get("target") != target:
+            return r[FlextQualityRunCheckpoint].fail(
+                f"Run {run_id} was started for {meta.get('target')}, not {target}"
+            )
+        done_path = run_dir / c.Quality.CHECKPOINT_DONE_FILE
+        done: set[str] = set()
+        committed = 0
+        if done_path.exists():
+            done_read = u.Cli.files_read_text(done_path)
+            if done_read.failure:
+                return r[FlextQualityRunCheckpoint].fail(done_read.error)
+            # Only newline-terminated entries were fully written.
+            entries = done_read.value.split("\n")[:-1]
+            for entry in entries:
+                size, _, file_path = entry.partition(
+                    c.Quality.CHECKPOINT_DONE_SEPARATOR
+                )
+                if not size.isdigit() or not file_path:
+                    return r[FlextQualityRunCheckpoint].fail(
+                        f"Corrupt checkpoint entry in run {run_id}: {entry!r}"
+                    )
+                done.add(file_path)
+                committed = int(size)
+        truncated = cls._truncate(
+            run_dir / c.Quality.CHECKPOINT_VIOLATIONS_FILE, committed
+        )
+        if truncated.failure:
+            return r[FlextQualityRunCheckpoint].fail(truncated.error)
+        return r[FlextQualityRunCheckpoint].ok(
+            cls(run_dir, interval=interval, done=done)
+        )
+
+    def is_done(self, file_path: str) -> bool:
+        """Check whether a file was fully scanned by an earlier attempt."""
+        return file_path in self._done
+
+    def record(
+        self, file_path: str, violations: t.SequenceOf[t.JsonMapping]
+    ) -> p.Result[int]:
+        """Buffer a scanned file and flush every ``interval`` files.
+
+        Returns the number of files flushed, zero while still buffering.
+        """
+        self._pending_files.append(file_path)
+        self._pending_violations.extend(violations)
+        if len(self._pending_files) >= self._interval:
+            return self.flush()
+        return r[int].ok(0)
+
+    def flush(self) -> p.Result[int]:
+        """Append buffered violations, then mark their files done."""
+        if not self._pending_files:
+            return r[int].ok(0)
+        marked = self._append_violations().flat_map(self._mark_done)
+        if marked.failure:
+            return r[int].fail(marked.error)
+        flushed = len(self._pending_files)
+        self._done.update(self._pending_files)
+        self._pending_files = []
+        self._pending_violations = []
+        return r[int].ok(flushed)
+
+    def replay(self) -> Iterator[t.JsonMapping]:
+        """Yield violations recorded for files marked done."""
+        violations_path = self._run_dir / c.Quality.CHECKPOINT_VIOLATIONS_FILE
+        if not violations_path.exists():
+            return
+        adapter = t.json_mapping_adapter()
+        with violations_path.open("rb") as handle:
+            for line in handle:
+                try:
+                    violation = adapter.validate_json(line)
+                except ValueError:
+                    continue
+                if str(violation.get("file", "")) in self._done:
+                    yield violation
+
+    def _append_violations(self) -> p.Result[int]:
+        """Append buffered violations and return the new size of the log."""
+        try:
+            with (self._run_dir / c.Quality.CHECKPOINT_VIOLATIONS_FILE).open(
+                "ab"
+            ) as handle:
+                written = FlextQualityResultWriters.Ndjson(handle).write(
+                    self._pending_violations
+                )
+                size = handle.tell()
+        except OSError as exc:
+            return r[int].fail(f"Failed to write checkpoint: {exc}")
+        return written.map(lambda _: size)
+
+    def _mark_done(self, size: int) -> p.Result[bool]:
+        """Append a done entry recording size for every buffered file."""
+        entries = (
+            f"{size}{c.Quality.CHECKPOINT_DONE_SEPARATOR}{path}\n"
+            for path in self._pending_files
+        )
+        try:
+            with (self._run_dir / c.Quality.CHECKPOINT_DONE_FILE).open(
+                "a", encoding=c.DEFAULT_ENCODING
+            ) as handle:
+                handle.writelines(entries)
+        except OSError as exc:
+            return r[bool].fail(f"Failed to write checkpoint: {exc}")
+        return r[bool].ok(value=True)
+
+    @staticmethod
+    def _truncate(violations_path: Path, size: int) -> p.Result[bool]:
+        """Cut the violations log back to the size committed by done entries."""
+        try:
+            with violations_path.open("ab") as handle:
+                if handle.tell() > size:
+                    handle.truncate(size)
+        except OSError as exc:
+            return r[bool].fail(f"Cannot truncate checkpoint violations: {exc}")
+        return r[bool].ok(value=True)
@@ -2,23 +2,113 @@
 
 from __future__ import annotations
 
+import copy
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, ClassVar
 
-from flext_quality import FlextQualityRulesLoader, c, m, p, r, t, u
+from flext_quality import (
+    FlextQualityBaseline,
+    FlextQualityRulesLoader,
+    FlextQualityRunCheckpoint,
+    FlextQualitySettings,
+    c,
+    m,
+    p,
+    r,
+    t,
+    u,
+)
 
 if TYPE_CHECKING:
-    from collections.abc import MutableSequence
+    from collections.abc import Callable, MutableMapping, MutableSequence
+    from concurrent.futures import Future
 
 
 class FlextQualityRulesEngine:
     """Engine for YAML-based declarative rules validation."""
 
-    def __init__(self, rules_path: Path | None = None) -> None:
-        """Initialize rules engine."""
+    _worker_scan: ClassVar[
+        Callable[[Path, t.JsonMapping], t.Quality.FileScan] | None
+    ] = None
+    "File scanner of the engine rebuilt once per scan worker process."
+
+    def __init__(
+        self,
+        rules_path: Path | None = None,
+        *,
+        baseline: FlextQualityBaseline | None = None,
+        max_file_size_bytes: int | None = None,
+        max_line_bytes: int | None = None,
+        read_ahead: int | None = None,
+        workers: int | None = None,
+        execution_mode: c.Quality.ExecutionMode | None = None,
+    ) -> None:
+        """Initialize rules engine.
+
+        ``workers`` scans that many files in parallel. ``execution_mode``
+        picks threads or processes for them; ``AUTO`` uses threads when the
+        interpreter runs without the GIL and processes otherwise.
+        """
+        settings = FlextQualitySettings.fetch_global()
         self._rules_path: Path | None = rules_path
         self._rules: MutableSequence[m.Quality.RuleDefinition] = []
         self._loaded: bool = False
+        self._scan_root: Path | None = None
+        self._loaded_path: Path | None = None
+        self._rules_mtime_ns: int | None = None
+        self._baseline: FlextQualityBaseline | None = baseline
+        self._routes: t.MappingKV[str, t.SequenceOf[t.Quality.CompiledRule]] = {}
+        self._unrouted: t.SequenceOf[t.Quality.CompiledRule] = ()
+        self._max_file_size_bytes = (
+            max_file_size_bytes or settings.Quality.max_file_size_bytes
+        )
+        self._max_line_bytes = min(
+            max_line_bytes or settings.Quality.max_line_bytes,
+            c.Quality.TEXT_SNIFF_BYTES,
+        )
+        self._read_ahead = (
+            settings.Quality.read_ahead_depth if read_ahead is None else read_ahead
+        )
+        self._workers = settings.Quality.scan_workers if workers is None else workers
+        self._execution_mode = execution_mode or settings.Quality.scan_execution_mode
+        self._runs_dir = Path(settings.Quality.runs_dir)
+        self._checkpoint_interval = settings.Quality.checkpoint_interval
+        self._stats: MutableMapping[str, int] = {}
+        self._checkpoint_error: str | None = None
+
+    @property
+    def rules_path(self) -> Path:
+        """The rules file loaded when no other path is given."""
+        if self._rules_path is not None:
+            return self._rules_path
+        return Path(__file__).parent.parent.parent.parent / "rules" / "default.yaml"
+
+    @property
+    def scan_root(self) -> Path | None:
+        """The directory file paths of the latest stream are relative to."""
+        return self._scan_root
+
+    def ensure_loaded(self) -> p.Result[int]:
+        """Load the rules once and again whenever their file changes on disk.
+
+        Long-lived engines keep the compiled routes between validations and
+        only pay for parsing again after the rules file is edited.
+        """
+        if self._loaded and self._mtime_ns(self._loaded_path) == self._rules_mtime_ns:
+            return r[int].ok(len(self._rules))
+        return self.load_rules(self._loaded_path)
+
+    def fetch_checkpoint_error(self) -> str | None:
+        """Return why the latest checkpointed run stopped early, if it did."""
+        return self._checkpoint_error
+
+    def fetch_scan_stats(self) -> t.MappingKV[str, int]:
+        """Return files scanned and skipped per reason by the latest run."""
+        return dict(self._stats)
 
     def get_rules(self) -> MutableSequence[m.Quality.RuleDefinition]:
         """Get loaded rules."""
@@ -26,70 +116,204 @@ class FlextQualityRulesEngine:
 
     def load_rules(self, rules_path: Path | None = None) -> p.Result[int]:
         """Load rules from YAML file."""
-        path = rules_path or self._rules_path
-        if path is None:
-            path = Path(__file__).parent.parent.parent.parent / "rules" / "default.yaml"
+        path = rules_path or self.rules_path
+        mtime_ns = self._mtime_ns(path)
         loader = FlextQualityRulesLoader()
         result = loader.load(path)
         if result.failure:
             return r[int].fail(result.error)
         self._rules = list(result.value)
+        self._build_routes()
         self._loaded = True
+        self._loaded_path = path
+        self._rules_mtime_ns = mtime_ns
         return r[int].ok(len(self._rules))
 
+    def record_baseline(self, path: str, baseline_path: Path) -> p.Result[int]:
+        """Record every current violation under path as the new baseline.
+
+        Fingerprints are anchored at the directory of ``baseline_path``.
+        """
+        root = baseline_path.parent
+        previous = self._baseline
+        self._baseline = FlextQualityBaseline(root=root)
+        try:
+            result = self.validate(path)
+        finally:
+            self._baseline = previous
+        if result.failure:
+            return r[int].fail(result.error)
+        baseline = FlextQualityBaseline(
+            (
+                str(violation["fingerprint"])
+                for violation in result.value
+                if "fingerprint" in violation
+            ),
+            root=root,
+        )
+        return baseline.write(baseline_path)
+
+    def set_baseline(self, baseline: FlextQualityBaseline | None) -> None:
+        """Suppress violations already recorded in baseline."""
+        self._baseline = baseline
+
+    def snapshot(self) -> FlextQualityRulesEngine:
+        """Return an engine sharing these rules and baseline for one scan.
+
+        Loading rules or a baseline replaces them rather than mutating them,
+        so the snapshot can scan while this engine is reloaded; statistics
+        and checkpoint errors are its own.
+        """
+        engine: FlextQualityRulesEngine = copy.copy(self)
+        engine._stats = {}
+        engine._scan_root = None
+        engine._checkpoint_error = None
+        return engine
+
+    def stream(
+        self,
+        path: str,
+        context: t.JsonMapping | None = None,
+        *,
+        run_id: str | None = None,
+        resume: str | None = None,
+    ) -> p.Result[Iterator[t.JsonMapping]]:
+        """Validate code lazily, yielding violations as each file is scanned.
+
+        ``run_id`` checkpoints progress under the configured runs directory;
+        ``resume`` continues such a run, replaying the violations already
+        recorded and scanning only the files it had not finished. When the
+        checkpoint cannot be written the stream ends early and
+        ``fetch_checkpoint_error`` returns the reason.
+        """
+        load_result = self.ensure_loaded()
+        if load_result.failure:
+            return r[Iterator[t.JsonMapping]].fail(load_result.error)
+        target_path = Path(path)
+        if not target_path.exists():
+            return r[Iterator[t.JsonMapping]].fail(f"Path does not exist: {path}")
+        checkpoint: FlextQualityRunCheckpoint | None = None
+        if resume is not None:
+            opened = FlextQualityRunCheckpoint.resume(
+                self._runs_dir, resume, path, interval=self._checkpoint_interval
+            )
+        elif run_id is not None:
+            opened = FlextQualityRunCheckpoint.create(
+                self._runs_dir, run_id, path, interval=self._checkpoint_interval
+            )
+        else:
+            opened = None
+        if opened is not None:
+            if opened.failure:
+                return r[Iterator[t.JsonMapping]].fail(opened.error)
+            checkpoint = opened.value
+        self._stats = {"files_scanned": 0}
+        self._checkpoint_error = None
+        self._scan_root = target_path if target_path.is_dir() else target_path.parent
+        return r[Iterator[t.JsonMapping]].ok(
+            self._iter_violations(target_path, context or {}, checkpoint)
+        )
+
     def validate(
-        self, path: str, context: t.JsonMapping | None = None
+        self,
+        path: str,
+        context: t.JsonMapping | None = None,
+        *,
+        run_id: str | None = None,
+        resume: str | None = None,
     ) -> p.Result[t.SequenceOf[t.JsonMapping]]:
         """Validate code against loaded rules."""
-        if not self._loaded:
-            load_result = self.load_rules()
-            if load_result.failure:
-                return r[t.SequenceOf[t.JsonMapping]].fail(load_result.error)
-        target_path = Path(path)
-        if not target_path.exists():
-            return r[t.SequenceOf[t.JsonMapping]].fail(f"Path does not exist: {path}")
-        violations: MutableSequence[t.JsonMapping] = []
-        files = self._get_files(target_path)
-        for file_path in files:
-            file_violations = self._validate_file(file_path, context or {})
-            violations.extend(file_violations)
+        streamed = self.stream(path, context, run_id=run_id, resume=resume)
+        if streamed.failure:
+            return r[t.SequenceOf[t.JsonMapping]].fail(streamed.error)
+        violations = list(streamed.value)
+        if self._checkpoint_error is not None:
+            return r[t.SequenceOf[t.JsonMapping]].fail(self._checkpoint_error)
         return r[t.SequenceOf[t.JsonMapping]].ok(violations)
 
     def validate_content(
         self, content: str, filename: str = "<string>"
     ) -> p.Result[t.SequenceOf[t.JsonMapping]]:
-        """Validate content string against loaded rules."""
-        if not self._loaded:
-            load_result = self.load_rules()
-            if load_result.failure:
-                return r[t.SequenceOf[t.JsonMapping]].fail(load_result.error)
-        violations: MutableSequence[t.JsonMapping] = []
+        """Validate content string against the rules routed to its extension.
+
+        A filename whose extension no rule declares, or that has none, such
+        as the ``<string>`` default, is checked against every enabled rule.
+        """
+        load_result = self.ensure_loaded()
+        if load_result.failure:
+            return r[t.SequenceOf[t.JsonMapping]].fail(load_result.error)
+        routed = self._routes.get(Path(filename).suffix.lower(), self._unrouted)
+        return r[t.SequenceOf[t.JsonMapping]].ok(
+            self._check_rules(routed, content, filename)
+        )
+
+    def _build_routes(self) -> None:
+        """Index enabled rules by file extension with patterns compiled once.
+
+        Every enabled rule is also kept for content of an unrouted extension.
+        """
+        routes: MutableMapping[str, MutableSequence[t.Quality.CompiledRule]] = {}
+        unrouted: MutableSequence[t.Quality.CompiledRule] = []
         for rule in self._rules:
-            if not rule.enabled:
+            if not rule.enabled or rule.pattern is None:
                 continue
-            rule_violations = self._check_rule(rule, content, filename)
-            violations.extend(rule_violations)
-        return r[t.SequenceOf[t.JsonMapping]].ok(violations)
+            try:
+                pattern = u.Quality.compile_pattern(rule.pattern)
+            except c.EXC_VALIDATION_VALUE:
+                pattern = None
+            unrouted.append((rule, pattern))
+            for file_type in rule.file_types:
+                for suffix in c.Quality.FILE_TYPE_EXTENSIONS[file_type]:
+                    routes.setdefault(suffix, []).append((rule, pattern))
+        self._routes = {suffix: tuple(rules) for suffix, rules in routes.items()}
+        self._unrouted = tuple(unrouted)
 
-    def _check_rule(
-        self, rule: m.Quality.RuleDefinition, content: str, filename: str
+    def _check_rules(
+        self, routed: t.SequenceOf[t.Quality.CompiledRule], content: str, filename: str
     ) -> t.SequenceOf[t.JsonMapping]:
-        """Check a single rule against content."""
+        """Check routed rules against content split into lines once."""
         violations: MutableSequence[t.JsonMapping] = []
-        if rule.pattern is None:
+        if not routed:
             return violations
-        try:
-            pattern = u.Quality.compile_pattern(rule.pattern)
-        except c.EXC_VALIDATION_VALUE:
-            pattern = None
         lines = content.splitlines()
+        relative = self._relative_path(filename)
+        for rule, pattern in routed:
+            violations.extend(
+                self._check_rule(rule, pattern, lines, filename, relative)
+            )
+        return violations
+
+    def _check_rule(
+        self,
+        rule: m.Quality.RuleDefinition,
+        pattern: t.RegexPattern | None,
+        lines: t.StrSequence,
+        filename: str,
+        relative: str,
+    ) -> t.SequenceOf[t.JsonMapping]:
+        """Check a single rule against content lines.
+
+        Fingerprints use the path relative to the baseline root, or the scan
+        root without one, and number identical matching lines in order of
+        appearance.
+        """
+        violations: MutableSequence[t.JsonMapping] = []
+        occurrences: MutableMapping[str, int] = {}
+        literal = rule.pattern or ""
         for line_num, line in enumerate(lines, start=1):
-            match_found = False
             if pattern is not None:
-                match_found = bool(pattern.search(line))
+                match_found = pattern.search(line) is not None
             else:
-                match_found = rule.pattern in line
+                match_found = literal in line
             if match_found:
+                normalized = FlextQualityBaseline.normalize(line)
+                occurrence = occurrences.get(normalized, 0)
+                occurrences[normalized] = occurrence + 1
+                fingerprint = FlextQualityBaseline.fingerprint(
+                    rule.name, relative, line, occurrence
+                )
+                if self._baseline is not None and fingerprint in self._baseline:
+                    continue
                 severity = self._rule_type_to_severity(rule.type)
                 violations.append({
                     "rule": rule.name,
@@ -98,15 +322,258 @@ class FlextQualityRulesEngine:
                     "message": rule.description,
                     "severity": severity,
                     "action": rule.action,
-                    "type": rule.type,
+                    "type": str(rule.type),
+                    "fingerprint": fingerprint,
                 })
         return violations
 
     def _get_files(self, path: Path) -> t.SequenceOf[Path]:
-        """Get Python files from path."""
+        """Get files whose extension has at least one routed rule."""
         if path.is_file():
-            return [path] if path.suffix == ".py" else []
-        return list(u.Infra.iter_matching_files(path, includes=["*.py"]))
+            return [path] if path.suffix.lower() in self._routes else []
+        includes = [f"*{suffix}" for suffix in sorted(self._routes)]
+        if not includes:
+            return []
+        return list(u.Infra.iter_matching_files(path, includes=includes))
+
+    def _iter_violations(
+        self,
+        target_path: Path,
+        context: t.JsonMapping,
+        checkpoint: FlextQualityRunCheckpoint | None,
+    ) -> Iterator[t.JsonMapping]:
+        """Yield violations file by file, recording progress when checkpointed."""
+        files = self._get_files(target_path)
+        if checkpoint is None:
+            for _, violations in self._iter_scanned(files, context):
+                yield from violations
+            return
+        yield from checkpoint.replay()
+        pending = [path for path in files if not checkpoint.is_done(str(path))]
+        try:
+            for file_path, violations in self._iter_scanned(pending, context):
+                recorded = checkpoint.record(str(file_path), violations)
+                if recorded.failure:
+                    self._checkpoint_error = recorded.error
+                    return
+                yield from violations
+        finally:
+            flushed = checkpoint.flush()
+            if flushed.failure and self._checkpoint_error is None:
+                self._checkpoint_error = flushed.error
+
+    def _iter_scanned(
+        self, files: t.SequenceOf[Path], context: t.JsonMapping
+    ) -> Iterator[tuple[Path, t.SequenceOf[t.JsonMapping]]]:
+        """Yield each file with its violations in discovery order.
+
+        Scan statistics are only updated here, on the consuming thread, so
+        parallel workers never share mutable engine state.
+        """
+        for file_path, (stat_key, violations) in self._iter_file_scans(files, context):
+            if stat_key is not None:
+                self._stats[stat_key] = self._stats.get(stat_key, 0) + 1
+            yield file_path, violations
+
+    def _iter_file_scans(
+        self, files: t.SequenceOf[Path], context: t.JsonMapping
+    ) -> Iterator[tuple[Path, t.Quality.FileScan]]:
+        """Dispatch scanning to workers, read-ahead or the calling thread."""
+        if self._workers > 0:
+            yield from self._iter_parallel(files, context)
+        elif self._read_ahead > 0:
+            yield from self._iter_read_ahead(files, context)
+        else:
+            for file_path in files:
+                yield file_path, self._scan_file(file_path, context)
+
+    def _iter_parallel(
+        self, files: t.SequenceOf[Path], context: t.JsonMapping
+    ) -> Iterator[tuple[Path, t.Quality.FileScan]]:
+        """Read and scan whole files on a thread or process pool.
+
+        Threads share the compiled patterns and baseline directly, which only
+        pays off when the GIL is disabled. Processes rebuild the engine once
+        per worker from the pickled rules and exchange only paths and
+        violations afterwards.
+        """
+        pool: Executor
+        scan: Callable[[Path], t.Quality.FileScan]
+        if self._resolved_execution_mode() is c.Quality.ExecutionMode.THREADS:
+            pool = ThreadPoolExecutor(
+                max_workers=self._workers,
+                thread_name_prefix=c.Quality.SCAN_THREAD_PREFIX,
+            )
+            scan = partial(self._scan_file, context=context)
+        else:
+            pool = ProcessPoolExecutor(
+                max_workers=self._workers,
+                initializer=FlextQualityRulesEngine._init_worker,
+                initargs=(
+                    tuple(self._rules),
+                    self._baseline,
+                    self._max_file_size_bytes,
+                    self._max_line_bytes,
+                    self._scan_root,
+                ),
+            )
+            scan = partial(FlextQualityRulesEngine._scan_in_worker, context=context)
+        window = self._workers * c.Quality.SCAN_WINDOW_PER_WORKER
+        for file_path, future in self._iter_windowed(pool, scan, files, window):
+            yield file_path, future.result()
+
+    def _iter_read_ahead(
+        self, files: t.SequenceOf[Path], context: t.JsonMapping
+    ) -> Iterator[tuple[Path, t.Quality.FileScan]]:
+        """Overlap file reads with scanning through a bounded prefetch window.
+
+        At most ``read_ahead`` reads are in flight or buffered at any time, so
+        memory stays capped at that many files while I/O waits overlap with
+        rule matching on the current file.
+        """
+        workers = min(self._read_ahead, c.Quality.READ_AHEAD_MAX_WORKERS)
+        pool = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix=c.Quality.READ_AHEAD_THREAD_PREFIX
+        )
+        for file_path, future in self._iter_windowed(
+            pool, self._read_text, files, self._read_ahead
+        ):
+            yield file_path, self._scan_read(file_path, future.result(), context)
+
+    @staticmethod
+    def _iter_windowed[T](
+        pool: Executor,
+        task: Callable[[Path], T],
+        files: t.SequenceOf[Path],
+        window: int,
+    ) -> Iterator[tuple[Path, Future[T]]]:
+        """Submit tasks keeping at most ``window`` in flight, yielding in order.
+
+        The pool is shut down, cancelling queued tasks, when the consumer
+        stops iterating early.
+        """
+        pending: deque[tuple[Path, Future[T]]] = deque()
+        remaining = iter(files)
+        try:
+            for file_path in remaining:
+                pending.append((file_path, pool.submit(task, file_path)))
+                if len(pending) >= window:
+                    break
+            while pending:
+                file_path, future = pending.popleft()
+                next_path = next(remaining, None)
+                if next_path is not None:
+                    pending.append((next_path, pool.submit(task, next_path)))
+                yield file_path, future
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    def _mtime_ns(path: Path | None) -> int | None:
+        """Return the modification time of path, or None if it is unknown."""
+        if path is None:
+            return None
+        try:
+            return path.stat().st_mtime_ns
+        except OSError:
+            return None
+
+    def _relative_path(self, filename: str) -> str:
+        """Return filename relative to the fingerprint root, in POSIX form.
+
+        The root is the baseline root when the baseline has one, so every
+        scan target under it fingerprints a file alike, else the scan root.
+        """
+        root = self._baseline.root if self._baseline is not None else None
+        try:
+            if root is not None:
+                return Path(filename).resolve().relative_to(root).as_posix()
+            if self._scan_root is not None:
+                return Path(filename).relative_to(self._scan_root).as_posix()
+        except ValueError:
+            return filename
+        return filename
+
+    def _resolved_execution_mode(self) -> c.Quality.ExecutionMode:
+        """Resolve ``AUTO`` to threads on free-threaded builds, else processes."""
+        if self._execution_mode is not c.Quality.ExecutionMode.AUTO:
+            return self._execution_mode
+        if u.Quality.gil_disabled():
+            return c.Quality.ExecutionMode.THREADS
+        return c.Quality.ExecutionMode.PROCESSES
+
+    @staticmethod
+    def _init_worker(
+        rules: t.SequenceOf[m.Quality.RuleDefinition],
+        baseline: FlextQualityBaseline | None,
+        max_file_size_bytes: int,
+        max_line_bytes: int,
+        scan_root: Path | None,
+    ) -> None:
+        """Build the per-process engine used by ``_scan_in_worker``."""
+        engine = FlextQualityRulesEngine(
+            baseline=baseline,
+            max_file_size_bytes=max_file_size_bytes,
+            max_line_bytes=max_line_bytes,
+            read_ahead=0,
+            workers=0,
+        )
+        engine._rules = list(rules)
+        engine._build_routes()
+        engine._loaded = True
+        engine._scan_root = scan_root
+        FlextQualityRulesEngine._worker_scan = engine._scan_file
+
+    @staticmethod
+    def _scan_in_worker(file_path: Path, context: t.JsonMapping) -> t.Quality.FileScan:
+        """Scan a file with the engine built by ``_init_worker``."""
+        scan = FlextQualityRulesEngine._worker_scan
+        if scan is None:
+            msg = "scan worker used before initialization"
+            raise RuntimeError(msg)
+        return scan(file_path, context)
+
+    def _scan_file(self, file_path: Path, context: t.JsonMapping) -> t.Quality.FileScan:
+        """Read and scan one file."""
+        return self._scan_read(file_path, self._read_text(file_path), context)
+
+    def _read_text(self, file_path: Path) -> p.Result[t.Quality.SniffedText]:
+        """Read a text file unless stat or a leading-bytes sniff rules it out.
+
+        Returns the decoded content, or ``None`` with the skip reason when the
+        file is oversized, binary, minified or not valid text.
+        """
+        try:
+            return r[t.Quality.SniffedText].ok(self._read_sniffed(file_path))
+        except (OSError, UnicodeDecodeError) as exc:
+            return r[t.Quality.SniffedText].fail(str(exc))
+
+    def _read_sniffed(self, file_path: Path) -> t.Quality.SniffedText:
+        """Stat, sniff and decode a file; raises on I/O or decoding errors."""
+        size = file_path.stat().st_size
+        if size > self._max_file_size_bytes:
+            return (None, c.Quality.FileSkipReason.OVERSIZED)
+        with file_path.open("rb") as handle:
+            head = handle.read(c.Quality.TEXT_SNIFF_BYTES)
+            reason = self._sniff(head, size)
+            if reason is not None:
+                return (None, reason)
+            data = head + handle.read()
+        return (data.decode(c.DEFAULT_ENCODING), None)
+
+    def _sniff(self, head: bytes, size: int) -> str | None:
+        """Classify leading bytes, returning a skip reason for non-text files."""
+        if b"\0" in head:
+            return c.Quality.FileSkipReason.BINARY
+        if size > self._max_line_bytes and b"\n" not in head[: self._max_line_bytes]:
+            return c.Quality.FileSkipReason.MINIFIED
+        try:
+            head.decode(c.DEFAULT_ENCODING)
+        except UnicodeDecodeError as exc:
+            truncated = exc.start >= len(head) - c.Quality.UTF8_MAX_SEQUENCE_BYTES
+            if not truncated or len(head) == size:
+                return c.Quality.FileSkipReason.UNDECODABLE
+        return None
 
     def _rule_type_to_severity(self, rule_type: c.Quality.RuleType) -> str:
         """Convert rule type to severity."""
@@ -117,14 +584,20 @@ class FlextQualityRulesEngine:
         }
         return str(mapping.get(rule_type, c.Quality.Severity.INFO))
 
-    def _validate_file(
-        self, file_path: Path, context: t.JsonMapping
-    ) -> t.SequenceOf[t.JsonMapping]:
-        """Validate a single file against rules."""
+    def _scan_read(
+        self,
+        file_path: Path,
+        read: p.Result[t.Quality.SniffedText],
+        context: t.JsonMapping,
+    ) -> t.Quality.FileScan:
+        """Scan a file read against the rules routed to its extension.
+
+        Returns the scan statistic the file counts towards, if any, with its
+        violations.
+        """
         validation_context = t.json_dict_adapter().validate_python(context or {})
-        read = u.Cli.files_read_text(file_path)
         if read.failure:
-            return [
+            return None, [
                 {
                     "rule": "file-read-error",
                     "file": str(file_path),
@@ -133,16 +606,13 @@ class FlextQualityRulesEngine:
                     "context": validation_context,
                 }
             ]
-        content = read.value
-        violations: MutableSequence[t.JsonMapping] = []
-        for rule in self._rules:
-            if not rule.enabled:
-                continue
-            rule_violations = self._check_rule(rule, content, str(file_path))
-            if validation_context:
-                rule_violations = [
-                    {**violation, "context": validation_context}
-                    for violation in rule_violations
-                ]
-            violations.extend(rule_violations)
-        return violations
+        content, skip_reason = read.value
+        if content is None:
+            return skip_reason or c.Quality.FileSkipReason.BINARY, []
+        routed = self._routes.get(file_path.suffix.lower(), ())
+        violations = self._check_rules(routed, content, str(file_path))
+        if validation_context:
+            violations = [
+                {**violation, "context": validation_context} for violation in violations
+            ]
+        return "files_scanned", violations
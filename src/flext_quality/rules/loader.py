@@ -92,6 +92,21 @@ class FlextQualityRulesLoader:
         action = data.get("action", "warn")
         pattern = data.get("pattern")
         enabled = data.get("enabled", True)
+        file_types_val = data.get("file_types", list(c.Quality.DEFAULT_RULE_FILE_TYPES))
+        if isinstance(file_types_val, str):
+            file_types_val = [file_types_val]
+        if not isinstance(file_types_val, list) or not file_types_val:
+            return r[m.Quality.RuleDefinition].fail(
+                f"Rule {index}: 'file_types' must be a non-empty list"
+            )
+        try:
+            file_types = [c.Quality.FileType(str(value)) for value in file_types_val]
+        except ValueError:
+            valid_file_types = [ft.value for ft in c.Quality.FileType]
+            return r[m.Quality.RuleDefinition].fail(
+                f"Rule {index}: invalid file_types {file_types_val!r}. "
+                f"Valid: {valid_file_types}"
+            )
         rule = m.Quality.RuleDefinition(
             name=str(name),
             type=rule_type,
@@ -99,5 +114,6 @@ class FlextQualityRulesLoader:
             pattern=str(pattern) if pattern else None,
             action=str(action),
             enabled=bool(enabled),
+            file_types=file_types,
         )
         return r[m.Quality.RuleDefinition].ok(rule)
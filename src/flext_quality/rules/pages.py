@@ -0,0 +1,99 @@
+"""Server-side result handles paging through large validation results.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+"""
+
+from __future__ import annotations
+
+import secrets
+import threading
+from collections import Counter, OrderedDict
+from typing import final
+
+from flext_quality import c, p, r, t
+
+
+@final
+class FlextQualityViolationPages:
+    """Keep recent validation results and serve them a page at a time.
+
+    A stored result gets an opaque handle; cursors name a handle and an
+    offset into its violations. Only the ``max_handles`` most recently used
+    results are kept, so a cursor fails once its result has been evicted.
+    """
+
+    def __init__(
+        self, max_handles: int = c.Quality.VIOLATION_PAGES_MAX_HANDLES
+    ) -> None:
+        """Initialize an empty store keeping at most max_handles results."""
+        self._max_handles = max(1, max_handles)
+        self._results: OrderedDict[str, t.SequenceOf[t.JsonMapping]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of results currently kept."""
+        return len(self._results)
+
+    @staticmethod
+    def summarize(violations: t.SequenceOf[t.JsonMapping]) -> t.JsonMapping:
+        """Count violations in total, per rule and per severity."""
+        return {
+            "total": len(violations),
+            "by_rule": dict(Counter(str(v.get("rule", "")) for v in violations)),
+            "by_severity": dict(
+                Counter(str(v.get("severity", "")) for v in violations)
+            ),
+        }
+
+    def first_page(
+        self, violations: t.SequenceOf[t.JsonMapping], page_size: int
+    ) -> t.JsonMapping:
+        """Store violations and return their summary with the first page."""
+        handle = secrets.token_hex(c.Quality.VIOLATION_PAGES_HANDLE_BYTES)
+        with self._lock:
+            self._results[handle] = violations
+            while len(self._results) > self._max_handles:
+                self._results.popitem(last=False)
+        return {
+            "summary": self.summarize(violations),
+            **self._slice(handle, violations, 0, page_size),
+        }
+
+    def page(self, cursor: str, page_size: int) -> p.Result[t.JsonMapping]:
+        """Return the page of a stored result starting at cursor."""
+        handle, _, offset_text = cursor.partition(
+            c.Quality.VIOLATION_PAGES_CURSOR_SEPARATOR
+        )
+        if not offset_text.isdigit():
+            return r[t.JsonMapping].fail(f"Invalid cursor: {cursor!r}")
+        with self._lock:
+            violations = self._results.get(handle)
+            if violations is not None:
+                self._results.move_to_end(handle)
+        if violations is None:
+            return r[t.JsonMapping].fail(f"Unknown or expired cursor: {cursor!r}")
+        return r[t.JsonMapping].ok(
+            self._slice(handle, violations, int(offset_text), page_size)
+        )
+
+    @staticmethod
+    def _slice(
+        handle: str,
+        violations: t.SequenceOf[t.JsonMapping],
+        offset: int,
+        page_size: int,
+    ) -> t.JsonMapping:
+        """Build one page with the cursor of the next one, if any."""
+        end = offset + min(max(1, page_size), c.Quality.VIOLATION_PAGE_SIZE_MAX)
+        return {
+            "violations": list(violations[offset:end]),
+            "next_cursor": (
+                f"{handle}{c.Quality.VIOLATION_PAGES_CURSOR_SEPARATOR}{end}"
+                if end < len(violations)
+                else None
+            ),
+        }
+
+
+__all__: list[str] = ["FlextQualityViolationPages"]
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING, override
 
 from flext_quality import c, p, r, t, u
@@ -141,12 +142,33 @@ class FlextQualityValidators:
             self._validators[validator.name] = validator
 
         def validate_all(
-            self, content: str, file_path: Path | None = None
+            self, content: str, file_path: Path | None = None, *, workers: int = 0
         ) -> p.Result[t.SequenceOf[t.JsonMapping]]:
-            """Run all validators."""
+            """Run all validators.
+
+            With ``workers`` and a free-threaded interpreter the validators
+            run concurrently over the shared content and compiled patterns.
+            Under the GIL they run sequentially, since shipping one in-memory
+            file to worker processes costs more than scanning it.
+            """
+            validators = list(self._validators.values())
+            if workers > 1 and len(validators) > 1 and u.Quality.gil_disabled():
+                with ThreadPoolExecutor(
+                    max_workers=min(workers, len(validators)),
+                    thread_name_prefix=c.Quality.SCAN_THREAD_PREFIX,
+                ) as pool:
+                    results = list(
+                        pool.map(
+                            lambda validator: validator.validate(content, file_path),
+                            validators,
+                        )
+                    )
+            else:
+                results = [
+                    validator.validate(content, file_path) for validator in validators
+                ]
             all_violations: MutableSequence[t.JsonMapping] = []
-            for validator in self._validators.values():
-                result = validator.validate(content, file_path)
+            for result in results:
                 if result.success:
                     all_violations.extend(result.value)
             return r[t.SequenceOf[t.JsonMapping]].ok(all_violations)
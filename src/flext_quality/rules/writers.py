@@ -0,0 +1,151 @@
+"""Streaming result writers for rules engine violations.
+
+Writers serialise each violation as soon as the engine yields it, so the
+memory needed to export a run does not grow with the number of violations.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, final
+from urllib.parse import quote
+
+from flext_quality import c, p, r, t
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, MutableMapping
+
+
+class FlextQualityResultWriters:
+    """Namespace for streaming violation writers."""
+
+    @final
+    class Ndjson:
+        """Write one JSON violation object per line."""
+
+        def __init__(self, stream: IO[bytes]) -> None:
+            """Initialize the writer over a binary stream."""
+            self._stream = stream
+
+        def write(self, violations: Iterable[t.JsonMapping]) -> p.Result[int]:
+            """Stream violations and return how many were written."""
+            adapter = t.json_mapping_adapter()
+            count = 0
+            try:
+                for violation in violations:
+                    self._stream.write(adapter.dump_json(violation) + b"\n")
+                    count += 1
+                self._stream.flush()
+            except OSError as exc:
+                return r[int].fail(f"Failed to write NDJSON: {exc}")
+            return r[int].ok(count)
+
+    @final
+    class Sarif:
+        """Write a SARIF 2.1.0 log with a single run.
+
+        Results are emitted while iterating; the ``tool`` object, which lists
+        the rules actually seen, is written after them since JSON member
+        order carries no meaning in SARIF.
+
+        Files under ``root`` are located relative to the ``%SRCROOT%`` base
+        declared in ``originalUriBaseIds``; any other file by its absolute
+        ``file://`` URI.
+        """
+
+        def __init__(self, stream: IO[bytes], root: Path | None = None) -> None:
+            """Initialize the writer over a binary stream and a scan root."""
+            self._stream = stream
+            self._root = root.absolute() if root is not None else None
+
+        def write(self, violations: Iterable[t.JsonMapping]) -> p.Result[int]:
+            """Stream violations as SARIF results and return how many were written."""
+            try:
+                count = self._write_log(violations)
+            except OSError as exc:
+                return r[int].fail(f"Failed to write SARIF: {exc}")
+            return r[int].ok(count)
+
+        def _artifact_location(self, file: str) -> t.JsonMapping:
+            """Locate file relative to the scan root, or by absolute URI."""
+            path = Path(file).absolute()
+            if self._root is not None and path.is_relative_to(self._root):
+                return {
+                    "uri": quote(path.relative_to(self._root).as_posix()),
+                    "uriBaseId": c.Quality.SARIF_SRCROOT,
+                }
+            return {"uri": path.as_uri()}
+
+        def _result(self, violation: t.JsonMapping) -> t.JsonMapping:
+            """Map a violation to a SARIF result object."""
+            severity = str(violation.get("severity", c.Quality.Severity.WARNING))
+            line = violation.get("line")
+            region: t.JsonMapping = (
+                {"startLine": line} if isinstance(line, int) and line > 0 else {}
+            )
+            result: t.MutableJsonMapping = {
+                "ruleId": str(violation.get("rule", "")),
+                "level": c.Quality.SARIF_LEVELS.get(severity, "warning"),
+                "message": {"text": str(violation.get("message", ""))},
+                "locations": [
+                    {
+                        "physicalLocation": {
+                            "artifactLocation": self._artifact_location(
+                                str(violation.get("file", ""))
+                            ),
+                            **({"region": region} if region else {}),
+                        }
+                    }
+                ],
+            }
+            fingerprint = violation.get("fingerprint")
+            if fingerprint is not None:
+                result["partialFingerprints"] = {
+                    c.Quality.SARIF_FINGERPRINT_KEY: str(fingerprint)
+                }
+            return result
+
+        def _write_log(self, violations: Iterable[t.JsonMapping]) -> int:
+            """Write the SARIF envelope around the streamed results."""
+            adapter = t.json_mapping_adapter()
+            rules: MutableMapping[str, str] = {}
+            count = 0
+            header = adapter.dump_json({
+                "$schema": c.Quality.SARIF_SCHEMA_URI,
+                "version": c.Quality.SARIF_VERSION,
+            })
+            self._stream.write(header[:-1] + b',"runs":[{"results":[')
+            for violation in violations:
+                rule_id = str(violation.get("rule", ""))
+                rules.setdefault(rule_id, str(violation.get("message", "")))
+                if count:
+                    self._stream.write(b",")
+                self._stream.write(adapter.dump_json(self._result(violation)))
+                count += 1
+            self._stream.write(b"]")
+            if self._root is not None:
+                base = {c.Quality.SARIF_SRCROOT: {"uri": f"{self._root.as_uri()}/"}}
+                self._stream.write(b',"originalUriBaseIds":')
+                self._stream.write(adapter.dump_json(base))
+            self._stream.write(b',"tool":')
+            self._stream.write(adapter.dump_json(self._tool(rules)))
+            self._stream.write(b"}]}\n")
+            self._stream.flush()
+            return count
+
+        @staticmethod
+        def _tool(rules: t.StrMapping) -> t.JsonMapping:
+            """Build the SARIF tool descriptor for the rules seen."""
+            return {
+                "driver": {
+                    "name": c.Quality.MCP_SERVER_NAME,
+                    "version": c.Quality.MCP_SERVER_VERSION,
+                    "rules": [
+                        {"id": rule_id, "shortDescription": {"text": text}}
+                        for rule_id, text in rules.items()
+                    ],
+                }
+            }
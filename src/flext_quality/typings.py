@@ -3,10 +3,14 @@
 from __future__ import annotations
 
 from collections.abc import Mapping
+from typing import TYPE_CHECKING
 
 from flext_infra import m, t
 from flext_web import t as web_t
 
+if TYPE_CHECKING:
+    from flext_quality import FlextQualityModels
+
 
 class FlextQualityTypes(t, web_t):
     """Namespace for flext-quality type definitions."""
@@ -15,6 +19,11 @@ class FlextQualityTypes(t, web_t):
         """Quality-specific types namespace (project slot)."""
 
         type RuleResult = tuple[bool, str | None]
+        type SniffedText = tuple[str | None, str | None]
+        type FileScan = tuple[str | None, t.SequenceOf[t.JsonMapping]]
+        type CompiledRule = tuple[
+            FlextQualityModels.Quality.RuleDefinition, t.RegexPattern | None
+        ]
         type GenericItem = t.JsonValue | t.MappingKV[str, t.Primitives | None]
         type DocumentationReportValue = (
             str
@@ -133,6 +133,12 @@ class FlextQualityUtilities(u, web_u):
             except c.EXC_BROAD_IO_TYPE as e:
                 return r[t.SequenceOf[t.JsonMapping]].fail(f"Failed to load rules: {e}")
 
+        @staticmethod
+        def gil_disabled() -> bool:
+            """Check whether this interpreter runs without the GIL (3.13t+)."""
+            is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+            return is_gil_enabled is not None and not is_gil_enabled()
+
         @staticmethod
         def parse_hook_input(raw: str) -> p.Result[t.JsonMapping]:
             """Parse hook input JSON."""
@@ -150,6 +156,22 @@ class FlextQualityUtilities(u, web_u):
                 lambda e: f"Failed to read stdin: {e}"
             )
 
+        @staticmethod
+        def read_stdin_bytes(max_bytes: int) -> p.Result[bytes]:
+            """Read raw stdin bytes, failing once more than max_bytes arrive."""
+            return (
+                u
+                .try_(lambda: sys.stdin.buffer.read(max_bytes + 1), catch=Exception)
+                .map_error(lambda e: f"Failed to read stdin: {e}")
+                .flat_map(
+                    lambda data: (
+                        r[bytes].fail(f"Hook payload exceeds {max_bytes} bytes")
+                        if len(data) > max_bytes
+                        else r[bytes].ok(data)
+                    )
+                )
+            )
+
         @staticmethod
         def run_shell_command(
             cmd: t.StrSequence, timeout_ms: int = c.Quality.HOOK_TIMEOUT_MS
@@ -48,8 +48,30 @@ if TYPE_CHECKING:
     from tests.settings import TestsFlextQualitySettings as TestsFlextQualitySettings
     from tests.typings import TestsFlextQualityTypes as TestsFlextQualityTypes, t as t
     from tests.unit.test_api import TestsFlextQualityApi as TestsFlextQualityApi
+    from tests.unit.test_availability import (
+        TestsFlextQualityAvailabilityCache as TestsFlextQualityAvailabilityCache,
+    )
     from tests.unit.test_basic import TestsFlextQualityBasic as TestsFlextQualityBasic
     from tests.unit.test_cli import TestsFlextQualityCli as TestsFlextQualityCli
+    from tests.unit.test_hook_server_benchmark import (
+        TestsFlextQualityHookServerBenchmark as TestsFlextQualityHookServerBenchmark,
+    )
+    from tests.unit.test_hooks import TestsFlextQualityHooks as TestsFlextQualityHooks
+    from tests.unit.test_mcp_cache import (
+        TestsFlextQualityMcpResourceCache as TestsFlextQualityMcpResourceCache,
+    )
+    from tests.unit.test_mcp_sessions import (
+        TestsFlextQualityMcpSessionPool as TestsFlextQualityMcpSessionPool,
+    )
+    from tests.unit.test_rules_engine import (
+        TestsFlextQualityRulesEngine as TestsFlextQualityRulesEngine,
+    )
+    from tests.unit.test_rules_engine_benchmark import (
+        TestsFlextQualityRulesEngineBenchmark as TestsFlextQualityRulesEngineBenchmark,
+    )
+    from tests.unit.test_scheduled_maintenance_timeout import (
+        TestsFlextQualityScheduledMaintenanceTimeout as TestsFlextQualityScheduledMaintenanceTimeout,
+    )
     from tests.utilities import (
         TestsFlextQualityUtilities as TestsFlextQualityUtilities,
         u,
@@ -75,8 +97,18 @@ _LAZY_IMPORTS = merge_lazy_imports(
         ".typings": ("TestsFlextQualityTypes", "t"),
         ".unit": ("unit",),
         ".unit.test_api": ("TestsFlextQualityApi",),
+        ".unit.test_availability": ("TestsFlextQualityAvailabilityCache",),
         ".unit.test_basic": ("TestsFlextQualityBasic",),
         ".unit.test_cli": ("TestsFlextQualityCli",),
+        ".unit.test_hook_server_benchmark": ("TestsFlextQualityHookServerBenchmark",),
+        ".unit.test_hooks": ("TestsFlextQualityHooks",),
+        ".unit.test_mcp_cache": ("TestsFlextQualityMcpResourceCache",),
+        ".unit.test_mcp_sessions": ("TestsFlextQualityMcpSessionPool",),
+        ".unit.test_rules_engine": ("TestsFlextQualityRulesEngine",),
+        ".unit.test_rules_engine_benchmark": ("TestsFlextQualityRulesEngineBenchmark",),
+        ".unit.test_scheduled_maintenance_timeout": (
+            "TestsFlextQualityScheduledMaintenanceTimeout",
+        ),
         ".utilities": ("TestsFlextQualityUtilities", "u"),
         "flext_tests": ("d", "e", "h", "r", "td", "tf", "tk", "tm", "tv", "x"),
     }),
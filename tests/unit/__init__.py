@@ -7,8 +7,18 @@ from flext_core.lazy import build_lazy_import_map, install_lazy_exports
 
 _LAZY_IMPORTS = build_lazy_import_map({
     ".test_api": ("TestsFlextQualityApi",),
+    ".test_availability": ("TestsFlextQualityAvailabilityCache",),
     ".test_basic": ("TestsFlextQualityBasic",),
     ".test_cli": ("TestsFlextQualityCli",),
+    ".test_hook_server_benchmark": ("TestsFlextQualityHookServerBenchmark",),
+    ".test_hooks": ("TestsFlextQualityHooks",),
+    ".test_mcp_cache": ("TestsFlextQualityMcpResourceCache",),
+    ".test_mcp_sessions": ("TestsFlextQualityMcpSessionPool",),
+    ".test_rules_engine": ("TestsFlextQualityRulesEngine",),
+    ".test_rules_engine_benchmark": ("TestsFlextQualityRulesEngineBenchmark",),
+    ".test_scheduled_maintenance_timeout": (
+        "TestsFlextQualityScheduledMaintenanceTimeout",
+    ),
     "flext_tests": (
         "c",
         "d",
@@ -0,0 +1,50 @@
+"""Behavioral tests for the shared integration availability cache.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+"""
+
+from __future__ import annotations
+
+from flext_quality import FlextQualityAvailabilityCache, FlextQualityMcpClient
+from flext_tests import tm
+
+
+class TestsFlextQualityAvailabilityCache:
+    """PATH is scanned once per TTL, or on an explicit refresh."""
+
+    def test_probe_is_cached_until_ttl_or_refresh(self) -> None:
+        installed = {"mcp-cli"}
+        lookups: list[str] = []
+        now = [0.0]
+
+        def which(executable: str) -> str | None:
+            lookups.append(executable)
+            return f"/usr/bin/{executable}" if executable in installed else None
+
+        cache = FlextQualityAvailabilityCache(60, which=which, clock=lambda: now[0])
+        tm.that(cache.available("mcp-cli"), eq=True)
+        tm.that(cache.available("mcp-cli"), eq=True)
+        tm.that(len(lookups), eq=1)
+        installed.clear()
+        tm.that(cache.refresh("mcp-cli"), eq={"mcp-cli": False})
+        installed.add("mcp-cli")
+        now[0] = 61.0
+        tm.that(cache.available("mcp-cli"), eq=True)
+        tm.that(len(lookups), eq=3)
+
+    def test_client_commands_share_one_probe(self) -> None:
+        lookups: list[str] = []
+
+        def which(executable: str) -> str | None:
+            lookups.append(executable)
+            return f"/usr/bin/{executable}"
+
+        cache = FlextQualityAvailabilityCache(60, which=which)
+        client = FlextQualityMcpClient(availability=cache)
+        tm.that(client.build_info_command("server", "tool").success, eq=True)
+        tm.that(client.health_check().value["available"], eq=True)
+        tm.that(lookups, eq=["mcp-cli"])
+
+
+__all__: list[str] = ["TestsFlextQualityAvailabilityCache"]
@@ -9,7 +9,7 @@ from __future__ import annotations
 
 import pytest
 
-from flext_quality import FlextQuality, c, quality
+from flext_quality import FlextQuality, FlextQualitySettings, c, quality
 from flext_tests import tm
 
 
@@ -54,3 +54,13 @@ class TestsFlextQualityBasic:
         count = FlextQuality().execute().value["hooks_registered"]
         tm.that(count, is_=int)
         tm.that(isinstance(count, int) and count >= 0, eq=True)
+
+    def test_mode_settings_are_enums(self) -> None:
+        """Mode settings parse to their enums and reject unknown values."""
+        settings = FlextQualitySettings.fetch_global().Quality
+        tm.that(settings.scan_execution_mode, is_=c.Quality.ExecutionMode)
+        tm.that(settings.hook_server_mode, is_=c.Quality.HookServerMode)
+        parsed = type(settings).model_validate({"hook_server_mode": "fork"})
+        tm.that(parsed.hook_server_mode is c.Quality.HookServerMode.FORK, eq=True)
+        with pytest.raises(ValueError, match="scan_execution_mode"):
+            type(settings).model_validate({"scan_execution_mode": "fibers"})
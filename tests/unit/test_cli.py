@@ -89,6 +89,26 @@ class TestsFlextQualityCli:
         commands = FlextQualityCli.Validate(target_path=tmp_path).execute().unwrap()
         tm.that(commands[2], has=str(tmp_path))
 
+    # ---- Report ---------------------------------------------------------
+
+    def test_report_fails_when_output_cannot_be_opened(self, tmp_path: Path) -> None:
+        rules_path = tmp_path / "rules.yaml"
+        rules_path.write_text(
+            "rules:\n"
+            "  - name: no-print\n"
+            "    type: warning\n"
+            "    description: print call\n"
+            "    pattern: print\n",
+            encoding="utf-8",
+        )
+        result = FlextQualityCli.Report(
+            target_path=tmp_path,
+            output_path=tmp_path / "missing" / "report.sarif",
+            rules_path=rules_path,
+        ).execute()
+        tm.that(result.failure, eq=True)
+        tm.that(result.error or "", has="Cannot write report")
+
     # ---- Lifecycle ------------------------------------------------------
 
     def test_facade_execute_reports_ready(self) -> None:
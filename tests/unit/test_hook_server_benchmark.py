@@ -0,0 +1,68 @@
+"""Benchmarks comparing cold hook processes with the resident hook server.
+
+Recorded corpora are replayed the same way by ``flext-quality replay``.
+
+Run with ``pytest -m performance --benchmark-enable``.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING
+
+import pytest
+
+from flext_quality import FlextQualityHookReplay, FlextQualityHookServer, c, quality
+from flext_quality.hook_client import forward
+from flext_tests import tm
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+PAYLOAD = b'{"event": "PreToolUse", "tool_name": "Bash", "tool_input": {}}'
+
+
+@pytest.mark.performance
+class TestsFlextQualityHookServerBenchmark:
+    """Per-event latency of cold start, threaded server and fork zygote."""
+
+    @pytest.fixture(params=list(c.Quality.HookServerMode))
+    def server(
+        self, request: pytest.FixtureRequest, tmp_path: Path
+    ) -> Iterator[FlextQualityHookServer]:
+        server = FlextQualityHookServer(
+            quality.process_hook_payload,
+            tmp_path / "hooks.sock",
+            mode=c.Quality.HookServerMode(request.param),
+        )
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        server.wait_ready(5)
+        yield server
+        server.shutdown()
+        thread.join(5)
+
+    def test_cold_start_latency(self, benchmark: BenchmarkFixture) -> None:
+        replay = FlextQualityHookReplay([PAYLOAD])
+        result = benchmark.pedantic(replay.cold, args=(1,), rounds=3)
+        tm.that(result.success, eq=True)
+
+    def test_warm_corpus_replay_throughput(self, benchmark: BenchmarkFixture) -> None:
+        replay = FlextQualityHookReplay([PAYLOAD] * 100)
+        result = benchmark(replay.warm)
+        tm.that(result.value["count"], eq=100)
+
+    def test_resident_server_latency(
+        self, benchmark: BenchmarkFixture, server: FlextQualityHookServer
+    ) -> None:
+        response = benchmark(forward, PAYLOAD, str(server.socket_path))
+        tm.that(response, eq=b'{"continue":true}\n')
+
+
+__all__: list[str] = ["TestsFlextQualityHookServerBenchmark"]
@@ -0,0 +1,865 @@
+"""Behavioral tests for hook registration and dispatch.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import socket
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import ClassVar, override
+
+import pytest
+
+from flext_quality import (
+    FlextQualityBaseHook,
+    FlextQualityHookCircuitBreaker,
+    FlextQualityHookConfig,
+    FlextQualityHookDebouncer,
+    FlextQualityHookDispatchIndex,
+    FlextQualityHookManager,
+    FlextQualityHookPayload,
+    FlextQualityHookRecorder,
+    FlextQualityHookReplay,
+    FlextQualityHookResultCache,
+    FlextQualityHookServer,
+    FlextQualityLatencyHistogram,
+    FlextQualitySettings,
+    c,
+    p,
+    r,
+    t,
+    u,
+)
+from flext_quality import hook_client
+from flext_quality.hook_client import forward
+from flext_tests import tm
+
+
+class _RecordingHook(FlextQualityBaseHook):
+    """Hook that records its name into a shared call log."""
+
+    event: ClassVar[c.Quality.HookEvent] = c.Quality.HookEvent.PRE_TOOL_USE
+
+    def __init__(self, name: str, calls: list[str], *, block: bool = False) -> None:
+        self.name = name
+        self._calls = calls
+        self._block = block
+
+    @override
+    def execute(self, input_data: t.JsonMapping) -> p.Result[t.JsonMapping]:
+        self._calls.append(self.name)
+        return r[t.JsonMapping].ok({"continue": not self._block})
+
+
+class _BashHook(_RecordingHook):
+    matcher: ClassVar[t.StrSequence | None] = ["Bash"]
+
+
+class _EditHook(_RecordingHook):
+    matcher: ClassVar[t.StrSequence | None] = ["Edit*", "Write"]
+
+
+class _CommandHook(_RecordingHook):
+    """Hook whose applicability depends on the payload, not the tool name."""
+
+    @override
+    def should_run(self, input_data: t.JsonMapping) -> bool:
+        tool_input = input_data.get("tool_input")
+        return isinstance(tool_input, dict) and "command" in tool_input
+
+
+class _PostEditHook(_RecordingHook):
+    """Post-edit validator recording the file it was run for."""
+
+    event: ClassVar[c.Quality.HookEvent] = c.Quality.HookEvent.POST_TOOL_USE
+
+    @override
+    def execute(self, input_data: t.JsonMapping) -> p.Result[t.JsonMapping]:
+        tool_input = input_data.get("tool_input")
+        if isinstance(tool_input, dict):
+            self._calls.append(str(tool_input.get("content")))
+        return r[t.JsonMapping].ok({"continue": True})
+
+
+class _ParallelHook(_RecordingHook):
+    """Side-effect-free hook that waits on a barrier before answering."""
+
+    parallel_safe: ClassVar[bool] = True
+
+    def __init__(
+        self,
+        name: str,
+        calls: list[str],
+        barrier: threading.Barrier,
+        *,
+        block: bool = False,
+        delay: float = 0.0,
+    ) -> None:
+        super().__init__(name, calls, block=block)
+        self._barrier = barrier
+        self._delay = delay
+
+    @override
+    def execute(self, input_data: t.JsonMapping) -> p.Result[t.JsonMapping]:
+        self._barrier.wait()
+        time.sleep(self._delay)
+        return super().execute(input_data)
+
+
+class _PureReadHook(_RecordingHook):
+    """Pure hook depending only on the file being read."""
+
+    pure: ClassVar[bool] = True
+    cache_keys: ClassVar[t.StrSequence | None] = ["file_path"]
+
+
+class _HangingHook(_RecordingHook):
+    """Hook that sleeps well past any deadline used in these tests."""
+
+    timeout_ms: ClassVar[int | None] = 50
+
+    @override
+    def execute(self, input_data: t.JsonMapping) -> p.Result[t.JsonMapping]:
+        time.sleep(0.3)
+        return super().execute(input_data)
+
+
+class _HangingClosedHook(_HangingHook):
+    fail_closed: ClassVar[bool] = True
+
+
+class _ConfiguredHook(FlextQualityBaseHook):
+    """Argument-free hook loaded from configuration files in these tests."""
+
+    event: ClassVar[c.Quality.HookEvent] = c.Quality.HookEvent.PRE_TOOL_USE
+    calls: ClassVar[list[str]] = []
+
+    @override
+    def execute(self, input_data: t.JsonMapping) -> p.Result[t.JsonMapping]:
+        self.calls.append(type(self).__name__)
+        return r[t.JsonMapping].ok({"continue": True})
+
+
+class _BrokenConfiguredHook(_ConfiguredHook):
+    """Configured hook whose constructor fails."""
+
+    def __init__(self) -> None:
+        msg = "missing credentials"
+        raise RuntimeError(msg)
+
+
+class _AsyncParallelHook(_RecordingHook):
+    """Coroutine hook that waits on an asyncio barrier before answering."""
+
+    parallel_safe: ClassVar[bool] = True
+
+    def __init__(
+        self, name: str, calls: list[str], barrier: asyncio.Barrier | None = None
+    ) -> None:
+        super().__init__(name, calls)
+        self._barrier = barrier
+
+    @override
+    async def aexecute(self, input_data: t.JsonMapping) -> p.Result[t.JsonMapping]:
+        if self._barrier is not None:
+            await asyncio.wait_for(self._barrier.wait(), 5)
+        self._calls.append(self.name)
+        return r[t.JsonMapping].ok({"continue": True})
+
+    @override
+    def execute(self, input_data: t.JsonMapping) -> p.Result[t.JsonMapping]:
+        return FlextQualityBaseHook.execute(self, input_data)
+
+
+class _AsyncHangingHook(_AsyncParallelHook):
+    """Coroutine hook that records whether its task was cancelled."""
+
+    timeout_ms: ClassVar[int | None] = 50
+
+    @override
+    async def aexecute(self, input_data: t.JsonMapping) -> p.Result[t.JsonMapping]:
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            self._calls.append("cancelled")
+            raise
+        return await super().aexecute(input_data)
+
+
+class _AsyncRaisingHook(_AsyncParallelHook):
+    """Coroutine hook that raises instead of returning a result."""
+
+    @override
+    async def aexecute(self, input_data: t.JsonMapping) -> p.Result[t.JsonMapping]:
+        await asyncio.sleep(0)
+        msg = "index unavailable"
+        raise RuntimeError(msg)
+
+
+class _StuckHook(_RecordingHook):
+    """Parallel-safe synchronous hook blocked until its release event is set."""
+
+    parallel_safe: ClassVar[bool] = True
+    timeout_ms: ClassVar[int | None] = 50
+    release: ClassVar[threading.Event] = threading.Event()
+
+    @override
+    def execute(self, input_data: t.JsonMapping) -> p.Result[t.JsonMapping]:
+        self.release.wait(30)
+        return super().execute(input_data)
+
+
+class TestsFlextQualityHooks:
+    """Contract tests for the hook manager and its dispatch index."""
+
+    def test_index_matches_exact_wildcard_and_catch_all(self) -> None:
+        calls: list[str] = []
+        hooks = [
+            _BashHook("bash", calls),
+            _EditHook("edit", calls),
+            _RecordingHook("all", calls),
+        ]
+        index = FlextQualityHookDispatchIndex(hooks)
+        names = [hook.name for hook in index.match({"tool_name": "EditNotebook"})]
+        tm.that(names, eq=["edit", "all"])
+        names = [hook.name for hook in index.match({"tool_name": "Bash"})]
+        tm.that(names, eq=["bash", "all"])
+        names = [hook.name for hook in index.match({"tool_name": "Read"})]
+        tm.that(names, eq=["all"])
+
+    def test_index_still_asks_hooks_overriding_should_run(self) -> None:
+        calls: list[str] = []
+        hooks = [_CommandHook("command", calls), _BashHook("bash", calls)]
+        index = FlextQualityHookDispatchIndex(hooks)
+        with_command = {"tool_name": "Bash", "tool_input": {"command": "ls"}}
+        names = [hook.name for hook in index.match(with_command)]
+        tm.that(names, eq=["command", "bash"])
+        names = [hook.name for hook in index.match({"tool_name": "Bash"})]
+        tm.that(names, eq=["bash"])
+
+    def test_manager_runs_matching_hooks_in_order_until_blocked(self) -> None:
+        calls: list[str] = []
+        manager = FlextQualityHookManager()
+        manager.register(_EditHook("edit", calls))
+        manager.register(_RecordingHook("blocker", calls, block=True))
+        manager.register(_RecordingHook("after", calls))
+        result = manager.execute("PreToolUse", {"tool_name": "Write"})
+        tm.that(result.value["continue"], eq=False)
+        tm.that(calls, eq=["edit", "blocker"])
+
+    def test_parallel_safe_hooks_run_concurrently(self) -> None:
+        calls: list[str] = []
+        barrier = threading.Barrier(2, timeout=5)
+        manager = FlextQualityHookManager()
+        manager.register(_ParallelHook("first", calls, barrier))
+        manager.register(_ParallelHook("second", calls, barrier))
+        result = manager.execute("PreToolUse", {"tool_name": "Bash"})
+        tm.that(result.value["continue"], eq=True)
+        tm.that(sorted(calls), eq=["first", "second"])
+
+    def test_first_blocker_in_registration_order_wins(self) -> None:
+        calls: list[str] = []
+        barrier = threading.Barrier(2, timeout=5)
+        manager = FlextQualityHookManager()
+        manager.register(_ParallelHook("slow", calls, barrier, block=True, delay=0.05))
+        manager.register(_ParallelHook("fast", calls, barrier, block=True))
+        manager.register(_RecordingHook("after", calls))
+        result = manager.execute("PreToolUse", {"tool_name": "Bash"})
+        tm.that(result.value["continue"], eq=False)
+        tm.that(calls[-1], eq="slow")
+        tm.that("after" in calls, eq=False)
+
+    def test_timed_out_hook_fails_open_and_is_counted(self) -> None:
+        calls: list[str] = []
+        manager = FlextQualityHookManager()
+        manager.register(_HangingHook("hang", calls))
+        manager.register(_RecordingHook("after", calls))
+        result = manager.execute("PreToolUse", {"tool_name": "Bash"})
+        tm.that(result.value["continue"], eq=True)
+        tm.that(calls, eq=["after"])
+        tm.that(manager.fetch_hook_stats()["_HangingHook"]["timeouts"], eq=1)
+
+    def test_timed_out_fail_closed_hook_blocks(self) -> None:
+        manager = FlextQualityHookManager()
+        manager.register(_HangingClosedHook("hang", []))
+        result = manager.execute("PreToolUse", {"tool_name": "Bash"})
+        tm.that(result.value["continue"], eq=False)
+        tm.that(str(result.value["blockedReason"]), has="timed out")
+
+    def test_event_deadline_caps_hook_deadlines(self) -> None:
+        manager = FlextQualityHookManager(hook_timeout_ms=5000, event_timeout_ms=100)
+        manager.register(_HangingClosedHook("hang", []))
+        started = time.monotonic()
+        result = manager.execute("PreToolUse", {"tool_name": "Bash"})
+        tm.that(result.value["continue"], eq=False)
+        tm.that(time.monotonic() - started < 0.25, eq=True)
+
+    def test_process_exits_while_a_timed_out_hook_still_runs(self) -> None:
+        script = (
+            "import time\n"
+            "from flext_quality import FlextQualityBaseHook as Base\n"
+            "from flext_quality import FlextQualityHookManager, c, r\n"
+            "class Hang(Base):\n"
+            "    event = c.Quality.HookEvent.PRE_TOOL_USE\n"
+            "    timeout_ms = 50\n"
+            "    def execute(self, input_data):\n"
+            "        time.sleep(60)\n"
+            "        return r[dict].ok({})\n"
+            "manager = FlextQualityHookManager()\n"
+            "manager.register(Hang())\n"
+            "result = manager.execute('PreToolUse', {'tool_name': 'Bash'})\n"
+            "print(result.value['continue'])\n"
+        )
+        started = time.monotonic()
+        result = u.Quality.run_shell_command(
+            [sys.executable, "-c", script], timeout_ms=30000
+        )
+        tm.that(result.success, eq=True)
+        tm.that(result.value.strip(), eq="True")
+        tm.that(time.monotonic() - started < 30, eq=True)
+
+    def test_repeatedly_timing_out_hook_is_skipped(self) -> None:
+        manager = FlextQualityHookManager()
+        manager.register(_HangingHook("hang", []))
+        limit = FlextQualitySettings.fetch_global().Quality.hook_breaker_threshold
+        for _ in range(limit + 1):
+            manager.execute("PreToolUse", {"tool_name": "Bash"})
+        stats = manager.fetch_hook_stats()["_HangingHook"]
+        tm.that(stats["timeouts"], eq=limit)
+        tm.that(stats["circuit_opened"], eq=1)
+        tm.that(stats["skipped"], eq=1)
+        tm.that("_HangingHook" in manager.fetch_open_circuits(), eq=True)
+
+    def test_open_circuit_is_probed_after_the_cool_down(self) -> None:
+        now = [1000.0]
+        breaker = FlextQualityHookCircuitBreaker(2, 60.0, 30.0, clock=lambda: now[0])
+        tm.that(breaker.record_failure("hook"), eq=False)
+        tm.that(breaker.record_failure("hook"), eq=True)
+        tm.that(breaker.allow("hook"), eq=False)
+        now[0] += 31.0
+        tm.that(breaker.allow("hook"), eq=True)
+        tm.that(breaker.allow("hook"), eq=False)
+        tm.that(breaker.record_failure("hook"), eq=True)
+        now[0] += 31.0
+        tm.that(breaker.allow("hook"), eq=True)
+        breaker.record_success("hook")
+        tm.that(breaker.allow("hook"), eq=True)
+        tm.that(dict(breaker.open_circuits()), eq={})
+
+    def test_failures_outside_the_window_do_not_open_the_circuit(self) -> None:
+        now = [1000.0]
+        breaker = FlextQualityHookCircuitBreaker(2, 10.0, 30.0, clock=lambda: now[0])
+        breaker.record_failure("hook")
+        now[0] += 11.0
+        tm.that(breaker.record_failure("hook"), eq=False)
+        tm.that(breaker.allow("hook"), eq=True)
+
+    def test_circuit_state_is_shared_through_the_state_file(
+        self, tmp_path: Path
+    ) -> None:
+        state_path = tmp_path / "breaker.json"
+        first = FlextQualityHookCircuitBreaker(1, 60.0, 30.0, state_path=state_path)
+        tm.that(first.record_failure("hook"), eq=True)
+        second = FlextQualityHookCircuitBreaker(1, 60.0, 30.0, state_path=state_path)
+        tm.that(second.allow("hook"), eq=False)
+
+    def test_one_probe_is_let_through_across_shared_breakers(
+        self, tmp_path: Path
+    ) -> None:
+        state_path = tmp_path / "breaker.json"
+        opener = FlextQualityHookCircuitBreaker(
+            1, 60.0, 30.0, state_path=state_path, clock=lambda: 1000.0
+        )
+        tm.that(opener.record_failure("hook"), eq=True)
+        breakers = [
+            FlextQualityHookCircuitBreaker(
+                1, 60.0, 30.0, state_path=state_path, clock=lambda: 2000.0
+            )
+            for _ in range(8)
+        ]
+        with ThreadPoolExecutor(max_workers=len(breakers)) as workers:
+            allowed = list(workers.map(lambda breaker: breaker.allow("hook"), breakers))
+        tm.that(allowed.count(True), eq=1)
+
+    def test_async_hooks_run_concurrently_on_the_event_loop(self) -> None:
+        calls: list[str] = []
+
+        async def run() -> p.Result[t.JsonMapping]:
+            barrier = asyncio.Barrier(2)
+            manager.register(_AsyncParallelHook("first", calls, barrier))
+            manager.register(_AsyncParallelHook("second", calls, barrier))
+            manager.register(_RecordingHook("sync", calls))
+            return await manager.aexecute("PreToolUse", {"tool_name": "Bash"})
+
+        manager = FlextQualityHookManager()
+        result = asyncio.run(run())
+        tm.that(result.value["continue"], eq=True)
+        tm.that(sorted(calls[:2]), eq=["first", "second"])
+        tm.that(calls[2], eq="sync")
+
+    def test_async_timeout_cancels_the_hook_task(self) -> None:
+        calls: list[str] = []
+        manager = FlextQualityHookManager()
+        manager.register(_AsyncHangingHook("hang", calls))
+        result = asyncio.run(manager.aexecute("PreToolUse", {"tool_name": "Bash"}))
+        tm.that(result.value["continue"], eq=True)
+        tm.that(calls, eq=["cancelled"])
+        tm.that(manager.fetch_hook_stats()["_AsyncHangingHook"]["timeouts"], eq=1)
+
+    def test_async_hook_exception_becomes_a_failure(self) -> None:
+        manager = FlextQualityHookManager()
+        manager.register(_AsyncRaisingHook("raise", []))
+        result = asyncio.run(manager.aexecute("PreToolUse", {"tool_name": "Bash"}))
+        tm.that(result.failure, eq=True)
+        tm.that(str(result.error), has="index unavailable")
+        tm.that(manager.fetch_hook_stats()["_AsyncRaisingHook"]["failed"], eq=1)
+        tm.that(manager.fetch_latency()["events"], has="PreToolUse")
+
+    def test_async_path_abandons_timed_out_sync_hooks(self) -> None:
+        limit = c.Quality.HOOK_ABANDONED_RUNS_MAX
+        manager = FlextQualityHookManager()
+        for index in range(limit):
+            stuck = type(f"_Stuck{index}", (_StuckHook,), {})
+            manager.register(stuck(f"stuck-{index}", []))
+        _StuckHook.release.clear()
+        try:
+            asyncio.run(manager.aexecute("PreToolUse", {"tool_name": "Bash"}))
+            calls: list[str] = []
+            manager.register(_RecordingHook("later", calls))
+            result = asyncio.run(manager.aexecute("PreToolUse", {"tool_name": "Bash"}))
+        finally:
+            _StuckHook.release.set()
+        tm.that(result.value["continue"], eq=True)
+        tm.that(calls, eq=[])
+        tm.that(manager.fetch_hook_stats()["_RecordingHook"]["skipped"], eq=1)
+
+    def test_async_only_hook_runs_on_the_sync_path(self) -> None:
+        calls: list[str] = []
+        manager = FlextQualityHookManager()
+        manager.register(_AsyncParallelHook("async", calls))
+        result = manager.execute("PreToolUse", {"tool_name": "Bash"})
+        tm.that(result.value["continue"], eq=True)
+        tm.that(calls, eq=["async"])
+
+    def test_latency_histogram_reports_percentiles_within_one_percent(self) -> None:
+        histogram = FlextQualityLatencyHistogram()
+        for micros in range(1, 10001):
+            histogram.record(micros / 1_000_000)
+        summary = histogram.summary()
+        tm.that(summary["count"], eq=10000)
+        tm.that(summary["max_us"], eq=10000)
+        for percentile in (50, 95, 99):
+            expected = percentile * 100
+            reported = summary[f"p{percentile}_us"]
+            tm.that(expected <= reported <= expected * 1.01, eq=True)
+
+    def test_manager_records_latency_and_outcome_counters(self) -> None:
+        manager = FlextQualityHookManager()
+        manager.register(_EditHook("edit", []))
+        manager.register(_BashHook("bash", [], block=True))
+        manager.execute("PreToolUse", {"tool_name": "Write"})
+        manager.execute("PreToolUse", {"tool_name": "Bash"})
+        latency = manager.fetch_latency()
+        tm.that(latency["hooks"]["_EditHook"]["count"], eq=1)
+        tm.that(latency["hooks"]["_BashHook"]["count"], eq=1)
+        tm.that(latency["events"]["PreToolUse"]["count"], eq=2)
+        tm.that(manager.fetch_hook_stats()["_BashHook"]["blocked"], eq=1)
+
+    def test_hook_server_answers_forwarded_payloads(self, tmp_path: Path) -> None:
+        seen: list[bytes] = []
+
+        def processor(raw: bytes) -> p.Result[t.JsonMapping]:
+            seen.append(raw)
+            return r[t.JsonMapping].ok({"continue": False, "blockedReason": "no"})
+
+        server = FlextQualityHookServer(processor, tmp_path / "hooks.sock")
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            tm.that(server.wait_ready(5), eq=True)
+            response = forward(b'{"event": "PreToolUse"}', str(server.socket_path))
+        finally:
+            server.shutdown()
+            thread.join(5)
+        tm.that(response, eq=b'{"continue":false,"blockedReason":"no"}\n')
+        tm.that(seen, eq=[b'{"event": "PreToolUse"}'])
+        tm.that(server.socket_path.exists(), eq=False)
+
+    def test_silent_client_is_disconnected(self, tmp_path: Path) -> None:
+        server = FlextQualityHookServer(
+            lambda _raw: r[t.JsonMapping].ok({"continue": True}),
+            tmp_path / "hooks.sock",
+            read_timeout_ms=100,
+        )
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            tm.that(server.wait_ready(5), eq=True)
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+                conn.settimeout(5)
+                conn.connect(str(server.socket_path))
+                conn.sendall(b'{"event": "Pre')
+                tm.that(conn.recv(1024), eq=b"")
+        finally:
+            server.shutdown()
+            thread.join(5)
+
+    def test_fork_mode_isolates_state_between_events(self, tmp_path: Path) -> None:
+        calls: list[bytes] = []
+
+        def processor(raw: bytes) -> p.Result[t.JsonMapping]:
+            calls.append(raw)
+            return r[t.JsonMapping].ok({"continue": True, "calls": len(calls)})
+
+        server = FlextQualityHookServer(
+            processor, tmp_path / "hooks.sock", mode=c.Quality.HookServerMode.FORK
+        )
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            tm.that(server.wait_ready(5), eq=True)
+            first = forward(b"{}", str(server.socket_path))
+            second = forward(b"{}", str(server.socket_path))
+        finally:
+            server.shutdown()
+            thread.join(5)
+        tm.that(first, eq=b'{"continue":true,"calls":1}\n')
+        tm.that(second, eq=first)
+        tm.that(calls, eq=[])
+
+    def test_fork_mode_children_inherit_the_prewarmed_state(
+        self, tmp_path: Path
+    ) -> None:
+        warmed: list[str] = []
+
+        def processor(_raw: bytes) -> p.Result[t.JsonMapping]:
+            return r[t.JsonMapping].ok({"continue": True, "warmed": len(warmed)})
+
+        server = FlextQualityHookServer(
+            processor,
+            tmp_path / "hooks.sock",
+            mode=c.Quality.HookServerMode.FORK,
+            prewarm=lambda: warmed.append("rules"),
+        )
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            tm.that(server.wait_ready(5), eq=True)
+            response = forward(b"{}", str(server.socket_path))
+        finally:
+            server.shutdown()
+            thread.join(5)
+        tm.that(response, eq=b'{"continue":true,"warmed":1}\n')
+        tm.that(warmed, eq=["rules"])
+
+    def test_hook_client_reports_missing_server(self, tmp_path: Path) -> None:
+        tm.that(forward(b"{}", str(tmp_path / "absent.sock")) is None, eq=True)
+
+    def test_hook_client_run_by_path_processes_locally(self, tmp_path: Path) -> None:
+        client_path = Path(hook_client.__file__)
+        script = (
+            "import io, os, runpy, sys\n"
+            f"sys.path.insert(0, {str(client_path.parent)!r})\n"
+            f"os.environ[{hook_client.SOCKET_ENV_VAR!r}] = "
+            f"{str(tmp_path / 'absent.sock')!r}\n"
+            "sys.stdin = io.TextIOWrapper(io.BytesIO("
+            'b\'{"event": "PreToolUse", "tool_name": "Bash"}\'))\n'
+            f"runpy.run_path({str(client_path)!r}, run_name='__main__')\n"
+        )
+        result = u.Quality.run_shell_command(
+            [sys.executable, "-c", script], timeout_ms=30000
+        )
+        tm.that(result.value.strip(), eq='{"continue":true}')
+
+    def test_pure_hook_results_are_memoised_by_relevant_input(self) -> None:
+        calls: list[str] = []
+        manager = FlextQualityHookManager(cache=FlextQualityHookResultCache(8, 60.0))
+        manager.register(_PureReadHook("read", calls))
+        for offset in (1, 2):
+            manager.execute(
+                "PreToolUse",
+                {"tool_name": "Read", "tool_input": {"file_path": "a.py", "n": offset}},
+            )
+        manager.execute(
+            "PreToolUse", {"tool_name": "Read", "tool_input": {"file_path": "b.py"}}
+        )
+        tm.that(calls, eq=["read", "read"])
+        stats = manager.fetch_cache_stats()
+        tm.that(stats["hits"], eq=1)
+        tm.that(stats["misses"], eq=2)
+
+    def test_result_cache_expires_and_evicts_least_recently_used(self) -> None:
+        now = [0.0]
+        cache = FlextQualityHookResultCache(2, 10.0, clock=lambda: now[0])
+        ok = r[t.JsonMapping].ok({"continue": True})
+        cache.put("a", ok)
+        cache.put("b", ok)
+        tm.that(cache.get("a") is ok, eq=True)
+        cache.put("c", ok)
+        tm.that(cache.get("b") is None, eq=True)
+        now[0] = 11.0
+        tm.that(cache.get("a") is None, eq=True)
+        tm.that(cache.stats()["hits"], eq=1)
+
+    def test_result_cache_key_ignores_nested_key_order(self) -> None:
+        hook = _EditHook("edit", [])
+        first = FlextQualityHookResultCache.key(
+            hook,
+            {
+                "tool_name": "Edit",
+                "tool_input": {
+                    "file_path": "a.py",
+                    "opts": {"x": 1, "y": [{"b": 2, "a": 1}]},
+                },
+            },
+        )
+        second = FlextQualityHookResultCache.key(
+            hook,
+            {
+                "tool_input": {
+                    "opts": {"y": [{"a": 1, "b": 2}], "x": 1},
+                    "file_path": "a.py",
+                },
+                "tool_name": "Edit",
+            },
+        )
+        other = FlextQualityHookResultCache.key(
+            hook, {"tool_name": "Edit", "tool_input": {"file_path": "b.py"}}
+        )
+        tm.that(first, eq=second)
+        tm.that(first == other, eq=False)
+
+    def test_payload_decodes_fields_lazily(self) -> None:
+        raw = (
+            b'{"event": "PreToolUse", "tool_name": "Write", '
+            b'"tool_input": {"content": "a \\"}\\" [", "n": [1, {"x": []}]}}'
+        )
+        payload = FlextQualityHookPayload.parse(raw).value
+        tm.that(list(payload), eq=["event", "tool_name", "tool_input"])
+        tm.that(payload["tool_name"], eq="Write")
+        tm.that(payload["tool_input"], eq={"content": 'a "}" [', "n": [1, {"x": []}]})
+
+    def test_payload_rejects_malformed_and_oversized_input(self) -> None:
+        tm.that(FlextQualityHookPayload.parse(b"[1]").failure, eq=True)
+        tm.that(FlextQualityHookPayload.parse(b'{"a": "x}').failure, eq=True)
+        too_big = FlextQualityHookPayload.parse(b'{"a": 1}', max_bytes=4)
+        tm.that(too_big.failure, eq=True)
+
+    def test_payload_rejects_malformed_values_and_trailing_data(self) -> None:
+        for raw in (b'{"event": tru}', b'{"tool_name": 1.2.3}', b'{"a": 1} x'):
+            tm.that(FlextQualityHookPayload.parse(raw).failure, eq=True)
+        payload = FlextQualityHookPayload.parse(
+            b'{"event": "PreToolUse", "tool_input": {"file_path": tru}} \n'
+        ).value
+        tm.that(payload["event"], eq="PreToolUse")
+        decoded = payload.decode("tool_input")
+        tm.that(decoded.failure, eq=True)
+        tm.that(decoded.error or "", has="tool_input")
+
+    def test_recorder_fails_on_a_malformed_nested_value(self, tmp_path: Path) -> None:
+        payload = FlextQualityHookPayload.parse(
+            b'{"event": "PostToolUse", "tool_input": [tru]}'
+        ).value
+        recorded = FlextQualityHookRecorder(tmp_path / "corpus.ndjson").record(payload)
+        tm.that(recorded.failure, eq=True)
+        tm.that(recorded.error or "", has="tool_input")
+
+    def test_recorder_anonymises_payloads_keeping_their_shape(
+        self, tmp_path: Path
+    ) -> None:
+        recorder = FlextQualityHookRecorder(tmp_path / "corpus.ndjson")
+        payload: t.JsonMapping = {
+            "event": "PreToolUse",
+            "session_id": "secret-session",
+            "tool_name": "Write",
+            "tool_input": {
+                "file_path": "/home/me/app.py",
+                "content": "token=42",
+                "description": "rotate key",
+            },
+        }
+        tm.that(recorder.record(payload).success, eq=True)
+        tm.that(recorder.record(payload).success, eq=True)
+        corpus = FlextQualityHookRecorder.load(recorder.path).value
+        tm.that(len(corpus), eq=2)
+        tm.that(corpus[0], eq=corpus[1])
+        recorded = t.json_mapping_adapter().validate_json(corpus[0])
+        tool_input = recorded["tool_input"]
+        tm.that(isinstance(tool_input, dict), eq=True)
+        if isinstance(tool_input, dict):
+            tm.that(tool_input["content"], eq="xxxxxxxx")
+            tm.that(tool_input["description"], eq="xxxxxxxxxx")
+            tm.that(str(tool_input["file_path"]).endswith(".py"), eq=True)
+        tm.that(b"secret-session" in corpus[0], eq=False)
+        tm.that(b"/home/me" in corpus[0], eq=False)
+        tm.that(recorded["tool_name"], eq="Write")
+
+    def test_warm_replay_does_not_record(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        corpus_path = tmp_path / "corpus.ndjson"
+        settings = FlextQualitySettings.fetch_global()
+        monkeypatch.setattr(settings.Quality, "hook_record_path", str(corpus_path))
+        corpus = [b'{"event": "PreToolUse", "tool_name": "Bash", "tool_input": {}}']
+        tm.that(FlextQualityHookReplay(corpus).warm(rounds=2).success, eq=True)
+        tm.that(corpus_path.exists(), eq=False)
+
+    def test_replay_reports_warm_latency_and_throughput(self) -> None:
+        corpus = [b'{"event": "PreToolUse", "tool_name": "Bash", "tool_input": {}}']
+        summary = FlextQualityHookReplay(corpus).warm(rounds=3).value
+        tm.that(summary["count"], eq=3)
+        tm.that(summary["failures"], eq=0)
+        tm.that(summary["events_per_second"] > 0, eq=True)
+
+    def test_replay_times_and_counts_failed_events(self) -> None:
+        corpus = [
+            b'{"event": "Notification", "message": "waiting"}',
+            b'{"event": "PreToolUse", "tool_name": "Bash", "tool_input": {}}',
+        ]
+        replay = FlextQualityHookReplay(corpus)
+        warm = replay.warm(rounds=2).value
+        tm.that(warm["count"], eq=4)
+        tm.that(warm["failures"], eq=2)
+        cold = replay.cold(2).value
+        tm.that(cold["count"], eq=2)
+        tm.that(cold["failures"], eq=1)
+
+    def test_cold_replay_pipes_payloads_past_the_argv_limit(self) -> None:
+        content = "x" * (256 * 1024)
+        payload = (
+            b'{"event": "PreToolUse", "tool_name": "Write", '
+            b'"tool_input": {"content": "' + content.encode() + b'"}}'
+        )
+        summary = FlextQualityHookReplay([payload]).cold(1)
+        tm.that(summary.success, eq=True)
+        tm.that(summary.value["count"], eq=1)
+        tm.that(summary.value["failures"], eq=0)
+
+    def test_config_file_declares_ordered_hooks_with_overrides(
+        self, tmp_path: Path
+    ) -> None:
+        config_path = tmp_path / "hooks.yaml"
+        config_path.write_text(
+            "hooks:\n"
+            f"  - hook: {__name__}:_ConfiguredHook\n"
+            "    name: Later\n"
+            "    order: 5\n"
+            f"  - hook: {__name__}:_ConfiguredHook\n"
+            "    name: Earlier\n"
+            "    order: 1\n"
+            "    matcher: [Bash]\n"
+            "    timeout_ms: 200\n",
+            encoding="utf-8",
+        )
+        _ConfiguredHook.calls.clear()
+        manager = FlextQualityHookManager(config_path)
+        manager.execute("PreToolUse", {"tool_name": "Bash"})
+        manager.execute("PreToolUse", {"tool_name": "Read"})
+        tm.that(_ConfiguredHook.calls, eq=["Earlier", "Later", "Later"])
+
+    def test_changed_config_swaps_the_snapshot(self, tmp_path: Path) -> None:
+        config_path = tmp_path / "hooks.toml"
+        entry = f'[[hooks]]\nhook = "{__name__}:_ConfiguredHook"\nname = "First"\n'
+        config_path.write_text(entry, encoding="utf-8")
+        _ConfiguredHook.calls.clear()
+        manager = FlextQualityHookManager(config_path)
+        manager.execute("PreToolUse", {"tool_name": "Bash"})
+        config_path.write_text(entry.replace("First", "Second"), encoding="utf-8")
+        stat = config_path.stat()
+        os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        manager.execute("PreToolUse", {"tool_name": "Bash"})
+        tm.that(_ConfiguredHook.calls, eq=["First", "Second"])
+
+    def test_registering_a_hook_bumps_the_snapshot_generation(self) -> None:
+        manager = FlextQualityHookManager()
+        before = manager.fetch_generation()
+        manager.register(_BashHook("bash", []))
+        tm.that(manager.fetch_generation(), eq=before + 1)
+        tm.that(manager.fetch_config_json(), has="Bash")
+
+    def test_invalid_config_keeps_the_previous_snapshot(self, tmp_path: Path) -> None:
+        config_path = tmp_path / "hooks.yaml"
+        config_path.write_text(
+            f"hooks:\n  - hook: {__name__}:_ConfiguredHook\n", encoding="utf-8"
+        )
+        manager = FlextQualityHookManager(config_path)
+        config_path.write_text(
+            "hooks:\n  - hook: no.such.module:Hook\n", encoding="utf-8"
+        )
+        reloaded = manager.reload()
+        tm.that(reloaded.failure, eq=True)
+        tm.that(str(reloaded.error), has="no.such.module")
+        tm.that(len(manager.fetch_config()["PreToolUse"]), eq=1)
+
+    @pytest.mark.parametrize(
+        ("document", "reason"),
+        [
+            ("hooks: [not-a-table]\n", "Invalid hook configuration"),
+            (f"hooks:\n  - hook: {__name__}:_BrokenConfiguredHook\n", "credentials"),
+        ],
+    )
+    def test_malformed_config_fails_without_raising(
+        self, tmp_path: Path, document: str, reason: str
+    ) -> None:
+        config_path = tmp_path / "hooks.yaml"
+        config_path.write_text(document, encoding="utf-8")
+        loaded = FlextQualityHookConfig(config_path).load()
+        tm.that(loaded.failure, eq=True)
+        tm.that(str(loaded.error), has=reason)
+
+    def test_debouncer_lets_only_the_latest_event_of_a_burst_through(self) -> None:
+        debouncer = FlextQualityHookDebouncer()
+        outcomes: dict[int, bool] = {}
+
+        def arrive(index: int) -> None:
+            outcomes[index] = debouncer.wait("a.py", 0.1)
+
+        threads = [threading.Thread(target=arrive, args=(i,)) for i in range(3)]
+        for thread in threads:
+            thread.start()
+            time.sleep(0.02)
+        for thread in threads:
+            thread.join(5)
+        tm.that(outcomes, eq={0: False, 1: False, 2: True})
+        tm.that(len(debouncer), eq=0)
+
+    def test_post_tool_use_bursts_are_validated_once_per_file(self) -> None:
+        calls: list[str] = []
+        manager = FlextQualityHookManager(debounce_ms=100)
+        manager.register(_PostEditHook("post", calls))
+        results: dict[str, p.Result[t.JsonMapping]] = {}
+
+        def edit(path: str, content: str) -> None:
+            results[content] = manager.execute(
+                "PostToolUse",
+                {
+                    "tool_name": "Edit",
+                    "tool_input": {"file_path": path, "content": content},
+                },
+            )
+
+        edits = [("a.py", "a1"), ("b.py", "b1"), ("a.py", "a2"), ("a.py", "a3")]
+        threads = [threading.Thread(target=edit, args=pair) for pair in edits]
+        for thread in threads:
+            thread.start()
+            time.sleep(0.02)
+        for thread in threads:
+            thread.join(5)
+        tm.that(sorted(calls), eq=["a3", "b1"])
+        tm.that(all(result.value["continue"] for result in results.values()), eq=True)
+        tm.that(manager.fetch_hook_stats()["PostToolUse"]["coalesced"], eq=2)
+
+    def test_manager_rejects_unknown_event(self) -> None:
+        result = FlextQualityHookManager().execute("NoSuchEvent", {})
+        tm.that(result.failure, eq=True)
+
+
+__all__: list[str] = ["TestsFlextQualityHooks"]
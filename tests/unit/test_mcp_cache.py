@@ -0,0 +1,93 @@
+"""Behavioral tests for the MCP resource cache.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+"""
+
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING
+
+import pytest
+
+from flext_quality import FlextQualityMcpResourceCache
+from flext_tests import tm
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+class TestsFlextQualityMcpResourceCache:
+    """Cached resources are rebuilt only after their inputs change."""
+
+    def test_watched_entry_is_rebuilt_after_file_change(self, tmp_path: Path) -> None:
+        rules = tmp_path / "rules.yaml"
+        rules.write_text("first", encoding="utf-8")
+        builds: list[str] = []
+
+        def build() -> str:
+            builds.append(rules.read_text(encoding="utf-8"))
+            return builds[-1]
+
+        cache = FlextQualityMcpResourceCache(3600)
+        try:
+            tm.that(cache.get("rules", build, watch=(tmp_path,)), eq="first")
+            cache.poll()
+            tm.that(cache.get("rules", build, watch=(tmp_path,)), eq="first")
+            rules.write_text("second", encoding="utf-8")
+            stat = rules.stat()
+            os.utime(rules, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+            cache.poll()
+            tm.that(cache.get("rules", build, watch=(tmp_path,)), eq="second")
+            tm.that(builds, eq=["first", "second"])
+        finally:
+            cache.close()
+
+    def test_ttl_entry_expires(self) -> None:
+        now = [0.0]
+        builds: list[float] = []
+
+        def build() -> str:
+            builds.append(now[0])
+            return "status"
+
+        cache = FlextQualityMcpResourceCache(3600, clock=lambda: now[0])
+        cache.get("status", build, ttl_seconds=30)
+        now[0] = 29.0
+        cache.get("status", build, ttl_seconds=30)
+        now[0] = 31.0
+        cache.get("status", build, ttl_seconds=30)
+        tm.that(builds, eq=[0.0, 31.0])
+        cache.close()
+        tm.that(len(cache), eq=0)
+
+    def test_entry_is_rebuilt_for_a_new_version(self) -> None:
+        builds: list[int] = []
+        version = [1]
+
+        def build() -> str:
+            builds.append(version[0])
+            return f"v{version[0]}"
+
+        cache = FlextQualityMcpResourceCache(3600)
+        tm.that(cache.get("hooks", build, version=version[0]), eq="v1")
+        tm.that(cache.get("hooks", build, version=version[0]), eq="v1")
+        version[0] = 2
+        tm.that(cache.get("hooks", build, version=version[0]), eq="v2")
+        tm.that(builds, eq=[1, 2])
+
+    def test_failed_build_is_not_cached(self) -> None:
+        cache = FlextQualityMcpResourceCache(3600)
+
+        def fail() -> str:
+            msg = "unavailable"
+            raise RuntimeError(msg)
+
+        with pytest.raises(RuntimeError):
+            cache.get("hooks", fail)
+        tm.that(len(cache), eq=0)
+        tm.that(cache.get("hooks", lambda: "ok"), eq="ok")
+
+
+__all__: list[str] = ["TestsFlextQualityMcpResourceCache"]
@@ -0,0 +1,119 @@
+"""Behavioral tests for pooled MCP sessions against a stand-in server.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+"""
+
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+import pytest
+from fastmcp import FastMCP
+
+from flext_quality import (
+    FlextQualityClaudeMemClient,
+    FlextQualityMcpClient,
+    FlextQualityMcpSessionPool,
+    c,
+)
+from flext_tests import tm
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+class TestsFlextQualityMcpSessionPool:
+    """Tool calls reuse one open session per server."""
+
+    @pytest.fixture
+    def pool(self) -> Iterator[FlextQualityMcpSessionPool]:
+        stand_in = FastMCP("claude-mem-stand-in")
+
+        @stand_in.tool
+        def search(query: str, limit: int = 10) -> dict[str, str | int]:
+            return {"query": query, "limit": limit}
+
+        @stand_in.tool
+        def broken() -> str:
+            msg = "index unavailable"
+            raise RuntimeError(msg)
+
+        @stand_in.tool
+        async def slow() -> str:
+            await asyncio.sleep(5)
+            return "late"
+
+        @stand_in.tool
+        async def reentrant() -> str:
+            await asyncio.sleep(0)
+            nested = pool.call(call.model_copy(update={"tool": "search"}))
+            registered = pool.register("other", stand_in)
+            return f"{nested.error}|{registered.error}"
+
+        pool = FlextQualityMcpSessionPool({c.Quality.CLAUDE_MEM_SERVER_NAME: stand_in})
+        call = (
+            FlextQualityClaudeMemClient(sessions=pool)
+            .build_get_observations_call([1])
+            .value
+        )
+        yield pool
+        pool.close()
+
+    def test_search_returns_parsed_tool_result(
+        self, pool: FlextQualityMcpSessionPool
+    ) -> None:
+        client = FlextQualityClaudeMemClient(sessions=pool)
+        result = client.search("flaky test", limit=3)
+        tm.that(result.success, eq=True)
+        tm.that(result.value.success, eq=True)
+        tm.that(result.value.data, eq={"query": "flaky test", "limit": "3"})
+
+    def test_concurrent_calls_share_one_session(
+        self, pool: FlextQualityMcpSessionPool
+    ) -> None:
+        client = FlextQualityClaudeMemClient(sessions=pool)
+        with ThreadPoolExecutor(max_workers=8) as workers:
+            results = list(workers.map(client.search, [str(i) for i in range(16)]))
+        tm.that(all(result.success for result in results), eq=True)
+        tm.that(len(pool), eq=1)
+
+    def test_tool_error_is_reported_in_result(
+        self, pool: FlextQualityMcpSessionPool
+    ) -> None:
+        client = FlextQualityClaudeMemClient(sessions=pool)
+        call = client.build_get_observations_call([1]).value
+        broken = call.model_copy(update={"tool": "broken"})
+        result = pool.call(broken)
+        tm.that(result.success, eq=True)
+        tm.that(result.value.exit_code, eq=1)
+        tm.that(result.value.stdout, has="index unavailable")
+
+    def test_client_timeout_bounds_pooled_calls(
+        self, pool: FlextQualityMcpSessionPool
+    ) -> None:
+        client = FlextQualityMcpClient(timeout_ms=200, sessions=pool)
+        call = client.build_tool_call(c.Quality.CLAUDE_MEM_SERVER_NAME, "slow").value
+        tm.that(client.call_tool(call).error or "", has="timed out")
+        tm.that(asyncio.run(client.acall_tool(call)).error or "", has="timed out")
+
+    def test_blocking_calls_from_the_session_loop_fail(
+        self, pool: FlextQualityMcpSessionPool
+    ) -> None:
+        client = FlextQualityClaudeMemClient(sessions=pool)
+        call = client.build_get_observations_call([1]).value
+        result = pool.call(call.model_copy(update={"tool": "reentrant"}))
+        tm.that(result.value.stdout, has="use acall")
+        tm.that(result.value.stdout, has="from the session loop")
+        tm.that(pool.serves("other"), eq=False)
+
+    def test_unconfigured_server_fails(self) -> None:
+        pool = FlextQualityMcpSessionPool()
+        result = FlextQualityClaudeMemClient(sessions=pool).search("query")
+        tm.that(result.failure, eq=True)
+        tm.that(result.error or "", has=c.Quality.CLAUDE_MEM_SERVER_NAME)
+
+
+__all__: list[str] = ["TestsFlextQualityMcpSessionPool"]
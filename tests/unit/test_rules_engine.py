@@ -0,0 +1,433 @@
+"""Behavioral tests for the YAML rules engine.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import os
+from typing import TYPE_CHECKING
+
+import pytest
+
+from flext_quality import (
+    FlextQualityBaseline,
+    FlextQualityResultWriters,
+    FlextQualityRulesEngine,
+    FlextQualitySettings,
+    FlextQualityViolationPages,
+    c,
+)
+from flext_tests import tm
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+class TestsFlextQualityRulesEngine:
+    """Contract tests for rule validation over files and directories."""
+
+    @pytest.fixture
+    def rules_path(self, tmp_path: Path) -> Path:
+        path = tmp_path / "rules.yaml"
+        path.write_text(
+            "rules:\n"
+            "  - name: no-print\n"
+            "    type: warning\n"
+            "    description: print call\n"
+            '    pattern: "print\\\\("\n',
+            encoding="utf-8",
+        )
+        return path
+
+    @pytest.fixture
+    def source_dir(self, tmp_path: Path) -> Path:
+        src = tmp_path / "src"
+        src.mkdir()
+        (src / "module.py").write_text("print(1)\nx = 1\n", encoding="utf-8")
+        return src
+
+    # ---- Baseline -------------------------------------------------------
+
+    def test_fingerprint_ignores_whitespace_changes(self) -> None:
+        first = FlextQualityBaseline.fingerprint("r", "a.py", "print( 1 )")
+        second = FlextQualityBaseline.fingerprint("r", "a.py", "   print(  1 )  ")
+        tm.that(first, eq=second)
+
+    def test_fingerprint_depends_on_rule_and_file(self) -> None:
+        base = FlextQualityBaseline.fingerprint("r", "a.py", "print(1)")
+        other_rule = FlextQualityBaseline.fingerprint("s", "a.py", "print(1)")
+        other_file = FlextQualityBaseline.fingerprint("r", "b.py", "print(1)")
+        tm.that(other_rule != base, eq=True)
+        tm.that(other_file != base, eq=True)
+
+    def test_baseline_round_trips_sorted(self, tmp_path: Path) -> None:
+        path = tmp_path / "baseline"
+        written = FlextQualityBaseline(["b", "a"]).write(path)
+        tm.that(written.value, eq=2)
+        lines = path.read_text(encoding="utf-8").splitlines()
+        tm.that(lines[1:], eq=["a", "b"])
+        tm.that(lines[0], has="root=.")
+        loaded = FlextQualityBaseline.load(path).value
+        tm.that("a" in loaded, eq=True)
+        tm.that(len(loaded), eq=2)
+
+    def test_baseline_suppresses_recorded_violations(
+        self, tmp_path: Path, rules_path: Path, source_dir: Path
+    ) -> None:
+        baseline_path = tmp_path / "baseline"
+        engine = FlextQualityRulesEngine(rules_path)
+        tm.that(engine.record_baseline(str(source_dir), baseline_path).value, eq=1)
+        engine.set_baseline(FlextQualityBaseline.load(baseline_path).value)
+        tm.that(list(engine.validate(str(source_dir)).value), eq=[])
+        (source_dir / "module.py").write_text("print(1)\nprint(2)\n", encoding="utf-8")
+        violations = engine.validate(str(source_dir)).value
+        tm.that(len(violations), eq=1)
+        tm.that(violations[0]["line"], eq=2)
+
+    def test_baseline_matches_a_moved_checkout(
+        self, tmp_path: Path, rules_path: Path, source_dir: Path
+    ) -> None:
+        baseline_path = source_dir / ".flext-quality-baseline"
+        engine = FlextQualityRulesEngine(rules_path)
+        engine.record_baseline(str(source_dir), baseline_path)
+        moved = source_dir.rename(tmp_path / "other-checkout")
+        loaded = FlextQualityBaseline.load(moved / ".flext-quality-baseline").value
+        engine.set_baseline(loaded)
+        tm.that(list(engine.validate(str(moved)).value), eq=[])
+
+    def test_baseline_matches_subdirectory_and_single_file_scans(
+        self, tmp_path: Path, rules_path: Path
+    ) -> None:
+        package = tmp_path / "src" / "pkg"
+        package.mkdir(parents=True)
+        module = package / "mod.py"
+        module.write_text("print(1)\n", encoding="utf-8")
+        baseline_path = tmp_path / ".flext-quality-baseline"
+        engine = FlextQualityRulesEngine(rules_path)
+        tm.that(engine.record_baseline(str(tmp_path), baseline_path).value, eq=1)
+        engine.set_baseline(FlextQualityBaseline.load(baseline_path).value)
+        for target in (tmp_path / "src", package, module):
+            tm.that(list(engine.validate(str(target)).value), eq=[])
+        tm.that(list(engine.validate_content("print(1)\n", str(module)).value), eq=[])
+        module.write_text("print(1)\nprint(2)\n", encoding="utf-8")
+        tm.that(len(engine.validate(str(module)).value), eq=1)
+
+    def test_new_copy_of_baselined_line_is_reported(
+        self, tmp_path: Path, rules_path: Path, source_dir: Path
+    ) -> None:
+        baseline_path = tmp_path / "baseline"
+        engine = FlextQualityRulesEngine(rules_path)
+        engine.record_baseline(str(source_dir), baseline_path)
+        engine.set_baseline(FlextQualityBaseline.load(baseline_path).value)
+        (source_dir / "module.py").write_text("print(1)\nprint(1)\n", encoding="utf-8")
+        violations = engine.validate(str(source_dir)).value
+        tm.that([v["line"] for v in violations], eq=[2])
+
+    def test_outdated_baseline_format_is_rejected(self, tmp_path: Path) -> None:
+        path = tmp_path / "baseline"
+        path.write_text("# flext-quality baseline v1\nabc\n", encoding="utf-8")
+        tm.that(FlextQualityBaseline.load(path).failure, eq=True)
+        path.write_text(f"{c.Quality.BASELINE_HEADER}\nabc\n", encoding="utf-8")
+        tm.that(FlextQualityBaseline.load(path).failure, eq=True)
+
+    # ---- Extension routing ----------------------------------------------
+
+    def test_rules_only_scan_their_declared_file_types(self, tmp_path: Path) -> None:
+        rules_path = tmp_path / "rules.yaml"
+        rules_path.write_text(
+            "rules:\n"
+            "  - name: todo-marker\n"
+            "    type: info\n"
+            "    description: todo\n"
+            "    pattern: TODO\n"
+            "    file_types: [md, yaml]\n",
+            encoding="utf-8",
+        )
+        (tmp_path / "notes.md").write_text("TODO\n", encoding="utf-8")
+        (tmp_path / "conf.yml").write_text("# TODO\n", encoding="utf-8")
+        (tmp_path / "code.py").write_text("# TODO\n", encoding="utf-8")
+        violations = FlextQualityRulesEngine(rules_path).validate(str(tmp_path)).value
+        files = sorted(str(v["file"]).rsplit("/", 1)[-1] for v in violations)
+        tm.that(files, eq=["conf.yml", "notes.md"])
+
+    @pytest.mark.parametrize(
+        ("filename", "expected"),
+        [
+            ("notes.md", ["md-todo"]),
+            ("module.py", ["py-todo"]),
+            ("settings.cfg", ["md-todo", "py-todo"]),
+            ("Makefile", ["md-todo", "py-todo"]),
+            ("<string>", ["md-todo", "py-todo"]),
+        ],
+    )
+    def test_content_without_a_routed_suffix_gets_every_rule(
+        self, tmp_path: Path, filename: str, expected: list[str]
+    ) -> None:
+        rules_path = tmp_path / "rules.yaml"
+        rules_path.write_text(
+            "rules:\n"
+            "  - name: md-todo\n"
+            "    type: info\n"
+            "    description: todo\n"
+            "    pattern: TODO\n"
+            "    file_types: [md]\n"
+            "  - name: py-todo\n"
+            "    type: info\n"
+            "    description: todo\n"
+            "    pattern: TODO\n",
+            encoding="utf-8",
+        )
+        engine = FlextQualityRulesEngine(rules_path)
+        violations = engine.validate_content("# TODO\n", filename).value
+        tm.that(sorted(str(v["rule"]) for v in violations), eq=expected)
+
+    def test_binary_files_are_skipped_and_counted(
+        self, rules_path: Path, source_dir: Path
+    ) -> None:
+        (source_dir / "blob.py").write_bytes(b"print(\x00\x01")
+        engine = FlextQualityRulesEngine(rules_path)
+        tm.that(len(engine.validate(str(source_dir)).value), eq=1)
+        stats = engine.fetch_scan_stats()
+        tm.that(stats["files_scanned"], eq=1)
+        tm.that(stats["skipped_binary"], eq=1)
+
+    def test_oversized_and_minified_files_are_skipped(
+        self, rules_path: Path, source_dir: Path
+    ) -> None:
+        (source_dir / "big.py").write_text("print(1)\n" * 64, encoding="utf-8")
+        (source_dir / "min.py").write_text("print(1);" * 40, encoding="utf-8")
+        engine = FlextQualityRulesEngine(
+            rules_path, max_file_size_bytes=400, max_line_bytes=200
+        )
+        tm.that(len(engine.validate(str(source_dir)).value), eq=1)
+        stats = engine.fetch_scan_stats()
+        tm.that(stats["skipped_oversized"], eq=1)
+        tm.that(stats["skipped_minified"], eq=1)
+
+    # ---- Warm reuse -----------------------------------------------------
+
+    def test_edited_rules_file_is_reloaded(
+        self, rules_path: Path, source_dir: Path
+    ) -> None:
+        engine = FlextQualityRulesEngine(rules_path)
+        tm.that(len(engine.validate(str(source_dir)).value), eq=1)
+        rules_path.write_text(
+            "rules:\n"
+            "  - name: no-assign\n"
+            "    type: warning\n"
+            "    description: assignment\n"
+            '    pattern: "x = "\n',
+            encoding="utf-8",
+        )
+        stat = rules_path.stat()
+        os.utime(rules_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        violations = engine.validate(str(source_dir)).value
+        tm.that([v["line"] for v in violations], eq=[2])
+
+    def test_snapshot_scans_while_the_engine_reloads(
+        self, rules_path: Path, source_dir: Path, tmp_path: Path
+    ) -> None:
+        engine = FlextQualityRulesEngine(rules_path)
+        tm.that(engine.ensure_loaded().success, eq=True)
+        snapshot = engine.snapshot()
+        other = tmp_path / "other.yaml"
+        other.write_text(
+            "rules:\n"
+            "  - name: no-assign\n"
+            "    type: warning\n"
+            "    description: assignment\n"
+            '    pattern: "x = "\n',
+            encoding="utf-8",
+        )
+        tm.that(engine.load_rules(other).success, eq=True)
+        violations = snapshot.validate(str(source_dir)).value
+        tm.that([v["rule"] for v in violations], eq=["no-print"])
+        tm.that(snapshot.fetch_scan_stats()["files_scanned"], eq=1)
+        tm.that(engine.fetch_scan_stats(), eq={})
+
+    # ---- Result pages ---------------------------------------------------
+
+    def test_pages_walk_every_violation_once(self) -> None:
+        violations = [
+            {"rule": "a" if index % 2 else "b", "severity": "warning", "line": index}
+            for index in range(5)
+        ]
+        pages = FlextQualityViolationPages()
+        first = pages.first_page(violations, 2)
+        tm.that(
+            first["summary"],
+            eq={"total": 5, "by_rule": {"b": 3, "a": 2}, "by_severity": {"warning": 5}},
+        )
+        lines = [v["line"] for v in first["violations"]]
+        cursor = first["next_cursor"]
+        while cursor is not None:
+            page = pages.page(str(cursor), 2).value
+            lines.extend(v["line"] for v in page["violations"])
+            cursor = page["next_cursor"]
+        tm.that(lines, eq=[0, 1, 2, 3, 4])
+
+    def test_evicted_page_cursor_fails(self) -> None:
+        pages = FlextQualityViolationPages(max_handles=1)
+        cursor = pages.first_page([{"line": 1}, {"line": 2}], 1)["next_cursor"]
+        pages.first_page([{"line": 3}], 1)
+        tm.that(len(pages), eq=1)
+        tm.that(pages.page(str(cursor), 1).failure, eq=True)
+        tm.that(pages.page("not-a-cursor", 1).failure, eq=True)
+
+    def test_page_size_is_clamped(self) -> None:
+        limit = c.Quality.VIOLATION_PAGE_SIZE_MAX
+        violations = [{"line": index} for index in range(limit + 1)]
+        first = FlextQualityViolationPages().first_page(violations, limit * 10)
+        tm.that(len(first["violations"]), eq=limit)
+        tm.that(first["next_cursor"] is not None, eq=True)
+
+    # ---- Read-ahead pipeline --------------------------------------------
+
+    @pytest.mark.parametrize("read_ahead", [1, 3])
+    def test_read_ahead_matches_sequential_results(
+        self, rules_path: Path, source_dir: Path, read_ahead: int
+    ) -> None:
+        for index in range(5):
+            (source_dir / f"extra_{index}.py").write_text(
+                f"print({index})\n", encoding="utf-8"
+            )
+        sequential = FlextQualityRulesEngine(rules_path, read_ahead=0)
+        pipelined = FlextQualityRulesEngine(rules_path, read_ahead=read_ahead)
+        expected = sequential.validate(str(source_dir)).value
+        tm.that(list(pipelined.validate(str(source_dir)).value), eq=list(expected))
+
+    # ---- Parallel scanning ---------------------------------------------
+
+    @pytest.mark.parametrize(
+        "mode", [c.Quality.ExecutionMode.THREADS, c.Quality.ExecutionMode.PROCESSES]
+    )
+    def test_parallel_scan_matches_sequential_results(
+        self, rules_path: Path, source_dir: Path, mode: c.Quality.ExecutionMode
+    ) -> None:
+        for index in range(5):
+            (source_dir / f"extra_{index}.py").write_text(
+                f"print({index})\n", encoding="utf-8"
+            )
+        (source_dir / "blob.py").write_bytes(b"print(\x00")
+        sequential = FlextQualityRulesEngine(rules_path, workers=0)
+        parallel = FlextQualityRulesEngine(rules_path, workers=2, execution_mode=mode)
+        expected = sequential.validate(str(source_dir)).value
+        tm.that(list(parallel.validate(str(source_dir)).value), eq=list(expected))
+        tm.that(parallel.fetch_scan_stats(), eq=sequential.fetch_scan_stats())
+
+    # ---- Checkpointed runs ---------------------------------------------
+
+    def test_resumed_run_reports_each_violation_once(
+        self,
+        tmp_path: Path,
+        rules_path: Path,
+        source_dir: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        settings = FlextQualitySettings.fetch_global()
+        monkeypatch.setattr(settings.Quality, "runs_dir", str(tmp_path / "runs"))
+        monkeypatch.setattr(settings.Quality, "checkpoint_interval", 1)
+        for index in range(3):
+            (source_dir / f"extra_{index}.py").write_text(
+                f"print({index})\n", encoding="utf-8"
+            )
+        first = FlextQualityRulesEngine(rules_path)
+        interrupted = first.stream(str(source_dir), run_id="nightly").value
+        next(interrupted)
+        interrupted.close()
+        resumed = FlextQualityRulesEngine(rules_path).validate(
+            str(source_dir), resume="nightly"
+        )
+        tm.that(resumed.success, eq=True)
+        lines = sorted((str(v["file"]), v["line"]) for v in resumed.value)
+        tm.that(len(lines), eq=4)
+        tm.that(len(set(lines)), eq=4)
+
+    def test_interrupted_flush_is_not_replayed(
+        self,
+        tmp_path: Path,
+        rules_path: Path,
+        source_dir: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        settings = FlextQualitySettings.fetch_global()
+        monkeypatch.setattr(settings.Quality, "runs_dir", str(tmp_path / "runs"))
+        monkeypatch.setattr(settings.Quality, "checkpoint_interval", 1)
+        extra = source_dir / "extra.py"
+        extra.write_text("print(2)\n", encoding="utf-8")
+        first = FlextQualityRulesEngine(rules_path).stream(
+            str(source_dir), run_id="nightly"
+        )
+        interrupted = first.value
+        next(interrupted)
+        interrupted.close()
+        log = tmp_path / "runs" / "nightly" / c.Quality.CHECKPOINT_VIOLATIONS_FILE
+        stale = {"rule": "no-print", "file": str(extra), "line": 1}
+        with log.open("ab") as handle:
+            handle.write(json.dumps(stale).encode() + b"\n")
+        for _ in range(2):
+            resumed = FlextQualityRulesEngine(rules_path).validate(
+                str(source_dir), resume="nightly"
+            )
+            tm.that(resumed.success, eq=True)
+            tm.that(len(resumed.value), eq=2)
+
+    def test_resume_of_unknown_run_fails(
+        self, rules_path: Path, source_dir: Path
+    ) -> None:
+        result = FlextQualityRulesEngine(rules_path).validate(
+            str(source_dir), resume="missing-run-id"
+        )
+        tm.that(result.failure, eq=True)
+
+    # ---- Streaming writers ---------------------------------------------
+
+    def test_ndjson_writer_emits_one_line_per_violation(
+        self, rules_path: Path, source_dir: Path
+    ) -> None:
+        stream = FlextQualityRulesEngine(rules_path).stream(str(source_dir)).value
+        buffer = io.BytesIO()
+        tm.that(FlextQualityResultWriters.Ndjson(buffer).write(stream).value, eq=1)
+        lines = buffer.getvalue().decode("utf-8").splitlines()
+        tm.that(json.loads(lines[0])["rule"], eq="no-print")
+
+    def test_sarif_writer_emits_valid_log(
+        self, rules_path: Path, source_dir: Path
+    ) -> None:
+        engine = FlextQualityRulesEngine(rules_path)
+        stream = engine.stream(str(source_dir)).value
+        buffer = io.BytesIO()
+        writer = FlextQualityResultWriters.Sarif(buffer, engine.scan_root)
+        tm.that(writer.write(stream).value, eq=1)
+        log = json.loads(buffer.getvalue())
+        tm.that(log["version"], eq="2.1.0")
+        run = log["runs"][0]
+        tm.that(run["results"][0]["ruleId"], eq="no-print")
+        tm.that(run["results"][0]["level"], eq="warning")
+        tm.that(run["tool"]["driver"]["rules"][0]["id"], eq="no-print")
+        location = run["results"][0]["locations"][0]["physicalLocation"]
+        tm.that(
+            location["artifactLocation"],
+            eq={"uri": "module.py", "uriBaseId": "%SRCROOT%"},
+        )
+        tm.that(
+            run["originalUriBaseIds"]["%SRCROOT%"]["uri"],
+            eq=f"{source_dir.absolute().as_uri()}/",
+        )
+
+    def test_sarif_writer_uses_file_uris_without_a_root(self, tmp_path: Path) -> None:
+        buffer = io.BytesIO()
+        violation = {"rule": "r", "file": str(tmp_path / "a b.py"), "line": 1}
+        FlextQualityResultWriters.Sarif(buffer).write([violation])
+        run = json.loads(buffer.getvalue())["runs"][0]
+        location = run["results"][0]["locations"][0]["physicalLocation"]
+        uri = location["artifactLocation"]["uri"]
+        tm.that(uri, eq=(tmp_path / "a b.py").as_uri())
+        tm.that("originalUriBaseIds" in run, eq=False)
+
+
+__all__: list[str] = ["TestsFlextQualityRulesEngine"]
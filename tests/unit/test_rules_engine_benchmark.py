@@ -0,0 +1,74 @@
+"""Benchmarks comparing rules engine execution modes.
+
+Run with ``pytest -m performance --benchmark-enable``. Threads only beat
+processes on a free-threaded (``3.13t``) interpreter.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from flext_quality import FlextQualityRulesEngine, c
+from flext_tests import tm
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+
+@pytest.mark.performance
+class TestsFlextQualityRulesEngineBenchmark:
+    """Throughput of sequential, threaded and process-pool scanning."""
+
+    @pytest.fixture
+    def corpus(self, tmp_path: Path) -> tuple[Path, Path]:
+        rules_path = tmp_path / "rules.yaml"
+        rules_path.write_text(
+            "rules:\n"
+            "  - name: no-print\n"
+            "    type: warning\n"
+            "    description: print call\n"
+            '    pattern: "print\\\\("\n'
+            "  - name: no-any\n"
+            "    type: warning\n"
+            "    description: Any annotation\n"
+            '    pattern: ":\\\\s*Any\\\\b"\n',
+            encoding="utf-8",
+        )
+        src = tmp_path / "src"
+        src.mkdir()
+        body = "def f(x: int) -> int:\n    return x + 1\n" * 200 + "print(1)\n"
+        for index in range(64):
+            (src / f"module_{index}.py").write_text(body, encoding="utf-8")
+        return rules_path, src
+
+    @pytest.mark.parametrize(
+        ("workers", "mode"),
+        [
+            (0, c.Quality.ExecutionMode.AUTO),
+            (4, c.Quality.ExecutionMode.THREADS),
+            (4, c.Quality.ExecutionMode.PROCESSES),
+        ],
+    )
+    def test_scan_throughput(
+        self,
+        benchmark: BenchmarkFixture,
+        corpus: tuple[Path, Path],
+        workers: int,
+        mode: c.Quality.ExecutionMode,
+    ) -> None:
+        rules_path, src = corpus
+        engine = FlextQualityRulesEngine(
+            rules_path, workers=workers, execution_mode=mode
+        )
+        result = benchmark(engine.validate, str(src))
+        tm.that(len(result.value), eq=64)
+
+
+__all__: list[str] = ["TestsFlextQualityRulesEngineBenchmark"]